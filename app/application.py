@@ -0,0 +1,100 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from app.routers.auth import router as auth_router
+from app.routers.word_search import router as word_search_router
+from app.routers.search_bar import router as search_router
+from app.routers.bookmark import router as bookmark_router
+from app.routers.review import router as review_router
+from app.routers.users import router as users_router
+from app.routers.health import router as health_router
+from app.routers.metrics import router as metrics_router
+from app.routers.admin import router as admin_router
+from app.database.db import init_engine, dispose_engine
+from app.database.redis_client import init_redis, close_redis
+from app.utils.cpu_executor import start_executor, shutdown_executor
+from app.middleware.sql_metrics import SQLMetricsMiddleware
+from app.middleware.request_metrics import RequestMetricsMiddleware
+from app.middleware.profiling import ProfilingMiddleware
+from app.middleware.tracing import TracingMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.database.partitions import partition_maintenance_loop
+from app.utils.metrics import registry, metrics_flush_loop, write_snapshot
+from fastapi.middleware.cors import CORSMiddleware
+from config.settings import settings
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Redis 커넥션 풀 생성 (요청마다 연결을 새로 만들지 않도록 프로세스 단위로 공유)
+    init_redis()
+    # 비밀번호 해시 등 CPU 작업 실행기
+    start_executor()
+    # DB 커넥션 풀 생성 (Settings 기반, 프로세스 단위 공유)
+    engine = init_engine()
+    background_tasks = []
+    # search_history 월 파티션 생성/만료 파티션 삭제 (주기 실행, 멀티 워커에서는 한 워커만)
+    if settings.partition_maintenance_enabled:
+        background_tasks.append(asyncio.create_task(partition_maintenance_loop(engine)))
+    # 멀티 워커 지표 스냅샷 기록 (/metrics 에서 전체 워커 합산)
+    if settings.metrics_multiprocess_dir:
+        background_tasks.append(asyncio.create_task(
+            metrics_flush_loop(settings.metrics_multiprocess_dir, registry, settings.metrics_flush_interval)
+        ))
+    yield
+    for task in background_tasks:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    if settings.metrics_multiprocess_dir:
+        # 종료 직전 값까지 남김 (마스터가 archive 로 옮김)
+        write_snapshot(settings.metrics_multiprocess_dir, registry.collect())
+    await close_redis()
+    shutdown_executor()
+    await dispose_engine()
+
+
+def create_app() -> FastAPI:
+    """
+    앱 생성: 미들웨어 / 라우터 등록만 하고 DB / Redis / 실행기는 lifespan 에서 시작
+    """
+    # 기본 응답은 orjson 으로 인코딩 (response_model 이 있는 라우트는 pydantic 직렬화 결과를 바로 인코딩)
+    app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+    # 응답 압축 (가장 안쪽에 두어 지연시간 / 프로파일 계측에 압축 시간도 포함)
+    if settings.compression_enabled:
+        app.add_middleware(CompressionMiddleware)
+    # 요청별 SQL 실행 횟수 / DB 시간 계측
+    app.add_middleware(SQLMetricsMiddleware)
+    # 라우트별 지연시간 / 처리 중인 요청 수 (/metrics)
+    app.add_middleware(RequestMetricsMiddleware)
+    # 요청별 DB / Redis / 외부 API 구간 기록 (느린 요청 로그, Chrome trace 내보내기)
+    app.add_middleware(TracingMiddleware)
+    # 요청 프로파일링 (꺼져 있으면 미들웨어를 등록하지 않아 오버헤드 없음)
+    if settings.profiling_enabled:
+        app.add_middleware(ProfilingMiddleware)
+
+    # CORS 설정
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://127.0.0.1:5500"],  # 허용할 프론트엔드 URL
+        allow_credentials=True,
+        allow_methods=["*"],                     # 허용할 HTTP 메서드
+        allow_headers=["*"],                     # 허용할 HTTP 헤더
+    )
+
+    app.include_router(auth_router)
+    app.include_router(word_search_router)
+    app.include_router(search_router)
+    app.include_router(bookmark_router)
+    app.include_router(review_router)
+    app.include_router(users_router)
+    app.include_router(health_router)
+    app.include_router(metrics_router)
+    app.include_router(admin_router)
+
+    return app
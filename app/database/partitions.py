@@ -0,0 +1,188 @@
+import argparse
+import asyncio
+import logging
+import re
+from datetime import date, datetime
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# 월 단위 파티션 이름 규칙: search_history_y2024m11
+PARENT_TABLE = "search_history"
+PARTITION_NAME_PATTERN = re.compile(rf"^{PARENT_TABLE}_y(\d{{4}})m(\d{{2}})$")
+# 월 파티션이 없는 시각의 행을 받는 DEFAULT 파티션 (관리 작업이 밀려도 INSERT 가 실패하지 않도록)
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+
+
+def month_start(day: date) -> date:
+    """해당 월의 1일"""
+    return day.replace(day=1)
+
+
+def add_months(day: date, months: int) -> date:
+    """월 단위 더하기 (항상 1일 기준)"""
+    index = day.year * 12 + (day.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """월 파티션 테이블 이름"""
+    return f"{PARENT_TABLE}_y{month.year:04d}m{month.month:02d}"
+
+
+def retention_cutoff(today: date, retention_months: int) -> date:
+    """보관 기간 시작 월(1일) - 이보다 이전 월의 기록은 삭제 대상"""
+    return add_months(month_start(today), -retention_months)
+
+
+def parse_partition_month(name: str):
+    """파티션 이름에서 월(1일) 추출, 규칙에 맞지 않으면 None"""
+    match = PARTITION_NAME_PATTERN.match(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+async def list_partitions(conn: AsyncConnection) -> List[str]:
+    """search_history 에 연결된 파티션 이름 목록"""
+    result = await conn.execute(
+        text(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = :parent
+            """
+        ),
+        {"parent": PARENT_TABLE},
+    )
+    return [row[0] for row in result.all()]
+
+
+async def default_partition_has_rows(conn: AsyncConnection, start: date, end: date) -> bool:
+    """DEFAULT 파티션에 [start, end) 범위의 행이 있는지"""
+    result = await conn.execute(
+        text(
+            f'SELECT EXISTS (SELECT 1 FROM "{DEFAULT_PARTITION}" '
+            "WHERE created_at >= :start AND created_at < :end)"
+        ),
+        {"start": start, "end": end},
+    )
+    return bool(result.scalar())
+
+
+async def create_month_partition(conn: AsyncConnection, start: date, move_from_default: bool):
+    """
+    월 파티션 생성
+    DEFAULT 파티션에 이미 그 달의 행이 있으면 PARTITION OF 로 만들 수 없으므로,
+    일반 테이블로 만들어 행을 옮긴 뒤 ATTACH 합니다. (인덱스 / 제약조건은 ATTACH 시 부모 기준으로 생성)
+    """
+    name = partition_name(start)
+    end = add_months(start, 1)
+    bounds = f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    if not move_from_default:
+        await conn.execute(text(f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF {PARENT_TABLE} {bounds}'))
+        return
+    await conn.execute(text(f'CREATE TABLE "{name}" (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'))
+    await conn.execute(
+        text(
+            f'WITH moved AS (DELETE FROM "{DEFAULT_PARTITION}" '
+            "WHERE created_at >= :start AND created_at < :end RETURNING *) "
+            f'INSERT INTO "{name}" SELECT * FROM moved'
+        ),
+        {"start": start, "end": end},
+    )
+    await conn.execute(text(f'ALTER TABLE {PARENT_TABLE} ATTACH PARTITION "{name}" {bounds}'))
+    logger.warning("moved search_history rows for %s out of the default partition", start.isoformat())
+
+
+async def ensure_partitions(conn: AsyncConnection, months_ahead: int, today: date = None) -> List[str]:
+    """
+    DEFAULT 파티션과 이번 달부터 months_ahead 개월 뒤까지의 파티션을 미리 생성합니다.
+    """
+    current = month_start(today or datetime.utcnow().date())
+    created = []
+    existing = set(await list_partitions(conn))
+    has_default = DEFAULT_PARTITION in existing
+    if not has_default:
+        await conn.execute(text(f'CREATE TABLE IF NOT EXISTS "{DEFAULT_PARTITION}" PARTITION OF {PARENT_TABLE} DEFAULT'))
+        created.append(DEFAULT_PARTITION)
+    for offset in range(months_ahead + 1):
+        start = add_months(current, offset)
+        name = partition_name(start)
+        if name in existing:
+            continue
+        # 방금 만든 DEFAULT 파티션은 비어 있으므로 확인하지 않음
+        move = has_default and await default_partition_has_rows(conn, start, add_months(start, 1))
+        await create_month_partition(conn, start, move_from_default=move)
+        created.append(name)
+    return created
+
+
+async def drop_expired_partitions(conn: AsyncConnection, retention_months: int, today: date = None) -> List[str]:
+    """
+    보관 기간(retention_months)보다 오래된 월 파티션을 통째로 삭제합니다. (DELETE 로 인한 bloat 없음)
+    DEFAULT 파티션에 남은 오래된 행은 DELETE 로 정리합니다. (보통은 비어 있음)
+    """
+    cutoff = retention_cutoff(today or datetime.utcnow().date(), retention_months)
+    dropped = []
+    partitions = await list_partitions(conn)
+    for name in partitions:
+        month = parse_partition_month(name)
+        if month is not None and month < cutoff:
+            await conn.execute(text(f'DROP TABLE IF EXISTS "{name}"'))
+            dropped.append(name)
+    if DEFAULT_PARTITION in partitions:
+        await conn.execute(text(f'DELETE FROM "{DEFAULT_PARTITION}" WHERE created_at < :cutoff'), {"cutoff": cutoff})
+    return dropped
+
+
+async def run_partition_maintenance(
+    engine: AsyncEngine,
+    months_ahead: int = settings.search_history_partitions_ahead,
+    retention_months: int = settings.search_history_retention_months,
+):
+    """파티션 생성 + 만료 파티션 삭제를 한 번 실행"""
+    async with engine.begin() as conn:
+        created = await ensure_partitions(conn, months_ahead)
+        dropped = await drop_expired_partitions(conn, retention_months)
+    if created or dropped:
+        logger.info("search_history partitions created=%s dropped=%s", created, dropped)
+    return created, dropped
+
+
+async def partition_maintenance_loop(engine: AsyncEngine, interval: int = settings.partition_maintenance_interval):
+    """앱 실행 중 주기적으로 파티션을 관리하는 백그라운드 작업"""
+    while True:
+        try:
+            await run_partition_maintenance(engine)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("search_history partition maintenance failed")
+        await asyncio.sleep(interval)
+
+
+async def main(months_ahead: int, retention_months: int):
+    from app.database.db import create_engine
+
+    engine = create_engine()
+    created, dropped = await run_partition_maintenance(engine, months_ahead, retention_months)
+    print(f"생성된 파티션: {created or '없음'}")
+    print(f"삭제된 파티션: {dropped or '없음'}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    # 사용 예: python -m app.database.partitions --retention-months 6
+    parser = argparse.ArgumentParser(description="search_history 월 파티션 생성/정리")
+    parser.add_argument("--months-ahead", type=int, default=settings.search_history_partitions_ahead)
+    parser.add_argument("--retention-months", type=int, default=settings.search_history_retention_months)
+    args = parser.parse_args()
+    asyncio.run(main(args.months_ahead, args.retention_months))
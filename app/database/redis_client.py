@@ -0,0 +1,176 @@
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+
+import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
+
+from app.utils.metrics import REDIS_COMMAND_DURATION_SINGLE, REDIS_COMMAND_DURATION_PIPELINE
+from app.utils.tracing import record_span, SPAN_REDIS
+from config.settings import settings
+
+
+class RedisMetrics:
+    """
+    Redis 명령 호출 통계 (횟수 / 실패 / 누적 지연시간)
+    이벤트 루프 단일 스레드에서만 갱신하므로 락이 필요 없습니다.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.commands = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.pipelines = 0
+        self.pipelined_commands = 0
+
+    def observe(self, elapsed: float, failed: bool = False, pipelined: int = 0):
+        self.commands += 1
+        self.total_seconds += elapsed
+        if elapsed > self.max_seconds:
+            self.max_seconds = elapsed
+        if failed:
+            self.errors += 1
+        if pipelined:
+            self.pipelines += 1
+            self.pipelined_commands += pipelined
+
+    def snapshot(self) -> Dict:
+        return {
+            "commands": self.commands,
+            "errors": self.errors,
+            "avg_ms": round(self.total_seconds / self.commands * 1000, 3) if self.commands else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "pipelines": self.pipelines,
+            "pipelined_commands": self.pipelined_commands,
+        }
+
+
+metrics = RedisMetrics()
+
+
+class InstrumentedPipeline(Pipeline):
+    """execute() 1회(왕복 1회)를 명령 1건으로 집계하는 파이프라인"""
+
+    async def execute(self, raise_on_error: bool = True):
+        size = len(self.command_stack)
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = await super().execute(raise_on_error)
+            failed = False
+            return result
+        finally:
+            elapsed = time.perf_counter() - started
+            metrics.observe(elapsed, failed, pipelined=size or 1)
+            REDIS_COMMAND_DURATION_PIPELINE.observe(elapsed)
+            record_span(SPAN_REDIS, "PIPELINE", started, elapsed, commands=size, error=failed)
+
+
+class InstrumentedRedis(redis.Redis):
+    """명령 지연시간을 metrics 에 기록하는 Redis 클라이언트"""
+
+    async def execute_command(self, *args, **options):
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = await super().execute_command(*args, **options)
+            failed = False
+            return result
+        finally:
+            elapsed = time.perf_counter() - started
+            metrics.observe(elapsed, failed)
+            REDIS_COMMAND_DURATION_SINGLE.observe(elapsed)
+            record_span(SPAN_REDIS, str(args[0]), started, elapsed, error=failed)
+
+    def pipeline(self, transaction: bool = True, shard_hint=None) -> InstrumentedPipeline:
+        return InstrumentedPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
+
+# 프로세스 단위 커넥션 풀 / 클라이언트 (lifespan 에서 생성/종료)
+_pool: Optional[redis.ConnectionPool] = None
+_client: Optional[InstrumentedRedis] = None
+
+
+def init_redis() -> InstrumentedRedis:
+    """커넥션 풀과 공유 클라이언트 생성 (이미 있으면 그대로 반환)"""
+    global _pool, _client
+    if _client is None:
+        _pool = redis.ConnectionPool.from_url(
+            settings.redis_url,
+            max_connections=settings.redis_max_connections,
+            socket_timeout=settings.redis_socket_timeout,
+            socket_connect_timeout=settings.redis_socket_timeout,
+            health_check_interval=settings.redis_health_check_interval,
+            decode_responses=True,
+        )
+        _client = InstrumentedRedis(connection_pool=_pool)
+    return _client
+
+
+async def close_redis():
+    """공유 클라이언트와 커넥션 풀 종료"""
+    global _pool, _client
+    if _client is not None:
+        await _client.aclose()
+    if _pool is not None:
+        await _pool.disconnect()
+    _pool = None
+    _client = None
+
+
+def get_redis_client() -> InstrumentedRedis:
+    """공유 Redis 클라이언트 (lifespan 밖에서 호출되면 지연 생성)"""
+    return _client if _client is not None else init_redis()
+
+
+async def get_redis() -> InstrumentedRedis:
+    """FastAPI 의존성: 공유 Redis 클라이언트 주입"""
+    return get_redis_client()
+
+
+@asynccontextmanager
+async def pipeline(client: InstrumentedRedis = None, transaction: bool = False):
+    """
+    여러 명령을 한 번의 왕복으로 보내는 파이프라인.
+    블록 안에서 쌓은 명령은 빠져나올 때 execute 되지 않으므로 직접 await pipe.execute() 하세요.
+    """
+    async with (client or get_redis_client()).pipeline(transaction=transaction) as pipe:
+        yield pipe
+
+
+def pool_stats() -> Dict:
+    """커넥션 풀 사용 현황"""
+    if _pool is None:
+        return {"max_connections": settings.redis_max_connections, "created": 0, "in_use": 0, "idle": 0}
+    in_use = len(_pool._in_use_connections)
+    idle = len(_pool._available_connections)
+    return {
+        "max_connections": _pool.max_connections,
+        "created": in_use + idle,
+        "in_use": in_use,
+        "idle": idle,
+    }
+
+
+async def redis_health() -> Dict:
+    """PING 왕복 시간 + 풀 현황 + 명령 통계"""
+    client = get_redis_client()
+    started = time.perf_counter()
+    try:
+        await client.ping()
+        status, error = "ok", None
+    except redis.RedisError as e:
+        status, error = "error", str(e)
+    health = {
+        "status": status,
+        "ping_ms": round((time.perf_counter() - started) * 1000, 3),
+        "pool": pool_stats(),
+        "commands": metrics.snapshot(),
+    }
+    if error:
+        health["error"] = error
+    return health
@@ -0,0 +1,105 @@
+import logging
+import time
+from typing import Optional
+
+import jwt
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+from app.utils.auth_cache import decode_access_token
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# 복제 지연(초): 마지막으로 재생한 트랜잭션 이후 경과 시간 (WAL 을 모두 재생했으면 0)
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+# 세션 info 키: 커밋 대기 중인 쓰기 / 커밋된 쓰기
+PENDING_WRITE = "pending_write"
+COMMITTED_WRITE = "committed_write"
+
+
+def recent_write_key(user_id) -> str:
+    """사용자가 최근에 쓰기를 했음을 표시하는 키 (TTL 동안 읽기도 primary 로)"""
+    return f"recent_write:{user_id}"
+
+
+class ReplicaLagMonitor:
+    """
+    replica 지연을 check_interval 초마다 한 번만 조회해 캐시합니다.
+    조회 실패 또는 max_lag 초 이상 지연되면 replica 를 사용하지 않습니다.
+    """
+
+    def __init__(self, engine: AsyncEngine, max_lag: float, check_interval: float):
+        self.engine = engine
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.lag: Optional[float] = None
+        self.checked_at = 0.0
+
+    async def check(self) -> Optional[float]:
+        self.checked_at = time.monotonic()
+        try:
+            async with self.engine.connect() as conn:
+                self.lag = float((await conn.execute(REPLICA_LAG_QUERY)).scalar())
+        except Exception:
+            logger.exception("read replica lag check failed")
+            self.lag = None
+        return self.lag
+
+    async def is_usable(self) -> bool:
+        if time.monotonic() - self.checked_at >= self.check_interval:
+            await self.check()
+        return self.lag is not None and self.lag < self.max_lag
+
+
+def request_user_id(request) -> Optional[int]:
+    """Authorization 헤더의 토큰에서 사용자 ID 추출 (비로그인/잘못된 토큰은 None)"""
+    authorization = request.headers.get("authorization") or ""
+    if not authorization.startswith("Bearer "):
+        return None
+    try:
+        payload = decode_access_token(authorization[len("Bearer "):])
+    except jwt.InvalidTokenError:
+        return None
+    return payload.get("user_id", payload.get("sub"))
+
+
+async def mark_recent_write(redis_client, user_id):
+    """사용자의 쓰기 직후 read-your-writes 기간 동안 읽기를 primary 로 보냄"""
+    await redis_client.set(recent_write_key(user_id), 1, ex=settings.read_your_writes_seconds)
+
+
+async def has_recent_write(redis_client, user_id) -> bool:
+    return bool(await redis_client.exists(recent_write_key(user_id)))
+
+
+@event.listens_for(Session, "after_flush")
+def _flushed(session, flush_context):
+    session.info[PENDING_WRITE] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _executed(orm_execute_state):
+    # db.execute(insert/update/delete) 는 flush 를 거치지 않으므로 따로 표시
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[PENDING_WRITE] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _committed(session):
+    if session.info.pop(PENDING_WRITE, False):
+        session.info[COMMITTED_WRITE] = True
+
+
+@event.listens_for(Session, "after_rollback")
+def _rolled_back(session):
+    session.info.pop(PENDING_WRITE, None)
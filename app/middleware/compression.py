@@ -0,0 +1,169 @@
+import zlib
+from typing import Dict, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from config.settings import settings
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 설치되어 있지 않으면 gzip 만 사용
+    brotli = None
+
+# 서버 선호 순서 (클라이언트 q 값이 같으면 앞의 것을 선택)
+SUPPORTED_ENCODINGS: Tuple[str, ...] = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# 압축할 응답 Content-Type (이미 압축된 이미지 등은 제외)
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "application/xml", "application/problem+json")
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Accept-Encoding 헤더 → {인코딩: q 값} (예: "gzip;q=0.8, br" → {"gzip": 0.8, "br": 1.0})"""
+    encodings = {}
+    for part in header.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        encodings[name] = q
+    return encodings
+
+
+def choose_encoding(header: str, supported: Tuple[str, ...] = SUPPORTED_ENCODINGS) -> Optional[str]:
+    """클라이언트가 허용하는 인코딩 중 q 값이 가장 큰 것 (q=0 은 거부, 없으면 None)"""
+    accepted = parse_accept_encoding(header)
+    best, best_q = None, 0.0
+    for encoding in supported:
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class GzipCompressor:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # gzip 헤더 포함
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        # 스트리밍 응답: 지금까지 받은 데이터를 바로 내보냄 (스트림은 계속)
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliCompressor:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def create_compressor(encoding: str, gzip_level: int, brotli_quality: int):
+    if encoding == "br":
+        return BrotliCompressor(brotli_quality)
+    if encoding == "gzip":
+        return GzipCompressor(gzip_level)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def is_compressible(headers: Headers) -> bool:
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "").lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """
+    Accept-Encoding 협상으로 응답 본문 압축 (br / gzip)
+    - minimum_size 바이트보다 작은 응답, 압축 대상이 아닌 Content-Type, 이미 인코딩된 응답은 그대로 보냄
+    - 본문이 한 번에 오는 응답은 한 번에 압축하고 Content-Length 를 다시 계산
+    - 스트리밍 응답은 청크마다 flush 해서 압축 때문에 전송이 지연되지 않도록 함
+    """
+
+    def __init__(
+        self,
+        app,
+        minimum_size: int = settings.compression_minimum_size,
+        gzip_level: int = settings.compression_gzip_level,
+        brotli_quality: int = settings.compression_brotli_quality,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        compressor = None  # None: 아직 결정 전, False: 압축하지 않음
+
+        async def send_compressed(message):
+            nonlocal start_message, compressor
+            if message["type"] == "http.response.start":
+                # 첫 본문 크기를 보고 압축 여부를 정하므로 시작 메시지는 잠시 보류
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                headers = MutableHeaders(raw=list(start_message.get("headers", [])))
+                # 스트리밍 응답은 Content-Length 가 없으면 전체 크기를 알 수 없으므로 압축
+                size = int(headers.get("content-length", self.minimum_size)) if more_body else len(body)
+                if not is_compressible(headers) or size < self.minimum_size:
+                    compressor = False
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                compressor = create_compressor(encoding, self.gzip_level, self.brotli_quality)
+                headers["content-encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if more_body:
+                    del headers["content-length"]
+                else:
+                    body = compressor.compress(body) + compressor.finish()
+                    headers["content-length"] = str(len(body))
+                start_message["headers"] = headers.raw
+                await send(start_message)
+                if not more_body:
+                    await send({"type": "http.response.body", "body": body})
+                    return
+            elif compressor is False:
+                await send(message)
+                return
+
+            chunk = compressor.compress(body) + (compressor.flush() if more_body else compressor.finish())
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
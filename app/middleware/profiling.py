@@ -0,0 +1,302 @@
+import asyncio
+import cProfile
+import hmac
+import io
+import itertools
+import json
+import marshal
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from typing import Deque, Dict, List, Optional
+
+from config.settings import settings
+
+# 프로파일러 종류
+PROFILER_CPROFILE = "cprofile"  # 결정적 프로파일러: 함수별 호출 수 / 누적 시간 (pstats)
+PROFILER_SAMPLING = "sampling"  # 이벤트 루프 스레드 스택을 주기적으로 샘플링 (collapsed stacks, 오버헤드 적음)
+PROFILERS = (PROFILER_CPROFILE, PROFILER_SAMPLING)
+
+# 프로파일링을 요청하는 헤더 (값은 settings.admin_token), 결과 ID 를 돌려주는 응답 헤더
+PROFILE_HEADER = b"x-profile"
+PROFILE_ID_HEADER = b"x-profile-id"
+
+
+def is_admin_token(token: Optional[str]) -> bool:
+    """관리자 토큰 확인 (ADMIN_TOKEN 미설정 시 항상 거부)"""
+    if not settings.admin_token or not token:
+        return False
+    return hmac.compare_digest(token, settings.admin_token)
+
+
+class StackSampler:
+    """
+    대상 스레드의 호출 스택을 interval 초마다 기록하는 샘플링 프로파일러
+    결과는 flamegraph 도구가 읽는 collapsed stacks 형식 ("바깥;...;안쪽 횟수")
+    """
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def result(self) -> str:
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common())
+
+
+class DeterministicProfiler:
+    """cProfile 래퍼 (StackSampler 와 같은 start / stop / result 인터페이스)"""
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+
+    def result(self) -> bytes:
+        # pstats.Stats.dump_stats 와 같은 형식 (파일로 저장하면 pstats / snakeviz 로 열 수 있음)
+        self.profile.create_stats()
+        return marshal.dumps(self.profile.stats)
+
+
+def create_profiler(kind: str):
+    if kind == PROFILER_SAMPLING:
+        return StackSampler(threading.get_ident(), settings.profiling_sample_interval)
+    if kind == PROFILER_CPROFILE:
+        return DeterministicProfiler()
+    raise ValueError(f"Unknown profiler: {kind}")
+
+
+class ProfileResult:
+    __slots__ = ("id", "method", "path", "route", "status", "duration_ms", "created_at", "profiler", "data")
+
+    def __init__(self, id: str, method: str, path: str, profiler: str):
+        self.id = id
+        self.method = method
+        self.path = path
+        self.route: Optional[str] = None
+        self.status: Optional[int] = None
+        self.duration_ms = 0.0
+        self.created_at = time.time()
+        self.profiler = profiler
+        self.data = None  # cProfile: pstats 원본(marshal), sampling: collapsed stacks 문자열
+
+    def summary(self) -> Dict:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "status": self.status,
+            "duration_ms": self.duration_ms,
+            "created_at": self.created_at,
+            "profiler": self.profiler,
+        }
+
+    @classmethod
+    def from_summary(cls, summary: Dict, data) -> "ProfileResult":
+        result = cls(summary["id"], summary["method"], summary["path"], summary["profiler"])
+        result.route = summary["route"]
+        result.status = summary["status"]
+        result.duration_ms = summary["duration_ms"]
+        result.created_at = summary["created_at"]
+        result.data = data
+        return result
+
+    def render(self, sort: str = "cumulative", limit: int = 50) -> str:
+        """사람이 읽는 형식 (cProfile: pstats 표, sampling: collapsed stacks)"""
+        if self.profiler == PROFILER_SAMPLING:
+            return self.data
+        stream = io.StringIO()
+        stats = pstats.Stats(stream=stream)
+        stats.stats = marshal.loads(self.data)
+        stats.get_top_level_stats()
+        stats.sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+
+class ProfileStore:
+    """
+    최근 프로파일 결과 보관 (오래된 것부터 삭제, 단일 프로세스용 메모리 저장소)
+    ID 는 "<pid>-<번호>" 형식으로 워커가 여러 개여도 겹치지 않습니다.
+    """
+
+    def __init__(self, max_results: int):
+        self.max_results = max_results
+        self.results: Deque[ProfileResult] = deque(maxlen=max_results)
+        self._ids = itertools.count(1)
+
+    def new(self, method: str, path: str, profiler: str) -> ProfileResult:
+        return ProfileResult(f"{os.getpid()}-{next(self._ids)}", method, path, profiler)
+
+    def add(self, result: ProfileResult):
+        self.results.append(result)
+
+    def get(self, id: str) -> Optional[ProfileResult]:
+        return next((result for result in self.results if result.id == id), None)
+
+    def list(self) -> List[Dict]:
+        return [result.summary() for result in reversed(self.results)]
+
+    def clear(self):
+        self.results.clear()
+
+
+class FileProfileStore(ProfileStore):
+    """
+    결과를 디렉토리에 저장하는 저장소 (pre-fork 워커들이 공유 - 어느 워커가 조회 요청을 받아도 같은 결과)
+    결과마다 <id>.json (요약) + <id>.data (원본) 파일, 요약을 나중에 써서 목록에는 다 쓴 결과만 보입니다.
+    """
+
+    def __init__(self, max_results: int, directory: str):
+        super().__init__(max_results)
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, id: str, suffix: str) -> str:
+        return os.path.join(self.directory, f"{id}{suffix}")
+
+    def _summaries(self) -> List[Dict]:
+        summaries = []
+        for filename in os.listdir(self.directory):
+            if not filename.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.directory, filename)) as f:
+                    summaries.append(json.load(f))
+            except (OSError, ValueError):
+                continue  # 다른 워커가 방금 삭제
+        return sorted(summaries, key=lambda summary: summary["created_at"], reverse=True)
+
+    def _remove(self, id: str):
+        for suffix in (".json", ".data"):
+            try:
+                os.remove(self._path(id, suffix))
+            except FileNotFoundError:
+                pass
+
+    def add(self, result: ProfileResult):
+        data = result.data.encode() if isinstance(result.data, str) else result.data
+        with open(self._path(result.id, ".data"), "wb") as f:
+            f.write(data)
+        temp_path = self._path(result.id, ".json.tmp")
+        with open(temp_path, "w") as f:
+            json.dump(result.summary(), f)
+        os.replace(temp_path, self._path(result.id, ".json"))
+        for summary in self._summaries()[self.max_results:]:
+            self._remove(summary["id"])
+
+    def get(self, id: str) -> Optional[ProfileResult]:
+        try:
+            with open(self._path(id, ".json")) as f:
+                summary = json.load(f)
+            with open(self._path(id, ".data"), "rb") as f:
+                data = f.read()
+        except (OSError, ValueError):
+            return None
+        if summary["profiler"] == PROFILER_SAMPLING:
+            data = data.decode()
+        return ProfileResult.from_summary(summary, data)
+
+    def list(self) -> List[Dict]:
+        return self._summaries()
+
+    def clear(self):
+        for summary in self._summaries():
+            self._remove(summary["id"])
+
+
+def create_profile_store():
+    """PROFILING_STORE_DIR 이 있으면 파일 저장소 (serve.py 멀티 워커는 공유 디렉토리를 지정함)"""
+    if settings.profiling_store_dir:
+        return FileProfileStore(settings.profiling_max_results, settings.profiling_store_dir)
+    return ProfileStore(settings.profiling_max_results)
+
+
+profile_store = create_profile_store()
+
+
+class ProfilingMiddleware:
+    """
+    선택된 요청만 프로파일링하는 ASGI 미들웨어 (PROFILING_ENABLED=true 일 때만 등록)
+    - X-Profile 헤더 값이 ADMIN_TOKEN 과 같거나, PROFILING_SAMPLE_RATE 확률로 뽑힌 요청
+    - 결과는 profile_store 에 보관하고 응답 헤더 X-Profile-Id 로 ID 반환 (/admin/profiles/{id} 에서 조회)
+    - 저장소 접근(파일 I/O)은 asyncio.to_thread 로 이벤트 루프 밖에서 실행
+
+    프로파일러는 스레드 단위이므로 한 번에 한 요청만 프로파일링하며,
+    그동안 같은 이벤트 루프에서 실행된 다른 요청의 코드도 결과에 섞일 수 있습니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.active = False
+
+    def should_profile(self, scope) -> bool:
+        if self.active:
+            return False
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                return is_admin_token(value.decode("latin-1"))
+        rate = settings.profiling_sample_rate
+        return rate > 0 and random.random() < rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        self.active = True
+        profiler_kind = settings.profiling_profiler
+        result = profile_store.new(scope["method"], scope["path"], profiler_kind)
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                result.status = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((PROFILE_ID_HEADER, result.id.encode()))
+                message["headers"] = headers
+            await send(message)
+
+        profiler = create_profiler(profiler_kind)
+        started = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            profiler.stop()
+            try:
+                result.data = profiler.result()
+                result.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+                route = scope.get("route")
+                result.route = getattr(route, "path", None)
+                # 파일 저장소는 파일 쓰기 + 오래된 결과 정리를 하므로 이벤트 루프 밖에서 실행
+                await asyncio.to_thread(profile_store.add, result)
+            finally:
+                self.active = False
@@ -0,0 +1,37 @@
+import time
+
+from app.utils.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_FLIGHT
+
+
+class RequestMetricsMiddleware:
+    """
+    라우트별 HTTP 지연시간 히스토그램 / 처리 중인 요청 수를 기록하는 ASGI 미들웨어
+    라우트 라벨은 경로 템플릿(/bookmark/words/{id})을 사용해 라벨 조합 수가 라우트 수로 제한됩니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                scope["method"], getattr(route, "path", None) or "unmatched", status
+            ).observe(time.perf_counter() - started)
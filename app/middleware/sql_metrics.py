@@ -0,0 +1,187 @@
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# N+1 감지 시 동작
+N_PLUS_ONE_LOG = "log"
+N_PLUS_ONE_RAISE = "raise"
+
+
+class NPlusOneError(AssertionError):
+    """같은 SQL 이 한 요청에서 임계값 이상 반복 실행됨 (테스트에서 사용)"""
+
+
+class SQLStats:
+    """요청 하나(또는 track_queries 블록 하나)에서 실행된 SQL 통계"""
+
+    __slots__ = ("count", "total_seconds", "slowest_seconds", "slowest_statement", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, elapsed: float):
+        self.count += 1
+        self.total_seconds += elapsed
+        self.statements[statement] += 1
+        if elapsed > self.slowest_seconds:
+            self.slowest_seconds = elapsed
+            self.slowest_statement = statement
+
+    def repeated_statements(self, threshold: int) -> List[Tuple[str, int]]:
+        """threshold 번 이상 실행된 같은 SQL (N+1 후보)"""
+        if threshold <= 0:
+            return []
+        return [(statement, count) for statement, count in self.statements.most_common() if count >= threshold]
+
+
+class RouteSQLMetrics:
+    """라우트별 누적 SQL 통계 (운영 환경 지표)"""
+
+    def __init__(self):
+        self.routes: Dict[str, Dict] = {}
+
+    def observe(self, route: str, stats: SQLStats):
+        entry = self.routes.get(route)
+        if entry is None:
+            entry = self.routes[route] = {
+                "requests": 0, "queries": 0, "db_seconds": 0.0, "max_queries": 0, "n_plus_one": 0,
+            }
+        entry["requests"] += 1
+        entry["queries"] += stats.count
+        entry["db_seconds"] += stats.total_seconds
+        if stats.count > entry["max_queries"]:
+            entry["max_queries"] = stats.count
+        if stats.repeated_statements(settings.sql_n_plus_one_threshold):
+            entry["n_plus_one"] += 1
+
+    def snapshot(self) -> Dict:
+        return {
+            route: {
+                "requests": entry["requests"],
+                "avg_queries": round(entry["queries"] / entry["requests"], 2),
+                "max_queries": entry["max_queries"],
+                "avg_db_ms": round(entry["db_seconds"] / entry["requests"] * 1000, 3),
+                "n_plus_one": entry["n_plus_one"],
+            }
+            for route, entry in self.routes.items()
+        }
+
+    def reset(self):
+        self.routes.clear()
+
+
+route_metrics = RouteSQLMetrics()
+
+# 현재 요청의 SQL 통계 (요청 밖에서 실행된 SQL 은 집계하지 않음)
+_current_stats: ContextVar[Optional[SQLStats]] = ContextVar("sql_stats", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    started = conn.info.get("query_started_at")
+    if stats is not None and started:
+        stats.record(statement, time.perf_counter() - started.pop())
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    # 실패한 SQL 의 시작 시각도 꺼내야 다음 SQL 이 엉뚱한 시작 시각으로 측정되지 않음
+    connection = exception_context.connection
+    started = connection.info.get("query_started_at") if connection is not None else None
+    if _current_stats.get() is not None and started:
+        started.pop()
+
+
+@contextmanager
+def track_queries():
+    """
+    블록 안에서 실행된 SQL 통계 수집 (테스트에서 쿼리 수 / N+1 확인용)
+
+        with track_queries() as stats:
+            await get_bookmark_words(user_id, db)
+        assert not stats.repeated_statements(3)
+    """
+    stats = SQLStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def check_n_plus_one(stats: SQLStats, route: str, action: Optional[str] = None):
+    """반복 SQL 이 임계값을 넘으면 경고 로그 (action 기본값은 SQL_N_PLUS_ONE_ACTION, raise 면 예외)"""
+    repeated = stats.repeated_statements(settings.sql_n_plus_one_threshold)
+    if not repeated:
+        return
+    statement, count = repeated[0]
+    message = f"Possible N+1 on {route}: statement executed {count} times: {statement[:200]}"
+    if (action or settings.sql_n_plus_one_action) == N_PLUS_ONE_RAISE:
+        raise NPlusOneError(message)
+    logger.warning(message)
+
+
+def _route_path(scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class SQLMetricsMiddleware:
+    """
+    요청별 SQL 실행 횟수 / 총 DB 시간 / 가장 느린 SQL 을 수집하는 ASGI 미들웨어
+    - DEBUG 모드: 응답 헤더로 노출 (X-DB-Query-Count, X-DB-Time-Ms, X-DB-Slowest-Ms)
+    - 항상: 라우트별 누적 지표(route_metrics) 갱신 및 N+1 검사
+    - raise 모드: 응답 시작 전에 검사해 예외 (응답 시작 후 실행된 SQL 의 N+1 은 로그만 남김)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = SQLStats()
+        token = _current_stats.set(stats)
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start" and settings.sql_n_plus_one_action == N_PLUS_ONE_RAISE:
+                check_n_plus_one(stats, _route_path(scope))
+            if message["type"] == "http.response.start" and settings.debug:
+                headers = list(message.get("headers", []))
+                headers.append((b"x-db-query-count", str(stats.count).encode()))
+                headers.append((b"x-db-time-ms", f"{stats.total_seconds * 1000:.3f}".encode()))
+                headers.append((b"x-db-slowest-ms", f"{stats.slowest_seconds * 1000:.3f}".encode()))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            _current_stats.reset(token)
+            route_path = _route_path(scope)
+            route_metrics.observe(f"{scope['method']} {route_path}", stats)
+        # 응답은 이미 보냈으므로 모드와 관계없이 로그만
+        check_n_plus_one(stats, route_path, action=N_PLUS_ONE_LOG)
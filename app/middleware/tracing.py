@@ -0,0 +1,54 @@
+import asyncio
+import json
+import logging
+from typing import Optional
+
+from app.utils.tracing import ChromeTraceWriter, start_trace, end_trace
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TracingMiddleware:
+    """
+    요청마다 trace 를 시작해 DB / Redis / 외부 API span 을 모으는 ASGI 미들웨어
+    - TRACE_SLOW_REQUEST_MS 보다 오래 걸린 요청은 구간별 합계와 가장 느린 span 을 JSON 한 줄로 경고 로그
+    - TRACE_EXPORT_PATH 가 있으면 느린 요청(TRACE_EXPORT_ALL=true 면 전체)을 Chrome trace 형식으로 파일에 추가
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.writer: Optional[ChromeTraceWriter] = (
+            ChromeTraceWriter(settings.trace_export_path) if settings.trace_export_path else None
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace, token = start_trace(scope["method"], scope["path"], settings.trace_max_spans)
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            end_trace(token)
+            route = scope.get("route")
+            trace.finish(status, getattr(route, "path", None))
+            await self.report(trace)
+
+    async def report(self, trace):
+        budget = settings.trace_slow_request_ms
+        slow = budget > 0 and trace.duration * 1000 >= budget
+        if slow:
+            logger.warning(json.dumps(trace.summary(), ensure_ascii=False))
+        if self.writer is not None and (slow or settings.trace_export_all):
+            # 파일 쓰기로 이벤트 루프를 막지 않도록 스레드에서 실행
+            await asyncio.to_thread(self.writer.write, trace)
@@ -0,0 +1,61 @@
+import asyncio
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query
+from fastapi.responses import PlainTextResponse, Response
+
+from app.middleware.profiling import profile_store, is_admin_token, PROFILER_SAMPLING
+
+
+async def require_admin(x_admin_token: str = Header(None)):
+    """X-Admin-Token 헤더가 ADMIN_TOKEN 과 같아야 함"""
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+
+# 프로파일 ID ("<pid>-<번호>", 파일 이름으로도 쓰이므로 형식 제한)
+PROFILE_ID_PATTERN = "^[0-9]+-[0-9]+$"
+
+router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(require_admin)])
+
+@router.get("/profiles")
+async def list_profiles():
+    """
+    최근 프로파일링 결과 목록 (최신순)
+    """
+    return {"profiles": await asyncio.to_thread(profile_store.list)}
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+async def get_profile(
+    profile_id: str = Path(..., pattern=PROFILE_ID_PATTERN),
+    sort: str = Query("cumulative", pattern="^(cumulative|tottime|calls|ncalls)$"),  # cProfile 정렬 기준
+    limit: int = Query(50, ge=1, le=500),  # cProfile 출력 함수 수
+):
+    """
+    프로파일링 결과 (cProfile: pstats 표, sampling: collapsed stacks)
+    """
+    result = await asyncio.to_thread(profile_store.get, profile_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return result.render(sort=sort, limit=limit)
+
+@router.get("/profiles/{profile_id}/raw")
+async def download_profile(profile_id: str = Path(..., pattern=PROFILE_ID_PATTERN)):
+    """
+    원본 결과 다운로드 (cProfile: .prof 파일 - pstats / snakeviz, sampling: flamegraph.pl 입력)
+    """
+    result = await asyncio.to_thread(profile_store.get, profile_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    if result.profiler == PROFILER_SAMPLING:
+        filename, media_type, content = f"profile-{profile_id}.folded", "text/plain", result.data
+    else:
+        filename, media_type, content = f"profile-{profile_id}.prof", "application/octet-stream", result.data
+    return Response(content, media_type=media_type, headers={"Content-Disposition": f'attachment; filename="{filename}"'})
+
+@router.delete("/profiles")
+async def clear_profiles():
+    """
+    보관 중인 프로파일링 결과 삭제
+    """
+    await asyncio.to_thread(profile_store.clear)
+    return {"message": "Profiles cleared."}
@@ -1,21 +1,18 @@
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, Query, Header
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
 
 from app.services.kakao_oauth import KakaoOAuthService, get_kakao_service
-from app.services.user_service import create_user
+from app.services.user_service import upsert_kakao_user
 from app.database.db import get_db  # SQLAlchemy 세션 가져오는 함수
 from app.utils.utils import create_jwt_token, delete_access_token, create_refresh_token, \
     verify_refresh_token  # JWT 발급 함수
-from app.models.models import User
-import redis.asyncio as redis
+from app.utils.auth_cache import forget_token, cache_principal
+from app.services.token_service import store_refresh_token, rotate_refresh_token
+from app.database.redis_client import get_redis
 router = APIRouter()
 
-# Redis 비동기 클라이언트 설정
-async def get_redis_client():
-    client = redis.Redis(host="localhost", port=6379, db=0, decode_responses=True)
-    return client
-
 # 카카오 로그인 URL 반환
 @router.get("/auth/kakao")
 async def kakao_login(service: KakaoOAuthService = Depends(get_kakao_service)):
@@ -27,7 +24,8 @@ async def kakao_login(service: KakaoOAuthService = Depends(get_kakao_service)):
 async def kakao_callback(
     code: str = Query(...),
     service: KakaoOAuthService = Depends(get_kakao_service),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis_client=Depends(get_redis)
 ):
     try:
         # Access Token 발급
@@ -41,33 +39,21 @@ async def kakao_callback(
         email = user_info["kakao_account"]["email"]
         nickname = user_info.get("properties", {}).get("nickname")
 
-        # 데이터베이스에서 사용자 조회
-        query = select(User).filter(User.kakao_id == kakao_id)
-        result = await db.execute(query)
-        user = result.scalar_one_or_none()
-
-        if not user:
-            # 신규 사용자면 회원가입 처리
-            user_data = {
-                "kakao_id": kakao_id,
-                "email": email,
-                "nickname": nickname,
-                "password": None,
-            }
-            user = await create_user(db, user_data)
-
-        # 액세스 토큰 및 리프레시 토큰 발급
-        access_token = create_jwt_token({"user_id": user.id, "kakao_id": user.kakao_id})
-        refresh_token = create_refresh_token({"user_id": user.id, "kakao_id": user.kakao_id})
+        # 사용자 조회/생성을 upsert 한 번으로 처리 (신규 사용자면 회원가입)
+        user = await upsert_kakao_user(db, kakao_id, email, nickname)
 
-        # Redis 클라이언트 비동기적으로 가져오기
-        redis_client = await get_redis_client()
+        # 토큰 서명(동기)을 먼저 끝낸 뒤 Redis 쓰기만 동시에 진행
+        refresh_token = create_refresh_token({"user_id": user.id, "kakao_id": user.kakao_id})
+        access_token = create_jwt_token({"user_id": user.id, "kakao_id": user.kakao_id})
 
-        # 리프레시 토큰을 Redis에 저장 (만료 기간 설정)
-        await redis_client.setex(f"refresh_token:{user.id}", 3600 * 24 * 30, refresh_token)  # 30일 동안 유효
+        # 리프레시 토큰 저장(30일 동안 유효) + 갱신된 프로필로 사용자 캐시를 채워 첫 인증 요청의 DB 조회 생략
+        await asyncio.gather(
+            store_refresh_token(redis_client, user.id, refresh_token),
+            cache_principal(user, redis_client),
+        )
 
-        # 로그인 성공 메시지와 access_token 반환
-        return {"message": "Login successful", "access_token": access_token}
+        # 로그인 성공 메시지와 토큰 반환
+        return {"message": "Login successful", "access_token": access_token, "refresh_token": refresh_token}
 
 
     except KeyError as e:
@@ -80,25 +66,30 @@ async def kakao_callback(
 
 # 리프레시 토큰을 통해 새로운 액세스 토큰 발급
 @router.post("/auth/refresh")
-async def refresh_token(refresh_token: str):
-    """리프레시 토큰을 통해 액세스 토큰 재발급"""
+async def refresh_token(refresh_token: str, redis_client=Depends(get_redis)):
+    """리프레시 토큰을 통해 액세스 토큰 재발급 (리프레시 토큰도 새로 교체)"""
     try:
         # 리프레시 토큰 검증
         user_id = verify_refresh_token(refresh_token)
         if not user_id:
             raise HTTPException(status_code=401, detail="Invalid or expired refresh token")
 
-        # 새로운 액세스 토큰 발급
+        # 새 토큰 쌍 발급 후 Redis 에 저장된 토큰과 비교해 교체 (한 번 사용한 토큰은 재사용 불가)
+        new_refresh_token = create_refresh_token({"user_id": user_id})
+        if not await rotate_refresh_token(redis_client, user_id, refresh_token, new_refresh_token):
+            raise HTTPException(status_code=401, detail="Invalid or expired refresh token")
         access_token = create_jwt_token({"user_id": user_id})
 
-        return {"access_token": access_token, "token_type": "bearer"}
+        return {"access_token": access_token, "refresh_token": new_refresh_token, "token_type": "bearer"}
 
+    except HTTPException as e:
+        raise e  # 이 예외는 그대로 전달
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
 @router.post("/auth/logout")
-async def logout(authorization: str = Header(None)):
+async def logout(authorization: str = Header(None), redis_client=Depends(get_redis)):
     """로그아웃: Redis에서 엑세스 토큰 삭제"""
     if not authorization:
         raise HTTPException(status_code=401, detail="Not authenticated")
@@ -108,5 +99,6 @@ async def logout(authorization: str = Header(None)):
     if not token:
         raise HTTPException(status_code=401, detail="Invalid token format")
 
-    # 토큰 삭제
-    return delete_access_token(token)
\ No newline at end of file
+    # 토큰 삭제 (검증 캐시에서도 제거)
+    forget_token(token)
+    return await delete_access_token(token, redis_client)
\ No newline at end of file
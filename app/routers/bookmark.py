@@ -1,86 +1,114 @@
-from app.services.bookmark_service import get_bookmark_words_by_user, delete_word_by_id, update_bookmark_word
-from fastapi import APIRouter, Depends, HTTPException
+import uuid
+from typing import List, Optional
+
+from app.services.bookmark_service import get_bookmark_words, delete_word_by_id, update_bookmark_word, \
+    search_bookmark_words, delete_all_search_history, delete_single_search_history
+from app.services.recent_search_service import invalidate_recent_searches
+from app.services.review_service import schedule_new_word, review_queue_key
+from app.services.stats_service import reserve_bookmark_slot, reset_bookmark_stats
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from app.models.models import BookmarkWord, SearchHistory
-from app.database.db import get_db
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+from app.models.models import BookmarkWord, User
+from app.database.db import get_db, get_read_db
 from pydantic import BaseModel
 
 from dependencies import get_current_user
+from app.database.redis_client import get_redis
 
 
 # Pydantic 모델 정의
 class BookmarkWordCreate(BaseModel):
     word: str
-    definition: str = None  # 선택적 필드
-    example: str = None  # 선택적 필드
+    definition: Optional[str] = None  # 선택적 필드
+    example: Optional[str] = None  # 선택적 필드
 
-router = APIRouter()
+# 출력 데이터 모델
+class BookmarkWordResponse(BaseModel):
+    id: str
+    word: str
+    definition: Optional[str] = None
+    example: Optional[str] = None
+
+class BookmarkSearchRecord(BaseModel):
+    word_id: str
+    word: str
+    definition: Optional[str] = None
+    example: Optional[str] = None
+    score: float
+
+class BookmarkSearchResponse(BaseModel):
+    records: List[BookmarkSearchRecord]
+    page: int
+    page_size: int
 
-@router.post("/bookmark/words")
+router = APIRouter(prefix="/bookmark/words", tags=["Bookmark"])
+
+@router.post("")
 async def add_word_to_bookmark(
-    user_id: int,
-    word: str,
-    definition: str = None,
-    example: str = None,
-    db: AsyncSession = Depends(get_db)
+    body: BookmarkWordCreate,
+    db: AsyncSession = Depends(get_db),
+    redis_client=Depends(get_redis),
+    current_user: User = Depends(get_current_user),
 ):
+    """
+    내 단어장에 단어 추가
+    """
+    user_id = current_user.id
 
     # 데이터 삽입
     new_word = BookmarkWord(
-        user_id=user_id,  # user_id를 명시적으로 추가
-        word=word,
-        definition=definition,
-        example=example,
+        user_id=user_id,
+        word=body.word,
+        definition=body.definition,
+        example=body.example,
         bookmark=True,
         study_category="VOCABULARY"
     )
 
-    async with db.begin():
-        db.add(new_word)
-        await db.commit()
+    try:
+        async with db.begin():
+            # 최대 개수 확인 + 통계 증가 (같은 트랜잭션)
+            await reserve_bookmark_slot(db, user_id)
+            db.add(new_word)
+            await db.commit()
+    except IntegrityError:
+        # (user_id, word) 유니크 제약 위반 -> 트랜잭션 롤백으로 통계 증가도 취소됨
+        raise HTTPException(status_code=409, detail="Word already in bookmark")
+
+    # 새 단어는 바로 복습 큐에 등록
+    await schedule_new_word(redis_client, user_id, new_word)
 
     return {"message": "Word added to bookmark successfully."}
 
-router = APIRouter(prefix="/bookmark/words", tags=["Bookmark"])
-
-@router.get("/")
-async def get_bookmark_words(
-    db: AsyncSession = Depends(get_db),
+@router.get("/", response_model=List[BookmarkWordResponse])
+async def list_bookmark_words(
+    db: AsyncSession = Depends(get_read_db),
     current_user: dict = Depends(get_current_user)  # 사용자 인증 및 ID 획득
 ):
     """
     사용자 단어장 목록 조회
     """
-    return await get_bookmark_words_by_user(user_id=current_user["id"], db=db)
-
-@router.delete("/{id}")
-async def delete_bookmark_word(
-    id: int,
-    db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(get_current_user)  # 사용자 인증 정보
-):
-    """
-    사용자가 등록한 단어 삭제
-    """
-    try:
-        return await delete_word_by_id(word_id=id, user_id=current_user["id"], db=db)
-    except HTTPException as e:
-        raise e
-
-@router.get("/")
-async def list_bookmark_words(
-    db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(get_current_user)  # 사용자 인증 및 ID 획득
+    return await get_bookmark_words(user_id=current_user.id, db=db)
+
+@router.get("/search", response_model=BookmarkSearchResponse)
+async def search_bookmark_words_route(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어"),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
 ):
     """
-    사용자 단어장 목록 조회
+    내 단어장에서 단어/의미/예문 검색 (관련도 순)
     """
-    return await get_bookmark_words(user_id=current_user["id"], db=db)
+    records = await search_bookmark_words(user_id=current_user.id, q=q, page=page, page_size=page_size, db=db)
+    return {"records": records, "page": page, "page_size": page_size}
 
 @router.patch("/{id}")
 async def update_bookmark_word_route(
-    id: int,
+    id: uuid.UUID,
     update_data: dict,  # 수정할 데이터
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)  # 사용자 인증 정보
@@ -89,7 +117,7 @@ async def update_bookmark_word_route(
     사용자가 등록한 단어 정보 수정
     """
     try:
-        return await update_bookmark_word(word_id=id, user_id=current_user["id"], update_data=update_data, db=db)
+        return await update_bookmark_word(word_id=id, user_id=current_user.id, update_data=update_data, db=db)
     except HTTPException as e:
         raise e
 
@@ -97,19 +125,19 @@ async def update_bookmark_word_route(
 async def delete_all_bookmark_words(
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user),
+    redis_client=Depends(get_redis),
 ):
     """
     사용자 단어장에 등록된 모든 단어 삭제
     """
-    result = await db.execute(select(BookmarkWord).filter_by(user_id=current_user["id"]))
-    bookmark_words = result.scalars().all()
-
-    if not bookmark_words:
+    # 행마다 DELETE 하지 않고 한 문장으로 삭제
+    result = await db.execute(delete(BookmarkWord).where(BookmarkWord.user_id == current_user.id))
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="No bookmark words found")
 
-    for word in bookmark_words:
-        await db.delete(word)
+    await reset_bookmark_stats(db, current_user.id)
     await db.commit()
+    await redis_client.delete(review_queue_key(current_user.id))
 
     return {"message": "All bookmark words deleted successfully."}
 
@@ -118,39 +146,40 @@ async def delete_search_history(
     id: int,
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user),
+    redis_client=Depends(get_redis),
 ):
     """
     특정 검색 기록 삭제
     """
-    result = await db.execute(select(SearchHistory))
-    search_history = result.scalars().all()
-
-    if not search_history:
-        raise HTTPException(status_code=404, detail="Search history not found")
-
-    await db.delete(search_history)
-    await db.commit()
-
-    return {"message": f"Search history with ID {id} deleted successfully."}
+    response = await delete_single_search_history(history_id=id, user_id=current_user.id, db=db)
+    # 삭제한 검색어가 최근 검색어 목록에 남지 않도록
+    await invalidate_recent_searches(redis_client, current_user.id)
+    return response
 
 @router.delete("/remove", response_model=dict)
 async def delete_all_search_histories(
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user),
+    redis_client=Depends(get_redis),
 ):
     """
-    사용자 검색 기록 전체 삭제
+    사용자 검색 기록 전체 삭제 (로그 / 중복 제거 기록 모두)
     """
-    result = await db.execute(select(SearchHistory).filter_by(user_id=current_user["id"]))
-    search_histories = result.scalars().all()
-    print("????")
-    print(search_histories, "\n","\n","\n")
-
-    if not search_histories:
-        raise HTTPException(status_code=404, detail="No search histories found")
+    response = await delete_all_search_history(user_id=current_user.id, db=db)
+    await invalidate_recent_searches(redis_client, current_user.id)
+    return response
 
-    for history in search_histories:
-        await db.delete(history)
-    await db.commit()
-
-    return {"message": "All search histories deleted successfully."}
\ No newline at end of file
+# 경로 파라미터 라우트는 고정 경로(/bookmarks, /remove) 뒤에 등록 (먼저 등록하면 고정 경로를 가로챔)
+@router.delete("/{id}")
+async def delete_bookmark_word(
+    id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user)  # 사용자 인증 정보
+):
+    """
+    사용자가 등록한 단어 삭제
+    """
+    try:
+        return await delete_word_by_id(word_id=id, user_id=current_user.id, db=db)
+    except HTTPException as e:
+        raise e
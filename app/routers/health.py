@@ -0,0 +1,30 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.database.redis_client import redis_health
+from app.utils.cpu_executor import executor_stats
+from app.middleware.sql_metrics import route_metrics
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+@router.get("/redis")
+async def get_redis_health():
+    """
+    Redis 상태 확인 (PING 지연시간, 커넥션 풀 사용량, 명령 통계)
+    """
+    health = await redis_health()
+    return JSONResponse(status_code=200 if health["status"] == "ok" else 503, content=health)
+
+@router.get("/executor")
+async def get_executor_health():
+    """
+    CPU 작업 실행기 상태 (대기열 길이, 대기/실행 시간)
+    """
+    return executor_stats()
+
+@router.get("/sql")
+async def get_sql_metrics():
+    """
+    라우트별 SQL 통계 (평균/최대 쿼리 수, 평균 DB 시간, N+1 의심 요청 수)
+    """
+    return route_metrics.snapshot()
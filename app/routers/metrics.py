@@ -0,0 +1,53 @@
+import asyncio
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.database import db
+from app.database.redis_client import pool_stats
+from app.utils.cpu_executor import executor_stats
+from app.utils.metrics import registry, render_multiprocess
+from config.settings import settings
+
+router = APIRouter(tags=["Metrics"])
+
+
+def _db_pool_connections():
+    # 수집 시점의 DB 커넥션 풀 현황 (엔진별)
+    values = {}
+    for name, engine in (("primary", db.engine), ("replica", db.read_engine)):
+        if engine is None or not hasattr(engine.pool, "checkedout"):
+            continue
+        values[(name, "in_use")] = engine.pool.checkedout()
+        values[(name, "idle")] = engine.pool.checkedin()
+        values[(name, "overflow")] = max(0, engine.pool.overflow())
+    return values
+
+
+def _redis_pool_connections():
+    stats = pool_stats()
+    return {("in_use",): stats["in_use"], ("idle",): stats["idle"]}
+
+
+def _cpu_executor_queue():
+    stats = executor_stats()
+    return {("in_flight",): stats["in_flight"], ("queued",): stats["queue_depth"]}
+
+
+registry.gauge_callback("db_pool_connections", "DB pool connections by state", _db_pool_connections, ("engine", "state"))
+registry.gauge_callback("redis_pool_connections", "Redis pool connections by state", _redis_pool_connections, ("state",))
+registry.gauge_callback("cpu_executor_tasks", "CPU executor tasks by state", _cpu_executor_queue, ("state",))
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Prometheus 수집용 지표 (텍스트 형식)
+    멀티 워커(serve.py)에서는 어느 워커가 응답해도 전체 워커 합계를 반환
+    """
+    if settings.metrics_multiprocess_dir:
+        # 값 읽기는 이벤트 루프에서(락 없음), 파일 읽기/쓰기는 스레드에서
+        content = await asyncio.to_thread(render_multiprocess, settings.metrics_multiprocess_dir, registry.collect())
+    else:
+        content = registry.render()
+    return PlainTextResponse(content, media_type="text/plain; version=0.0.4; charset=utf-8")
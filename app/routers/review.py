@@ -0,0 +1,46 @@
+import uuid
+
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.db import get_db, get_read_db
+from app.models.models import User
+from app.services.review_service import get_due_words, grade_word
+from dependencies import get_current_user
+from app.database.redis_client import get_redis
+
+
+# 복습 채점 요청 모델 (0: 완전히 모름 ~ 5: 완벽히 기억)
+class ReviewGrade(BaseModel):
+    quality: int = Field(..., ge=0, le=5)
+
+router = APIRouter(prefix="/review", tags=["Review"])
+
+@router.get("/due")
+async def get_due_review_words(
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+    redis_client=Depends(get_redis),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    복습할 때가 된 단어 목록 조회
+    """
+    words = await get_due_words(user_id=current_user.id, limit=limit, redis_client=redis_client, db=db)
+    return {"words": words}
+
+@router.post("/{word_id}/grade")
+async def grade_review_word(
+    word_id: uuid.UUID,
+    grade: ReviewGrade,
+    db: AsyncSession = Depends(get_db),
+    redis_client=Depends(get_redis),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    복습 결과 채점 후 다음 복습 일정 갱신
+    """
+    return await grade_word(
+        word_id=word_id, user_id=current_user.id, quality=grade.quality, redis_client=redis_client, db=db
+    )
@@ -2,10 +2,9 @@ from fastapi import APIRouter, HTTPException, Body
 from pydantic import BaseModel, Field
 from typing import List
 
-router = APIRouter()
+from app.services.suggestion_service import get_suggestion_index
 
-# 과거 검색 기록 (예제 데이터를 위한 임시 저장소)
-search_history = ["apple", "application", "banana", "band", "cat", "dog"]
+router = APIRouter(prefix="/search")
 
 # 입력 데이터 모델
 class SuggestRequest(BaseModel):
@@ -16,12 +15,10 @@ class SuggestResponse(BaseModel):
     suggestions: List[str]
 
 # /search/suggest 엔드포인트 구현
-@router.post("suggest", response_model=SuggestResponse)
+@router.post("/suggest", response_model=SuggestResponse)
 async def suggest_words(request: SuggestRequest = Body(...)):
-    query = request.query.lower()
-
-    # 과거 검색 기록에서 자동 완성 제안
-    suggestions = [word for word in search_history if word.startswith(query)]
+    # 자동완성 인덱스에서 접두사로 시작하는 단어 제안
+    suggestions = get_suggestion_index().suggest(request.query)
 
     # 제안이 없으면 빈 배열 반환
     return {"suggestions": suggestions}
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.db import get_read_db
+from app.models.models import User
+from app.services.stats_service import get_user_stats
+from dependencies import get_current_user
+
+router = APIRouter(prefix="/users", tags=["Users"])
+
+@router.get("/me/stats")
+async def get_my_stats(
+    days: int = Query(7, ge=1, le=31),  # 검색 횟수 집계 기간 (일)
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    내 단어장 / 검색 통계 조회
+    """
+    return await get_user_stats(db, current_user.id, days=days)
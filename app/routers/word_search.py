@@ -1,18 +1,48 @@
 from fastapi import APIRouter, Query, HTTPException, Depends
 import httpx
-from app.database.db import get_db
+from app.database.db import get_db, get_read_db
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models.models import SearchHistory, User
-from sqlalchemy.future import select
+from app.models.models import User
+from app.services.user_service import record_search_history, fetch_search_history_page, search_history_summary_page_query, \
+    SEARCH_HISTORY_DEDUP
+from config.settings import settings
+from app.services.recent_search_service import push_recent_search, get_recent_searches, RECENT_SEARCH_LIMIT
+from app.services.trending_service import record_trending_search, get_trending_words, TRENDING_MAX_WINDOW_MINUTES
+from dependencies import get_current_user, get_optional_current_user
+from app.database.redis_client import get_redis
+from typing import List, Optional
+from pydantic import BaseModel
+from app.utils.metrics import DICTIONARY_UPSTREAM
 
-router = APIRouter()
+router = APIRouter(prefix="/search")
+
+# 출력 데이터 모델 (라우트마다 한 번 만든 pydantic 직렬화기로 인코딩되어 jsonable_encoder 를 거치지 않음)
+class DictionaryDefinition(BaseModel):
+    definition: str
+    example: Optional[str] = None
+    synonyms: List[str] = []
+    antonyms: List[str] = []
+
+class WordMeaning(BaseModel):
+    part_of_speech: str
+    definitions: List[DictionaryDefinition]
+
+class WordDetailsResponse(BaseModel):
+    word: str
+    definitions: List[WordMeaning]
+    pronunciation: str
+    synonyms: List[str]
+    example: str
 
 # dictionaryapi.dev를 호출하여 단어 정보 가져오기
 async def get_word_info(word: str):
-    url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
+    url = f"{settings.dictionary_api_url}/{word}"
 
     async with httpx.AsyncClient() as client:
-        response = await client.get(url)
+        async with DICTIONARY_UPSTREAM.timer(url=url) as timer:
+            response = await client.get(url)
+            if response.status_code >= 500:
+                timer.mark_error()
 
         if response.status_code == 404:  # 단어를 찾을 수 없는 경우
             raise HTTPException(status_code=404, detail="Word not found")
@@ -25,15 +55,12 @@ async def get_word_info(word: str):
 
         return response.json()
 
-# word 엔드포인트 구현
-@router.get("word")
-async def search_word(word: str = Query(..., description="The word to search for")):
-    word_info = await get_word_info(word)
-
-    # 필요한 정보 추출 (예: 정의, 발음, 품사, 유의어, 예문 등)
+# 사전 응답을 API 응답 형식으로 변환
+def shape_word_details(word: str, word_info: list) -> dict:
+    """사전 API 응답에서 필요한 정보 추출 (예: 정의, 발음, 품사, 유의어, 예문 등)"""
     definitions = word_info[0].get("meanings", [])
 
-    word_details = {
+    return {
         "word": word,
         "definitions": [
             {
@@ -52,22 +79,46 @@ async def search_word(word: str = Query(..., description="The word to search for
         .get("example", "No example available"),
     }
 
-    return word_details
+# word 엔드포인트 구현
+@router.get("/word", response_model=WordDetailsResponse)
+async def search_word(
+    word: str = Query(..., description="The word to search for"),
+    db: AsyncSession = Depends(get_db),
+    redis_client=Depends(get_redis),
+    current_user: Optional[User] = Depends(get_optional_current_user),
+):
+    word_info = await get_word_info(word)
+
+    # 인기 검색어 집계 (비로그인 검색 포함)
+    await record_trending_search(redis_client, word, current_user.id if current_user is not None else None)
+
+    # 로그인 사용자는 검색 기록 및 통계 저장 + 최근 검색어 갱신
+    if current_user is not None:
+        await record_search_history(db, current_user.id, word)
+        await push_recent_search(redis_client, current_user.id, word)
+
+    return shape_word_details(word, word_info)
 
-@router.get("history")
+@router.get("/history")
 async def get_search_history(
     page: int = Query(1, ge=1),  # 페이지는 1 이상이어야 함
     page_size: int = Query(10, ge=1, le=100),  # 페이지 크기는 1 이상 100 이하
-    db: AsyncSession = Depends(get_db),
+    order_by: str = Query("recent", pattern="^(recent|frequency)$"),  # 최신순 / 많이 검색한 순 (dedup 모드)
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
 ):
-
-    user_id = 1  # 인증 시스템과 연동 필요
-    offset = (page - 1) * page_size
-
-    # 검색 기록 쿼리
-    query = select(SearchHistory).filter(SearchHistory.user_id == user_id).offset(offset).limit(page_size)
-    result = await db.execute(query)
-    records = result.scalars().all()
+    """
+    내 검색 기록 페이지 조회 (인덱스 순서대로 정렬된 쿼리 사용)
+    """
+    # 중복 제거 모드: (user_id, word) 요약 테이블에서 조회
+    if settings.search_history_mode == SEARCH_HISTORY_DEDUP:
+        result = await db.execute(search_history_summary_page_query(current_user.id, page, page_size, order_by))
+        records = result.scalars().all()
+    elif order_by == "frequency":
+        raise HTTPException(status_code=400, detail="Frequency ordering requires dedup search history mode")
+    else:
+        # 로그 모드: (user_id, created_at) 최신순, 최근 월 파티션부터
+        records = await fetch_search_history_page(db, current_user.id, page, page_size)
 
     # 검색 기록이 없을 경우
     if not records:
@@ -76,4 +127,27 @@ async def get_search_history(
     # 검색 기록을 JSON 직렬화 가능하도록 변환
     return {
         "records": [record.to_dict() for record in records]
-    }
\ No newline at end of file
+    }
+
+@router.get("/history/recent")
+async def get_recent_search_history(
+    limit: int = Query(RECENT_SEARCH_LIMIT, ge=1, le=RECENT_SEARCH_LIMIT),
+    db: AsyncSession = Depends(get_read_db),
+    redis_client=Depends(get_redis),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    최근 검색어 조회 (Redis 에서 바로 응답, 없으면 DB 조회 후 채움)
+    """
+    return {"records": await get_recent_searches(current_user.id, redis_client, db, limit=limit)}
+
+@router.get("/trending")
+async def get_trending(
+    limit: int = Query(10, ge=1, le=50),
+    window_minutes: int = Query(60, ge=5, le=TRENDING_MAX_WINDOW_MINUTES),  # 집계 기간 (분)
+    redis_client=Depends(get_redis),
+):
+    """
+    최근 인기 검색어와 단어별 고유 검색자 수(추정치) 조회
+    """
+    return {"words": await get_trending_words(redis_client, limit=limit, window_minutes=window_minutes)}
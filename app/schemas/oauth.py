@@ -1,3 +1,5 @@
 from fastapi.security import OAuth2PasswordBearer
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
\ No newline at end of file
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+# 토큰이 없어도 되는 엔드포인트용 (없으면 None)
+oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="token", auto_error=False)
@@ -1,10 +1,26 @@
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
-from app.models.models import WordBookmark, BookmarkWord, SearchHistory
+from app.models.models import WordBookmark, BookmarkWord, SearchHistory, SearchHistorySummary
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import List
-from sqlalchemy import delete
+from typing import List, Dict
+from sqlalchemy import delete, func, or_
+import uuid
+from app.services.stats_service import release_bookmark_slots, reset_bookmark_stats, change_bookmark_category, \
+    to_study_category
+
+# 조회 쿼리 (서비스 함수와 실행 계획 테스트에서 함께 사용)
+def bookmark_words_by_user_query(user_id: int):
+    """사용자 단어장 전체 조회 쿼리"""
+    return select(BookmarkWord).filter_by(user_id=user_id)
+
+def bookmark_word_query(word_id: uuid.UUID, user_id: int):
+    """사용자 단어 단건 조회 쿼리"""
+    return select(BookmarkWord).filter_by(word_id=word_id, user_id=user_id)
+
+def search_history_entry_query(history_id: int, user_id: int):
+    """사용자 검색 기록 단건 조회 쿼리"""
+    return select(SearchHistory).filter_by(id=history_id, user_id=user_id)
 
 def add_word_to_bookmark(user_id: int, word: str, meaning: str, example: str, db: Session):
     # 사용자가 등록한 단어가 100개를 초과했는지 확인
@@ -33,19 +49,20 @@ def add_word_to_bookmark(user_id: int, word: str, meaning: str, example: str, db
     return new_word
 
 
-async def delete_word_by_id(word_id: int, user_id: int, db: AsyncSession):
+async def delete_word_by_id(word_id: uuid.UUID, user_id: int, db: AsyncSession):
     """
     주어진 ID의 단어를 삭제합니다.
     """
     # 단어 조회
-    result = await db.execute(select(BookmarkWord).filter_by(id=word_id, user_id=user_id))
+    result = await db.execute(bookmark_word_query(word_id, user_id))
     word = result.scalars().first()
 
     if not word:
         raise HTTPException(status_code=404, detail="Word not found or does not belong to the user.")
 
-    # 단어 삭제
+    # 단어 삭제 (통계도 같은 트랜잭션에서 감소)
     await db.delete(word)
+    await release_bookmark_slots(db, user_id, [word.study_category])
     await db.commit()
     return {"message": "Word deleted successfully."}
 
@@ -53,64 +70,112 @@ async def get_bookmark_words_by_user(user_id: int, db: AsyncSession) -> List[Boo
     """
     주어진 사용자 ID에 해당하는 단어장 목록을 조회합니다.
     """
-    result = await db.execute(select(BookmarkWord).filter_by(user_id=user_id))
+    result = await db.execute(bookmark_words_by_user_query(user_id))
     words = result.scalars().all()
     return words
 
+def serialize_bookmark_words(words: List[BookmarkWord]) -> List[Dict]:
+    """단어 목록을 응답 형식으로 변환 (DB 접근 없음, 마이크로 벤치마크 대상)"""
+    return [word.to_dict() for word in words]
+
 async def get_bookmark_words(user_id: int, db: AsyncSession):
     """
     사용자별 단어장 목록 조회
     """
-    result = await db.execute(select(BookmarkWord).filter_by(user_id=user_id))
-    words = result.scalars().all()
+    result = await db.execute(bookmark_words_by_user_query(user_id))
+    return serialize_bookmark_words(result.scalars().all())
+
+def _escape_like(value: str) -> str:
+    """LIKE 패턴 특수문자 이스케이프"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def search_bookmark_words_query(user_id: int, q: str, page: int, page_size: int):
+    """
+    tsvector(GIN) 전문 검색과 pg_trgm 부분 문자열/유사도 검색을 합친 관련도 순 검색 쿼리
+    예문은 전문 검색(search_vector)으로만 찾고, 부분 문자열 검색은 trigram 인덱스가 있는 단어/의미에만 적용
+    """
+    ts_query = func.websearch_to_tsquery("english", q)
+    pattern = f"%{_escape_like(q)}%"
+    score = (
+        func.ts_rank(BookmarkWord.search_vector, ts_query)
+        + func.similarity(BookmarkWord.word, q)
+    ).label("score")
+
+    return (
+        select(BookmarkWord, score)
+        .where(
+            BookmarkWord.user_id == user_id,
+            or_(
+                BookmarkWord.search_vector.op("@@")(ts_query),
+                BookmarkWord.word.op("%")(q),
+                BookmarkWord.word.ilike(pattern, escape="\\"),
+                BookmarkWord.definition.ilike(pattern, escape="\\"),
+            ),
+        )
+        .order_by(score.desc(), BookmarkWord.word)
+        .limit(page_size)
+        .offset((page - 1) * page_size)
+    )
+
+async def search_bookmark_words(user_id: int, q: str, page: int, page_size: int, db: AsyncSession) -> List[Dict]:
+    """
+    사용자 단어장에서 단어/의미/예문을 검색합니다.
+    """
+    result = await db.execute(search_bookmark_words_query(user_id, q, page, page_size))
     return [
         {
-            "id": word.id,
+            "word_id": str(word.word_id),
             "word": word.word,
             "definition": word.definition,
             "example": word.example,
+            "score": round(score, 4),
         }
-        for word in words
+        for word, score in result.all()
     ]
 
-async def update_bookmark_word(word_id: int, user_id: int, update_data: dict, db: AsyncSession):
+async def update_bookmark_word(word_id: uuid.UUID, user_id: int, update_data: dict, db: AsyncSession):
     """
     단어장에 등록된 단어를 수정합니다.
     """
     # 해당 단어 조회
-    result = await db.execute(select(BookmarkWord).filter_by(id=word_id, user_id=user_id))
+    result = await db.execute(bookmark_word_query(word_id, user_id))
     word = result.scalars().first()
 
     if not word:
         raise HTTPException(status_code=404, detail="Word not found or does not belong to the user.")
 
+    # 학습 종류는 변경 전에 검증 (알 수 없는 값이면 단어도 통계도 바꾸지 않음)
+    if "study_category" in update_data:
+        try:
+            category = to_study_category(update_data["study_category"])
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid study_category.")
+        update_data = {**update_data, "study_category": category}
+
     # 단어 정보 업데이트
+    old_category = word.study_category
     for key, value in update_data.items():
         if hasattr(word, key):
             setattr(word, key, value)
 
+    # 학습 종류가 바뀌면 통계 반영
+    if "study_category" in update_data:
+        await change_bookmark_category(db, user_id, old_category, word.study_category)
+
     await db.commit()
     await db.refresh(word)
-    return {
-        "id": word.id,
-        "word": word.word,
-        "definition": word.definition,
-        "example": word.example,
-    }
+    return word.to_dict()
 
 async def delete_all_bookmark_words(user_id: int, db: AsyncSession):
     """
     사용자 단어장에 등록된 모든 단어 삭제
     """
-    # 단어가 존재하는지 확인
-    result = await db.execute(select(BookmarkWord).filter_by(user_id=user_id))
-    words = result.scalars().all()
-
-    if not words:
+    # 모든 단어를 한 문장으로 삭제 (삭제된 행이 없으면 단어가 없는 사용자)
+    result = await db.execute(delete(BookmarkWord).where(BookmarkWord.user_id == user_id))
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="No words found for this user.")
 
-    # 모든 단어 삭제
-    await db.execute(delete(BookmarkWord).where(BookmarkWord.user_id == user_id))
+    await reset_bookmark_stats(db, user_id)
     await db.commit()
 
     return {"message": "All bookmark words deleted successfully."}
@@ -120,7 +185,7 @@ async def delete_single_search_history(history_id: int, user_id: int, db: AsyncS
     특정 검색 기록 삭제
     """
     # 검색 기록 확인
-    result = await db.execute(select(SearchHistory).filter_by(id=history_id, user_id=user_id))
+    result = await db.execute(search_history_entry_query(history_id, user_id))
     history = result.scalars().first()
 
     if not history:
@@ -135,7 +200,11 @@ async def delete_all_search_history(user_id: int, db: AsyncSession):
     """
     사용자 검색 기록 전체 삭제
     """
-    # 전체 삭제
-    await db.execute(delete(SearchHistory).where(SearchHistory.user_id == user_id))
+    # 전체 삭제 (중복 제거 모드의 요약 기록 포함, 모드를 바꾼 경우를 위해 항상 두 테이블 모두)
+    result = await db.execute(delete(SearchHistory).where(SearchHistory.user_id == user_id))
+    summary_result = await db.execute(delete(SearchHistorySummary).where(SearchHistorySummary.user_id == user_id))
+    if result.rowcount == 0 and summary_result.rowcount == 0:
+        raise HTTPException(status_code=404, detail="No search histories found")
+
     await db.commit()
-    return {"message": "All search history deleted successfully."}
\ No newline at end of file
+    return {"message": "All search histories deleted successfully."}
\ No newline at end of file
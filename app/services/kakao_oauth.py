@@ -1,11 +1,11 @@
 import httpx
-import os
-from dotenv import load_dotenv
 
-load_dotenv()
+from app.utils.metrics import KAKAO_UPSTREAM
+from config.settings import settings
 
-KAKAO_TOKEN_URL = "https://kauth.kakao.com/oauth/token"
-KAKAO_USER_URL = "https://kapi.kakao.com/v2/user/me"
+KAKAO_AUTHORIZE_URL = f"{settings.kakao_auth_url}/oauth/authorize"
+KAKAO_TOKEN_URL = f"{settings.kakao_auth_url}/oauth/token"
+KAKAO_USER_URL = f"{settings.kakao_api_url}/v2/user/me"
 
 
 class KakaoOAuthService:
@@ -15,23 +15,24 @@ class KakaoOAuthService:
 
     def get_login_url(self) -> str:
         """카카오 로그인 URL 생성"""
-        url = f"https://kauth.kakao.com/oauth/authorize?client_id={self.client_id}&redirect_uri={self.redirect_uri}&response_type=code"
+        url = f"{KAKAO_AUTHORIZE_URL}?client_id={self.client_id}&redirect_uri={self.redirect_uri}&response_type=code"
         return url
 
     async def get_access_token(self, code: str) -> str:
         async with httpx.AsyncClient() as client:
             try:
                 # Kakao에서 access token 요청
-                response = await client.post(
-                    KAKAO_TOKEN_URL,
-                    data={
-                        "grant_type": "authorization_code",
-                        "client_id": self.client_id,
-                        "redirect_uri": self.redirect_uri,
-                        "code": code,
-                    },
-                )
-                response.raise_for_status()  # HTTP 상태 코드 확인
+                async with KAKAO_UPSTREAM.timer(url=KAKAO_TOKEN_URL):
+                    response = await client.post(
+                        KAKAO_TOKEN_URL,
+                        data={
+                            "grant_type": "authorization_code",
+                            "client_id": self.client_id,
+                            "redirect_uri": self.redirect_uri,
+                            "code": code,
+                        },
+                    )
+                    response.raise_for_status()  # HTTP 상태 코드 확인
 
                 # 응답에서 access_token 추출
                 access_token = response.json().get("access_token")
@@ -54,11 +55,12 @@ class KakaoOAuthService:
         async with httpx.AsyncClient() as client:
             try:
                 # Kakao에서 사용자 정보 요청
-                response = await client.get(
-                    KAKAO_USER_URL,
-                    headers={"Authorization": f"Bearer {access_token}"},
-                )
-                response.raise_for_status()  # HTTP 상태 코드 확인
+                async with KAKAO_UPSTREAM.timer(url=KAKAO_USER_URL):
+                    response = await client.get(
+                        KAKAO_USER_URL,
+                        headers={"Authorization": f"Bearer {access_token}"},
+                    )
+                    response.raise_for_status()  # HTTP 상태 코드 확인
 
                 # 사용자 정보 반환
                 return response.json()
@@ -71,11 +73,11 @@ class KakaoOAuthService:
                 raise e
 
 
-# 환경 변수에서 Kakao client_id와 redirect_uri를 가져오는 방법
+# 설정(KAKAO_CLIENT_ID / KAKAO_REDIRECT_URI)에서 Kakao client_id와 redirect_uri를 가져오는 방법
 
 def get_kakao_service() -> KakaoOAuthService:
-    client_id = os.getenv("KAKAO_CLIENT_ID")
-    redirect_uri = os.getenv("KAKAO_REDIRECT_URI")
+    client_id = settings.kakao_client_id
+    redirect_uri = settings.kakao_redirect_uri
     if not client_id or not redirect_uri:
         raise ValueError("Kakao client ID or redirect URI is not set.")
 
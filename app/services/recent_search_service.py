@@ -0,0 +1,88 @@
+import json
+from datetime import datetime
+from typing import List, Dict
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.user_service import fetch_search_history_page, search_history_summary_page_query, SEARCH_HISTORY_DEDUP
+from app.utils.metrics import CACHE_REQUESTS
+from config.settings import settings
+
+# 사용자별로 Redis 에 보관하는 최근 검색어 개수 / 만료 시간
+RECENT_SEARCH_LIMIT = 10
+RECENT_SEARCH_TTL = 60 * 60 * 24 * 30  # 30일
+
+RECENT_SEARCH_HIT = CACHE_REQUESTS.labels("recent_searches", "hit")
+RECENT_SEARCH_MISS = CACHE_REQUESTS.labels("recent_searches", "miss")
+
+# 캐시 미스 backfill: 리스트가 아직 없을 때만 채움 (DB 조회 중에 다른 요청이 채운 리스트를 덮어쓰지 않음)
+# ARGV[1] = 만료 시간, ARGV[2..] = 최신순 항목 / 반환값: 1 = 채움, 0 = 이미 있음
+BACKFILL_RECENT_SEARCHES_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+redis.call('RPUSH', KEYS[1], unpack(ARGV, 2))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
+_backfill_script = None
+
+
+def recent_searches_key(user_id: int) -> str:
+    """사용자별 최근 검색어 리스트 키"""
+    return f"recent_searches:{user_id}"
+
+
+def _encode(word: str, searched_at: datetime) -> str:
+    return json.dumps({"word": word, "searched_at": searched_at.isoformat()})
+
+
+async def push_recent_search(redis_client, user_id: int, word: str, searched_at: datetime = None):
+    """
+    최근 검색어 리스트 앞에 추가하고 RECENT_SEARCH_LIMIT 개로 자릅니다. (파이프라인 1회 왕복)
+    리스트가 없으면(만료 / Redis 초기화) 추가하지 않습니다. 새 검색어 하나만 있는 리스트가 생기면
+    이전 기록이 채워지지 않은 채 캐시 적중으로 처리되므로, 다음 조회에서 DB 기준으로 다시 채우도록 둡니다.
+    """
+    key = recent_searches_key(user_id)
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.lpushx(key, _encode(word, searched_at or datetime.utcnow()))
+        pipe.ltrim(key, 0, RECENT_SEARCH_LIMIT - 1)
+        pipe.expire(key, RECENT_SEARCH_TTL)
+        await pipe.execute()
+
+
+async def invalidate_recent_searches(redis_client, user_id: int):
+    """검색 기록 삭제 후 호출: 리스트를 지워 다음 조회에서 DB 기준으로 다시 채우게 함"""
+    await redis_client.delete(recent_searches_key(user_id))
+
+
+async def get_recent_searches(user_id: int, redis_client, db: AsyncSession, limit: int = RECENT_SEARCH_LIMIT) -> List[Dict]:
+    """
+    Redis 에서 최근 검색어를 조회합니다.
+    Redis 에 없으면 Postgres 에서 조회한 뒤 Redis 를 다시 채웁니다.
+    (리스트는 이 backfill 에서만 만들어지므로, 있으면 항상 DB 의 최근 기록부터 이어진 완전한 목록)
+    """
+    key = recent_searches_key(user_id)
+    entries = await redis_client.lrange(key, 0, limit - 1)
+    if entries:
+        RECENT_SEARCH_HIT.inc()
+        return [json.loads(entry) for entry in entries]
+    RECENT_SEARCH_MISS.inc()
+
+    # 캐시 미스: DB 에서 최신순 조회 후 backfill
+    if settings.search_history_mode == SEARCH_HISTORY_DEDUP:
+        result = await db.execute(search_history_summary_page_query(user_id, 1, RECENT_SEARCH_LIMIT))
+        encoded = [_encode(record.word, record.last_searched_at) for record in result.scalars().all()]
+    else:
+        records = await fetch_search_history_page(db, user_id, 1, RECENT_SEARCH_LIMIT)
+        encoded = [_encode(record.word, record.created_at) for record in records]
+    if not encoded:
+        return []
+
+    global _backfill_script
+    if _backfill_script is None:
+        _backfill_script = redis_client.register_script(BACKFILL_RECENT_SEARCHES_SCRIPT)
+    await _backfill_script(keys=[key], args=[RECENT_SEARCH_TTL, *encoded], client=redis_client)
+
+    return [json.loads(entry) for entry in encoded[:limit]]
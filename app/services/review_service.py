@@ -0,0 +1,153 @@
+from datetime import datetime, timedelta
+from typing import List, Dict, Tuple
+import uuid
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.models.models import BookmarkWord
+
+# SM-2 기본값
+MIN_EASE_FACTOR = 1.3
+PASSING_QUALITY = 3
+
+
+def review_queue_key(user_id: int) -> str:
+    """사용자별 복습 큐(Redis sorted set) 키"""
+    return f"review_queue:{user_id}"
+
+
+def calculate_sm2(quality: int, repetitions: int, interval_days: int, ease_factor: float) -> Tuple[int, int, float]:
+    """
+    SM-2 알고리즘으로 다음 복습 간격을 계산합니다.
+    quality 는 0~5 점수이며 (repetitions, interval_days, ease_factor) 를 반환합니다.
+    """
+    if not 0 <= quality <= 5:
+        raise ValueError("quality must be between 0 and 5")
+
+    if quality < PASSING_QUALITY:
+        # 틀리면 처음부터 다시 학습
+        repetitions = 0
+        interval_days = 1
+    else:
+        if repetitions == 0:
+            interval_days = 1
+        elif repetitions == 1:
+            interval_days = 6
+        else:
+            interval_days = round(interval_days * ease_factor)
+        repetitions += 1
+
+    ease_factor = ease_factor + (0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    ease_factor = max(MIN_EASE_FACTOR, ease_factor)
+    return repetitions, interval_days, ease_factor
+
+
+async def schedule_new_word(redis_client, user_id: int, word: BookmarkWord):
+    """새로 등록된 단어를 복습 큐에 추가 (즉시 복습 대상)"""
+    next_review_at = word.next_review_at or datetime.utcnow()
+    await redis_client.zadd(review_queue_key(user_id), {str(word.word_id): next_review_at.timestamp()})
+
+
+async def rebuild_review_queue(redis_client, user_id: int, db: AsyncSession):
+    """Redis 큐가 비어 있을 때 DB 기준으로 복습 큐를 다시 채웁니다."""
+    result = await db.execute(
+        select(BookmarkWord.word_id, BookmarkWord.next_review_at).filter_by(user_id=user_id)
+    )
+    mapping = {str(word_id): next_review_at.timestamp() for word_id, next_review_at in result.all()}
+    if mapping:
+        await redis_client.zadd(review_queue_key(user_id), mapping)
+
+
+async def get_due_words(user_id: int, limit: int, redis_client, db: AsyncSession) -> List[Dict]:
+    """
+    복습 시각이 지난 단어를 오래된 순으로 최대 limit 개 조회합니다.
+    """
+    key = review_queue_key(user_id)
+    if not await redis_client.exists(key):
+        await rebuild_review_queue(redis_client, user_id, db)
+
+    # O(log n + limit) 범위 조회
+    now = datetime.utcnow().timestamp()
+    word_ids = await redis_client.zrangebyscore(key, "-inf", now, start=0, num=limit)
+    if not word_ids:
+        return []
+
+    result = await db.execute(
+        select(BookmarkWord).where(
+            BookmarkWord.user_id == user_id,
+            BookmarkWord.word_id.in_([uuid.UUID(word_id) for word_id in word_ids]),
+        )
+    )
+    words = {str(word.word_id): word for word in result.scalars().all()}
+
+    # 큐에는 남아 있지만 DB에서 삭제된 단어는 정리
+    stale = [word_id for word_id in word_ids if word_id not in words]
+    if stale:
+        await redis_client.zrem(key, *stale)
+
+    return [
+        {
+            "word_id": str(word.word_id),
+            "word": word.word,
+            "definition": word.definition,
+            "example": word.example,
+            "repetitions": word.repetitions,
+            "interval_days": word.interval_days,
+            "next_review_at": word.next_review_at.isoformat(),
+        }
+        for word_id in word_ids
+        if (word := words.get(word_id)) is not None
+    ]
+
+
+async def grade_word(word_id: uuid.UUID, user_id: int, quality: int, redis_client, db: AsyncSession) -> Dict:
+    """
+    단어 복습 결과를 채점하고 DB 와 Redis 큐를 함께 갱신합니다.
+    Redis 갱신이 실패하면 DB 변경을 롤백하고, DB 커밋이 실패하면 큐 점수를 되돌립니다.
+    """
+    result = await db.execute(select(BookmarkWord).filter_by(word_id=word_id, user_id=user_id))
+    word = result.scalars().first()
+
+    if not word:
+        raise HTTPException(status_code=404, detail="Word not found or does not belong to the user.")
+
+    try:
+        repetitions, interval_days, ease_factor = calculate_sm2(
+            quality, word.repetitions, word.interval_days, word.ease_factor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    now = datetime.utcnow()
+    previous_review_at = word.next_review_at
+    word.repetitions = repetitions
+    word.interval_days = interval_days
+    word.ease_factor = ease_factor
+    word.last_reviewed_at = now
+    word.next_review_at = now + timedelta(days=interval_days)
+
+    key = review_queue_key(user_id)
+    member = str(word.word_id)
+    try:
+        await db.flush()
+        await redis_client.zadd(key, {member: word.next_review_at.timestamp()})
+    except Exception:
+        await db.rollback()
+        raise
+
+    try:
+        await db.commit()
+    except Exception:
+        await redis_client.zadd(key, {member: previous_review_at.timestamp()})
+        raise
+
+    return {
+        "word_id": member,
+        "repetitions": word.repetitions,
+        "interval_days": word.interval_days,
+        "ease_factor": word.ease_factor,
+        "next_review_at": word.next_review_at.isoformat(),
+    }
+
@@ -0,0 +1,138 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable
+
+from fastapi import HTTPException
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.models.models import UserStats, UserDailySearchStats, StudyCategory
+
+# 사용자당 최대 단어 수
+BOOKMARK_LIMIT = 100
+
+# 학습 종류 -> 통계 컬럼 이름
+CATEGORY_COLUMNS = {
+    StudyCategory.VOCABULARY: "vocabulary_count",
+    StudyCategory.GRAMMAR: "grammar_count",
+    StudyCategory.READING: "reading_count",
+    StudyCategory.WRITING: "writing_count",
+}
+
+
+def to_study_category(value) -> StudyCategory:
+    """
+    Enum 또는 문자열("VOCABULARY" / "Vocabulary")을 StudyCategory 로 변환
+    알 수 없는 값이면 ValueError (요청 값을 변환할 때는 400 으로 바꿔서 응답)
+    """
+    if isinstance(value, StudyCategory):
+        return value
+    try:
+        return StudyCategory[value]
+    except (KeyError, TypeError):
+        return StudyCategory(value)
+
+
+async def reserve_bookmark_slot(db: AsyncSession, user_id: int, category=StudyCategory.VOCABULARY):
+    """
+    단어 추가 전 통계 행을 증가시키며 최대 개수를 확인합니다.
+    COUNT 조회 없이 upsert 한 번으로 처리하며, 호출한 트랜잭션과 함께 커밋/롤백됩니다.
+    """
+    column = CATEGORY_COLUMNS[to_study_category(category)]
+    stmt = (
+        insert(UserStats)
+        .values(user_id=user_id, total_bookmarks=1, **{column: 1})
+        .on_conflict_do_update(
+            index_elements=[UserStats.user_id],
+            set_={
+                "total_bookmarks": UserStats.total_bookmarks + 1,
+                column: getattr(UserStats, column) + 1,
+            },
+            where=UserStats.total_bookmarks < BOOKMARK_LIMIT,
+        )
+        .returning(UserStats.total_bookmarks)
+    )
+    result = await db.execute(stmt)
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=400, detail=f"단어 북마크는 최대 {BOOKMARK_LIMIT}개까지 가능합니다.")
+
+
+async def release_bookmark_slots(db: AsyncSession, user_id: int, categories: Iterable):
+    """삭제된 단어 수만큼 통계를 감소시킵니다. (categories: 삭제된 단어들의 학습 종류)"""
+    counts: Dict[str, int] = {}
+    for category in categories:
+        column = CATEGORY_COLUMNS[to_study_category(category)]
+        counts[column] = counts.get(column, 0) + 1
+    if not counts:
+        return
+
+    values = {column: getattr(UserStats, column) - count for column, count in counts.items()}
+    values["total_bookmarks"] = UserStats.total_bookmarks - sum(counts.values())
+    await db.execute(update(UserStats).where(UserStats.user_id == user_id).values(**values))
+
+
+async def reset_bookmark_stats(db: AsyncSession, user_id: int):
+    """단어장 전체 삭제 시 통계 초기화"""
+    await db.execute(
+        update(UserStats)
+        .where(UserStats.user_id == user_id)
+        .values(total_bookmarks=0, **{column: 0 for column in CATEGORY_COLUMNS.values()})
+    )
+
+
+async def change_bookmark_category(db: AsyncSession, user_id: int, old_category, new_category):
+    """단어의 학습 종류 변경을 통계에 반영"""
+    old_column = CATEGORY_COLUMNS[to_study_category(old_category)]
+    new_column = CATEGORY_COLUMNS[to_study_category(new_category)]
+    if old_column == new_column:
+        return
+    await db.execute(
+        update(UserStats)
+        .where(UserStats.user_id == user_id)
+        .values({
+            old_column: getattr(UserStats, old_column) - 1,
+            new_column: getattr(UserStats, new_column) + 1,
+        })
+    )
+
+
+async def increment_daily_searches(db: AsyncSession, user_id: int, day: date = None):
+    """오늘(UTC) 검색 횟수를 1 증가"""
+    day = day or datetime.utcnow().date()
+    stmt = (
+        insert(UserDailySearchStats)
+        .values(user_id=user_id, day=day, search_count=1)
+        .on_conflict_do_update(
+            index_elements=[UserDailySearchStats.user_id, UserDailySearchStats.day],
+            set_={"search_count": UserDailySearchStats.search_count + 1},
+        )
+    )
+    await db.execute(stmt)
+
+
+async def get_user_stats(db: AsyncSession, user_id: int, days: int = 7) -> Dict:
+    """
+    사용자 통계 조회 (통계 행 1개 + 최근 days 일의 일간 행만 읽음)
+    """
+    result = await db.execute(select(UserStats).filter_by(user_id=user_id))
+    stats = result.scalars().first()
+
+    since = datetime.utcnow().date() - timedelta(days=days - 1)
+    result = await db.execute(
+        select(UserDailySearchStats.day, UserDailySearchStats.search_count)
+        .where(UserDailySearchStats.user_id == user_id, UserDailySearchStats.day >= since)
+        .order_by(UserDailySearchStats.day)
+    )
+    daily = [{"day": day.isoformat(), "count": count} for day, count in result.all()]
+
+    return {
+        "total_bookmarks": stats.total_bookmarks if stats else 0,
+        "bookmark_limit": BOOKMARK_LIMIT,
+        "by_category": {
+            category.value: getattr(stats, column) if stats else 0
+            for category, column in CATEGORY_COLUMNS.items()
+        },
+        "searches_last_days": sum(item["count"] for item in daily),
+        "daily_searches": daily,
+    }
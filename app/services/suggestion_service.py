@@ -0,0 +1,57 @@
+import os
+from bisect import bisect_left
+from typing import Iterable, List, Optional
+
+from config.settings import settings
+
+# 기본 자동완성 단어 (SUGGESTION_WORDS_PATH 파일이 있으면 함께 사용)
+SEED_WORDS = ["apple", "application", "banana", "band", "cat", "dog"]
+
+
+class SuggestionIndex:
+    """
+    정렬된 단어 목록에서 접두사 범위를 이분 탐색으로 찾는 읽기 전용 자동완성 인덱스
+    생성 후 변경하지 않으므로 pre-fork 서버에서 워커들이 copy-on-write 로 공유합니다.
+    """
+
+    __slots__ = ("words",)
+
+    def __init__(self, words: Iterable[str]):
+        self.words = tuple(sorted({word.strip().lower() for word in words if word.strip()}))
+
+    def suggest(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """prefix 로 시작하는 단어 (사전순, 대소문자 무시)"""
+        prefix = prefix.lower()
+        start = bisect_left(self.words, prefix)
+        end = bisect_left(self.words, prefix + "\uffff", start)
+        if limit is not None:
+            end = min(end, start + limit)
+        return list(self.words[start:end])
+
+    def __len__(self):
+        return len(self.words)
+
+
+def read_words(path: str) -> List[str]:
+    """한 줄에 단어 하나인 파일 읽기"""
+    with open(path, encoding="utf-8") as f:
+        return f.read().split()
+
+
+_index: Optional[SuggestionIndex] = None
+
+
+def load_suggestion_index(path: str = None) -> SuggestionIndex:
+    """인덱스 생성 (serve.py 는 워커를 fork 하기 전에 호출)"""
+    global _index
+    path = path if path is not None else settings.suggestion_words_path
+    words = list(SEED_WORDS)
+    if path and os.path.exists(path):
+        words.extend(read_words(path))
+    _index = SuggestionIndex(words)
+    return _index
+
+
+def get_suggestion_index() -> SuggestionIndex:
+    """공유 인덱스 (미리 만들지 않았으면 첫 호출 때 생성)"""
+    return _index if _index is not None else load_suggestion_index()
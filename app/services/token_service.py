@@ -0,0 +1,41 @@
+# 리프레시 토큰 보관 기간
+REFRESH_TOKEN_TTL = 3600 * 24 * 30  # 30일
+
+# 저장된 리프레시 토큰이 제출된 토큰과 같을 때만 새 토큰으로 교체 (compare-and-swap + TTL 갱신)
+# 반환값: 1 = 교체 성공, 0 = 저장된 토큰 없음/불일치 (이미 사용되었거나 로그아웃된 토큰)
+ROTATE_REFRESH_TOKEN_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    return 1
+end
+return 0
+"""
+
+_rotate_script = None
+
+
+def refresh_token_key(user_id) -> str:
+    """사용자별 리프레시 토큰 키"""
+    return f"refresh_token:{user_id}"
+
+
+async def store_refresh_token(redis_client, user_id, refresh_token: str):
+    """로그인 시 리프레시 토큰 저장 (기존 토큰은 무효화)"""
+    await redis_client.setex(refresh_token_key(user_id), REFRESH_TOKEN_TTL, refresh_token)
+
+
+async def rotate_refresh_token(redis_client, user_id, old_token: str, new_token: str) -> bool:
+    """
+    저장된 리프레시 토큰을 새 토큰으로 원자적으로 교체합니다. (Redis 1회 왕복)
+    같은 토큰으로 동시에 요청해도 한 요청만 성공합니다.
+    """
+    global _rotate_script
+    if _rotate_script is None:
+        _rotate_script = redis_client.register_script(ROTATE_REFRESH_TOKEN_SCRIPT)
+
+    rotated = await _rotate_script(
+        keys=[refresh_token_key(user_id)],
+        args=[old_token, new_token, REFRESH_TOKEN_TTL],
+        client=redis_client,
+    )
+    return rotated == 1
@@ -0,0 +1,117 @@
+import time
+import uuid
+from typing import List, Dict
+
+# 시간 버킷 크기 / 버킷당 보관 단어 수 / 조회 가능한 최대 기간
+TRENDING_BUCKET_SECONDS = 300  # 5분
+TRENDING_TOP_K = 500
+TRENDING_MAX_WINDOW_MINUTES = 24 * 60
+TRENDING_TTL = TRENDING_MAX_WINDOW_MINUTES * 60 + TRENDING_BUCKET_SECONDS
+# 키에 들어가는 단어 최대 길이 (더 긴 검색어는 잘라서 집계)
+TRENDING_MAX_WORD_LENGTH = 64
+
+# 버킷 sorted set 을 Space-Saving 방식으로 K 개 이하로 유지합니다.
+# - 버킷에 있는 단어: 횟수 + 1
+# - 버킷이 가득 찼는데 새 단어: 가장 적게 검색된 단어를 빼고(HLL 도 함께 삭제) 그 횟수 + 1 로 추가
+#   (새로 떠오르는 단어도 상위 K 에 들어올 수 있고, 이어받은 횟수만큼 과대 추정될 수 있음)
+# 고유 사용자 HyperLogLog 는 버킷에 있는 단어에만 있으므로 버킷당 키 수는 sorted set 1개 + HLL K개 이하입니다.
+# (빠진 단어의 HLL 키는 ARGV 의 접두사로 만들므로 Redis Cluster 가 아닌 단일 인스턴스 기준)
+RECORD_SEARCH_SCRIPT = """
+local bucket, word = KEYS[1], ARGV[1]
+if not redis.call('ZSCORE', bucket, word) and redis.call('ZCARD', bucket) >= tonumber(ARGV[3]) then
+    local evicted = redis.call('ZRANGE', bucket, 0, 0, 'WITHSCORES')
+    redis.call('ZREM', bucket, evicted[1])
+    redis.call('DEL', ARGV[5] .. evicted[1])
+    redis.call('ZADD', bucket, evicted[2], word)
+end
+redis.call('ZINCRBY', bucket, 1, word)
+redis.call('EXPIRE', bucket, ARGV[4])
+if ARGV[2] ~= '' then
+    redis.call('PFADD', KEYS[2], ARGV[2])
+    redis.call('EXPIRE', KEYS[2], ARGV[4])
+end
+return 1
+"""
+
+_record_script = None
+
+
+def bucket_of(timestamp: float) -> int:
+    """타임스탬프가 속한 버킷 번호"""
+    return int(timestamp // TRENDING_BUCKET_SECONDS)
+
+
+def bucket_key(bucket: int) -> str:
+    """버킷별 검색 횟수 sorted set 키"""
+    return f"trending:{bucket}"
+
+
+def unique_users_prefix(bucket: int) -> str:
+    """버킷별 단어 검색 사용자 HyperLogLog 키 접두사"""
+    return f"trending:users:{bucket}:"
+
+
+def unique_users_key(bucket: int, word: str) -> str:
+    """버킷별 단어 검색 사용자 HyperLogLog 키"""
+    return unique_users_prefix(bucket) + word
+
+
+def normalize_word(word: str) -> str:
+    """집계 / 키에 사용하는 단어 (소문자, 최대 TRENDING_MAX_WORD_LENGTH 자)"""
+    return word.strip().lower()[:TRENDING_MAX_WORD_LENGTH]
+
+
+def window_buckets(window_minutes: int, now: float = None) -> List[int]:
+    """최근 window_minutes 분에 해당하는 버킷 번호 목록 (현재 버킷 포함)"""
+    current = bucket_of(now if now is not None else time.time())
+    count = max(1, -(-window_minutes * 60 // TRENDING_BUCKET_SECONDS))
+    return [current - offset for offset in range(count)]
+
+
+async def record_trending_search(redis_client, word: str, user_id: int = None):
+    """검색 경로에서 호출: 현재 버킷의 검색 횟수와 고유 사용자 수 갱신 (1회 왕복)"""
+    global _record_script
+    if _record_script is None:
+        _record_script = redis_client.register_script(RECORD_SEARCH_SCRIPT)
+
+    word = normalize_word(word)
+    if not word:
+        return
+    bucket = bucket_of(time.time())
+    await _record_script(
+        keys=[bucket_key(bucket), unique_users_key(bucket, word)],
+        args=[word, "" if user_id is None else str(user_id), TRENDING_TOP_K, TRENDING_TTL, unique_users_prefix(bucket)],
+        client=redis_client,
+    )
+
+
+async def get_trending_words(redis_client, limit: int = 10, window_minutes: int = 60) -> List[Dict]:
+    """
+    최근 window_minutes 분 동안 많이 검색된 단어와 고유 검색자 수(추정치)를 조회합니다.
+    읽는 데이터 양은 버킷 수 * TRENDING_TOP_K 로 제한됩니다.
+    (검색 횟수는 Space-Saving 상한 추정치, 버킷에서 빠졌던 단어의 고유 사용자 수는 다시 들어온 뒤부터 집계)
+    """
+    buckets = window_buckets(min(window_minutes, TRENDING_MAX_WINDOW_MINUTES))
+    keys = [bucket_key(bucket) for bucket in buckets]
+    merged_key = f"trending:merged:{uuid.uuid4().hex}"
+
+    # 버킷 합치기 + 상위 limit 개 조회 + 임시 키 삭제 (1회 왕복)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.zunionstore(merged_key, keys)
+        pipe.zrevrange(merged_key, 0, limit - 1, withscores=True)
+        pipe.delete(merged_key)
+        _, top_words, _ = await pipe.execute()
+
+    if not top_words:
+        return []
+
+    # 단어별 고유 사용자 수: 기간 내 버킷 HLL 을 PFCOUNT 로 합산 (1회 왕복)
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for word, _ in top_words:
+            pipe.pfcount(*[unique_users_key(bucket, word) for bucket in buckets])
+        unique_counts = await pipe.execute()
+
+    return [
+        {"word": word, "searches": int(score), "unique_users": unique_users}
+        for (word, score), unique_users in zip(top_words, unique_counts)
+    ]
@@ -1,12 +1,97 @@
+from datetime import date, datetime, time
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from app.models.models import User, SearchHistory
+from app.models.models import User, SearchHistory, SearchHistorySummary
 from typing import List, Dict
-import bcrypt
+from app.database.partitions import add_months, month_start, retention_cutoff
+from app.services.stats_service import increment_daily_searches
+from app.utils.utils import hash_password
+from config.settings import settings
+
+# 검색 기록 저장 방식
+SEARCH_HISTORY_LOG = "log"
+SEARCH_HISTORY_DEDUP = "dedup"
+
+# 조회 쿼리 (서비스 함수와 실행 계획 테스트에서 함께 사용)
+def user_by_kakao_id_query(kakao_id: int):
+    """카카오 ID로 사용자 조회 쿼리"""
+    return select(User).where(User.kakao_id == kakao_id)
+
+def search_history_page_query(user_id: int, month: date, limit: int):
+    """
+    사용자 검색 기록 최신순 조회 쿼리 - month 한 달 범위만 ((user_id, created_at) 인덱스 사용)
+    범위가 월 파티션 하나와 같으므로 다른 월 파티션과 DEFAULT 파티션은 계획에서 제외됩니다.
+    (그 달 파티션이 없으면 DEFAULT 파티션에서 조회)
+    """
+    start = datetime.combine(month, time())
+    end = datetime.combine(add_months(month, 1), time())
+    return (
+        select(SearchHistory)
+        .filter(SearchHistory.user_id == user_id, SearchHistory.created_at >= start, SearchHistory.created_at < end)
+        .order_by(SearchHistory.created_at.desc())
+        .limit(limit)
+    )
+
+async def fetch_search_history_page(
+    db: AsyncSession, user_id: int, page: int = 1, page_size: int = 10, today: date = None
+) -> List[SearchHistory]:
+    """
+    검색 기록 최신순 페이지 조회 (로그 모드)
+    이번 달 파티션부터 한 달씩 거슬러 올라가며 페이지가 찰 때까지 조회합니다. (보관 기간 시작 월까지)
+    대부분의 요청은 이번 달 파티션 하나만 읽습니다.
+    """
+    today = today or datetime.utcnow().date()
+    cutoff = retention_cutoff(today, settings.search_history_retention_months)
+    month = month_start(today)
+    skip = (page - 1) * page_size  # 앞 페이지에 해당해 건너뛸 행 수
+    records: List[SearchHistory] = []
+    while month >= cutoff and len(records) < page_size:
+        result = await db.execute(search_history_page_query(user_id, month, skip + page_size - len(records)))
+        rows = result.scalars().all()
+        records.extend(rows[skip:])
+        skip = max(0, skip - len(rows))
+        month = add_months(month, -1)
+    return records
+
+def search_history_summary_page_query(user_id: int, page: int = 1, page_size: int = 10, order_by: str = "recent"):
+    """중복 제거 검색 기록 페이지 조회 쿼리 (recent: 최신순, frequency: 많이 검색한 순)"""
+    if order_by == "frequency":
+        ordering = (SearchHistorySummary.search_count.desc(), SearchHistorySummary.last_searched_at.desc())
+    else:
+        ordering = (SearchHistorySummary.last_searched_at.desc(),)
+    return (
+        select(SearchHistorySummary)
+        .filter(SearchHistorySummary.user_id == user_id)
+        .order_by(*ordering)
+        .limit(page_size)
+        .offset((page - 1) * page_size)
+    )
+
+def upsert_kakao_user_query(kakao_id: int, email: str, nickname: str):
+    """
+    카카오 로그인 사용자 upsert 쿼리 (없으면 생성, 있으면 프로필 갱신 후 행 반환)
+    kakao_id 유니크 제약으로 동시 첫 로그인에도 사용자가 하나만 생성됩니다.
+    """
+    stmt = insert(User).values(kakao_id=kakao_id, email=email, nickname=nickname, password="")
+    return stmt.on_conflict_do_update(
+        index_elements=[User.kakao_id],
+        set_={"email": stmt.excluded.email, "nickname": stmt.excluded.nickname},
+    ).returning(User)
+
+async def upsert_kakao_user(db: AsyncSession, kakao_id: int, email: str, nickname: str) -> User:
+    """카카오 로그인 사용자 조회/생성 (INSERT ... ON CONFLICT ... RETURNING 1회 + COMMIT)"""
+    result = await db.execute(
+        upsert_kakao_user_query(kakao_id, email, nickname),
+        execution_options={"populate_existing": True},
+    )
+    user = result.scalar_one()
+    await db.commit()
+    return user
 
 async def get_user_by_kakao_id(db: AsyncSession, kakao_id: str):
     """카카오 ID로 사용자 조회 (비동기)"""
-    result = await db.execute(select(User).where(User.kakao_id == kakao_id))
+    result = await db.execute(user_by_kakao_id_query(kakao_id))
     user = result.scalar_one_or_none()  # 조회된 사용자 반환 (없으면 None)
     return user
 
@@ -14,9 +99,8 @@ async def create_user(db: AsyncSession, user_data: dict):
     """사용자 생성 (비동기)"""
     # 소셜 로그인의 경우 비밀번호가 없을 수 있음
     if "password" in user_data and user_data["password"]:
-        # 비밀번호가 있으면 해시화
-        hashed_password = bcrypt.hashpw(user_data["password"].encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
-        user_data["password"] = hashed_password
+        # 비밀번호가 있으면 해시화 (이벤트 루프를 막지 않도록 CPU 실행기에서 처리)
+        user_data["password"] = await hash_password(user_data["password"])
     else:
         # 소셜 로그인에서는 비밀번호 없음
         user_data["password"] = ""  # 비밀번호가 없으면 빈 문자열로 처리
@@ -27,17 +111,35 @@ async def create_user(db: AsyncSession, user_data: dict):
     await db.refresh(new_user)  # 새로 생성된 사용자 데이터 갱신
     return new_user
 
+async def record_search_history(db: AsyncSession, user_id: int, word: str):
+    """검색 기록 저장 + 일간 검색 통계 증가 (하나의 트랜잭션)"""
+    if settings.search_history_mode == SEARCH_HISTORY_DEDUP:
+        # (user_id, word) 당 한 행만 유지: INSERT ... ON CONFLICT DO UPDATE
+        now = datetime.utcnow()
+        stmt = (
+            insert(SearchHistorySummary)
+            .values(user_id=user_id, word=word, search_count=1, last_searched_at=now)
+            .on_conflict_do_update(
+                index_elements=[SearchHistorySummary.user_id, SearchHistorySummary.word],
+                set_={
+                    "search_count": SearchHistorySummary.search_count + 1,
+                    "last_searched_at": now,
+                },
+            )
+        )
+        await db.execute(stmt)
+    else:
+        db.add(SearchHistory(user_id=user_id, word=word))
+    await increment_daily_searches(db, user_id)
+    await db.commit()
+
 async def get_search_history(
     db: AsyncSession, user_id: int, page: int = 1, page_size: int = 10
 ) -> List[Dict]:
     """
     사용자의 검색 기록을 페이지네이션하여 가져옵니다.
     """
-    # 검색 기록 쿼리 작성
-    query = select(SearchHistory).filter(SearchHistory.user_id == user_id)
-    query = query.limit(page_size).offset((page - 1) * page_size)
-    result = await db.execute(query)
-    records = result.scalars().all()
+    records = await fetch_search_history_page(db, user_id, page, page_size)
 
     # 결과 반환
     return [{"id": record.id, "word": record.word, "created_at": record.created_at} for record in records]
\ No newline at end of file
@@ -2,13 +2,14 @@ import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
-from app.database.db import AsyncSessionLocal
+from app.database.db import AsyncSessionLocal, init_engine
 from sqlalchemy.future import select
 from app.models.models import User
 from httpx import AsyncClient
 from main import app
 from sqlalchemy.ext.asyncio import AsyncSession
 from dependencies import get_db
+from app.database.db import get_read_db
 
 
 @pytest.fixture(scope="session")
@@ -19,6 +20,12 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def database_engine():
+    """앱과 같은 엔진 팩토리로 공유 엔진 생성 (AsyncSessionLocal 에 연결)"""
+    return init_engine()
+
+
 @pytest.fixture(scope="function")
 async def db() -> AsyncSession:
     """
@@ -64,5 +71,7 @@ def override_get_db():
 
     # get_db를 Mock으로 대체
     app.dependency_overrides[get_db] = lambda: mock_session
+    app.dependency_overrides[get_read_db] = lambda: mock_session
     yield mock_session
     app.dependency_overrides.pop(get_db)
+    app.dependency_overrides.pop(get_read_db)
@@ -1,7 +1,9 @@
 import pytest
+import redis
 from fastapi.testclient import TestClient
 from main import app
-from utils.utils import create_jwt_token, get_redis_client
+from app.utils.utils import create_jwt_token
+from config.settings import settings
 
 client = TestClient(app)
 
@@ -24,7 +26,7 @@ def valid_jwt_token():
 @pytest.fixture
 def redis_setup():
     """테스트용 Redis 클라이언트 설정 및 초기화"""
-    redis_client = get_redis_client()  # Redis 클라이언트를 가져옴
+    redis_client = redis.Redis.from_url(settings.redis_url, decode_responses=True)  # 테스트 검증용 동기 클라이언트
     redis_client.flushdb()  # 테스트 전 Redis DB 초기화
     yield redis_client
     redis_client.flushdb()  # 테스트 후 Redis DB 초기화
@@ -82,3 +84,21 @@ class TestLogout:
         assert response.status_code == 401
         assert response.json() == {"detail": "Not authenticated"}
 
+
+
+def test_upsert_kakao_user_query():
+    """카카오 로그인 사용자 upsert 가 한 문장으로 생성/갱신/반환하는지 확인"""
+    from sqlalchemy.dialects import postgresql
+    from app.services.user_service import upsert_kakao_user_query
+
+    sql = str(upsert_kakao_user_query(123, "a@kakao.com", "nick").compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (kakao_id) DO UPDATE" in sql
+    assert "email = excluded.email" in sql
+    assert "RETURNING users.id" in sql
+
+
+def test_refresh_tokens_are_unique():
+    """같은 사용자에게 연달아 발급한 리프레시 토큰도 서로 달라야 교체 비교가 가능"""
+    from app.utils.utils import create_refresh_token
+
+    assert create_refresh_token({"user_id": 1}) != create_refresh_token({"user_id": 1})
@@ -0,0 +1,63 @@
+import time
+
+import jwt
+import pytest
+
+from app.utils.auth_cache import TTLCache, decode_access_token, token_cache, forget_token
+from app.utils.utils import create_jwt_token, SECRET_KEY, ALGORITHM
+
+
+class TestTTLCache:
+
+    # 테스트 케이스 1: 저장한 값 조회
+    def test_get_set(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    # 테스트 케이스 2: 최대 크기를 넘으면 가장 오래 사용하지 않은 항목 제거
+    def test_lru_eviction(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    # 테스트 케이스 3: 만료된 항목은 조회되지 않음
+    def test_expiry(self, monkeypatch):
+        cache = TTLCache(maxsize=2, ttl=10)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        cache.set("a", 1)
+        monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+        assert cache.get("a") is None
+
+
+class TestDecodeAccessToken:
+
+    # 테스트 케이스 1: 검증된 토큰은 캐시에서 재사용
+    def test_cached_after_first_decode(self, mocker):
+        token = create_jwt_token({"user_id": 1, "kakao_id": 123})
+        forget_token(token)
+        spy = mocker.spy(jwt, "decode")
+
+        assert decode_access_token(token)["user_id"] == 1
+        assert decode_access_token(token)["user_id"] == 1
+        assert spy.call_count == 1
+        forget_token(token)
+
+    # 테스트 케이스 2: 잘못된 토큰은 캐시하지 않고 예외 발생
+    def test_invalid_token_not_cached(self):
+        with pytest.raises(jwt.InvalidTokenError):
+            decode_access_token("invalid_token_string")
+        assert token_cache.get("invalid_token_string") is None
+
+    # 테스트 케이스 3: 만료된 토큰은 예외 발생
+    def test_expired_token(self):
+        token = jwt.encode({"user_id": 1, "exp": int(time.time()) - 10}, SECRET_KEY, algorithm=ALGORITHM)
+        with pytest.raises(jwt.ExpiredSignatureError):
+            decode_access_token(token)
@@ -2,10 +2,11 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 from main import app
-from app.database.db import get_db  # 실제 DB 세션 생성기
+from app.database.db import AsyncSessionLocal, get_engine, get_read_db  # 실제 DB 세션 생성기
 from models.models import User, BookmarkWord
-from sqlalchemy import text
+from sqlalchemy import delete, text
 from sqlalchemy.future import select
+from dependencies import get_current_user
 
 
 # DB 세션 fixture
@@ -14,7 +15,8 @@ async def db():
     """
     실제 데이터베이스 세션 생성
     """
-    async for session in get_db():
+    get_engine()
+    async with AsyncSessionLocal() as session:
         yield session
 
 # 테스트 데이터 정리 fixture
@@ -55,16 +57,17 @@ async def test_add_word_to_bookmark(db):
     assert test_bookmark.id is not None
     assert test_bookmark.user_id == test_user.id
 
+    word = {"word": "example", "definition": "A representative form.", "example": "This is an example."}
     async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.post(
-            "/bookmark/words",
-            json={
-                "user_id": test_user.id,
-                "word": "example",
-                "definition": "A representative form.",
-                "example": "This is an example."
-            }
-        )
+        # 인증 없이는 추가할 수 없음 (user_id 쿼리 파라미터로 다른 사용자 단어장에 쓰지 못함)
+        response = await client.post("/bookmark/words", params={"user_id": test_user.id}, json=word)
+        assert response.status_code == 401
+
+        app.dependency_overrides[get_current_user] = lambda: test_user
+        try:
+            response = await client.post("/bookmark/words", json=word)
+        finally:
+            app.dependency_overrides.pop(get_current_user)
         assert response.status_code == 200
         assert response.json()["message"] == "Word added to bookmark successfully."
 
@@ -281,4 +284,55 @@ async def test_delete_all_bookmark_words(db: AsyncSession):
         remaining_words = result.scalars().all()
         assert len(remaining_words) == 0  # 모든 단어가 삭제되었는지 확인
 
-# 코드 리펙토링 가능한지 -> 중복 되는 코드 (테스트 사용자 한번만 사용하고 class로 묶을 수 있는지)
\ No newline at end of file
+# 코드 리펙토링 가능한지 -> 중복 되는 코드 (테스트 사용자 한번만 사용하고 class로 묶을 수 있는지)
+@pytest.mark.asyncio
+async def test_search_bookmark_words(db: AsyncSession):
+    """
+    단어장 검색 테스트 (의미 전문 검색 + 부분 문자열 검색)
+    """
+    # 테스트 사용자 추가
+    result = await db.execute(select(User).filter_by(kakao_id=123))
+    test_user = result.scalars().first()
+
+    if not test_user:
+        test_user = User(
+            kakao_id=123, email="test@example.com", nickname="testuser", password="testpass"
+        )
+        db.add(test_user)
+        await db.commit()
+        await db.refresh(test_user)
+
+    # 이전 실행에서 남은 같은 단어 삭제 후 테스트 단어 추가 (사용자별 단어 유니크 제약)
+    seed_words = ["apple", "application", "banana"]
+    await db.execute(delete(BookmarkWord).where(BookmarkWord.user_id == test_user.id, BookmarkWord.word.in_(seed_words)))
+    words = [
+        BookmarkWord(word="apple", definition="A round fruit", example="I ate an apple.", user_id=test_user.id),
+        BookmarkWord(word="application", definition="A formal request", example="Send an application.", user_id=test_user.id),
+        BookmarkWord(word="banana", definition="A long yellow fruit", example="I like bananas.", user_id=test_user.id),
+    ]
+    db.add_all(words)
+    await db.commit()
+
+    # 단어를 넣은 사용자로 요청하고, 검색은 실제 DB 세션으로 실행 (Mock 세션 override 는 끝나고 복원)
+    mock_read_db = app.dependency_overrides.get(get_read_db)
+    app.dependency_overrides[get_current_user] = lambda: test_user
+    app.dependency_overrides[get_read_db] = lambda: db
+    try:
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            # 의미(definition) 전문 검색
+            response = await client.get("/bookmark/words/search", params={"q": "fruits"})
+            assert response.status_code == 200
+            found = {record["word"] for record in response.json()["records"]}
+            assert found == {"apple", "banana"}
+
+            # 단어 부분 문자열 검색
+            response = await client.get("/bookmark/words/search", params={"q": "appl"})
+            assert response.status_code == 200
+            records = response.json()["records"]
+            assert [record["word"] for record in records][:2] == ["apple", "application"]
+    finally:
+        app.dependency_overrides.pop(get_current_user)
+        app.dependency_overrides[get_read_db] = mock_read_db
+        # 추가한 테스트 단어 삭제
+        await db.execute(delete(BookmarkWord).where(BookmarkWord.word_id.in_([word.word_id for word in words])))
+        await db.commit()
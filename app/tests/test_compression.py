@@ -0,0 +1,84 @@
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.compression import CompressionMiddleware, choose_encoding, parse_accept_encoding
+
+LARGE = {"words": [f"word{i}" for i in range(500)]}
+
+
+@pytest.fixture
+def client():
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/large")
+    async def large():
+        return LARGE
+
+    @app.get("/small")
+    async def small():
+        return {"word": "apple"}
+
+    @app.get("/encoded")
+    async def encoded():
+        return PlainTextResponse(gzip.compress(b"x" * 2000), headers={"Content-Encoding": "gzip"})
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(100):
+                yield f"line {i}\n".encode()
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return TestClient(app)
+
+
+class TestAcceptEncoding:
+
+    # 테스트 케이스 1: q 값 파싱
+    def test_parse(self):
+        assert parse_accept_encoding("gzip;q=0.8, br ,deflate;q=x") == {"gzip": 0.8, "br": 1.0, "deflate": 0.0}
+        assert parse_accept_encoding("") == {}
+
+    # 테스트 케이스 2: 지원하는 인코딩 중 q 값이 가장 큰 것, 같으면 서버 선호 순서
+    def test_choose(self):
+        assert choose_encoding("gzip, br", supported=("br", "gzip")) == "br"
+        assert choose_encoding("gzip, br;q=0.5", supported=("br", "gzip")) == "gzip"
+        assert choose_encoding("*", supported=("br", "gzip")) == "br"
+        assert choose_encoding("gzip;q=0, identity", supported=("gzip",)) is None
+        assert choose_encoding("deflate", supported=("br", "gzip")) is None
+
+
+class TestCompressionMiddleware:
+
+    # 테스트 케이스 1: 기준 크기 이상의 JSON 응답은 gzip 압축
+    def test_compress_large(self, client):
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) < len(response.content)
+        assert response.json() == LARGE
+
+    # 테스트 케이스 2: 작은 응답 / 압축을 허용하지 않는 요청은 그대로
+    def test_not_compressed(self, client):
+        assert "content-encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+        response = client.get("/large", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.json() == LARGE
+
+    # 테스트 케이스 3: 이미 인코딩된 응답은 다시 압축하지 않음
+    def test_already_encoded(self, client):
+        response = client.get("/encoded", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.content == b"x" * 2000
+
+    # 테스트 케이스 4: 스트리밍 응답은 청크 단위로 압축 (Content-Length 없음)
+    def test_streaming(self, client):
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.text == "".join(f"line {i}\n" for i in range(100))
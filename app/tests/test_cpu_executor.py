@@ -0,0 +1,54 @@
+import pytest
+
+from app.utils import cpu_executor
+from app.utils.cpu_executor import run_cpu, start_executor, shutdown_executor, executor_stats
+from app.utils.utils import hash_password, verify_password
+
+
+@pytest.fixture
+def executor():
+    shutdown_executor()
+    cpu_executor.metrics.reset()
+    start_executor(kind="thread", workers=2)
+    yield
+    shutdown_executor()
+
+
+class TestCPUExecutor:
+
+    # 테스트 케이스 1: 실행기에서 실행한 결과 반환 및 통계 기록
+    async def test_run_cpu(self, executor):
+        assert await run_cpu(sum, [1, 2, 3]) == 6
+        assert await run_cpu(sorted, [3, 1, 2], reverse=True) == [3, 2, 1]
+
+        stats = executor_stats()
+        assert stats["workers"] == 2
+        assert stats["completed"] == 2
+        assert stats["in_flight"] == 0
+        assert stats["queue_depth"] == 0
+
+    # 테스트 케이스 2: 작업에서 발생한 예외는 그대로 전달되고 실패로 집계
+    async def test_run_cpu_error(self, executor):
+        with pytest.raises(ZeroDivisionError):
+            await run_cpu(divmod, 1, 0)
+        assert executor_stats()["failed"] == 1
+
+    # 테스트 케이스 3: 알 수 없는 실행기 종류
+    def test_unknown_kind(self):
+        shutdown_executor()
+        with pytest.raises(ValueError):
+            start_executor(kind="gpu")
+
+
+class TestPasswordHashing:
+
+    # 테스트 케이스 1: 해시 후 검증
+    async def test_hash_and_verify(self, executor):
+        hashed = await hash_password("securepassword123")
+        assert hashed != "securepassword123"
+        assert await verify_password("securepassword123", hashed)
+        assert not await verify_password("wrong", hashed)
+
+    # 테스트 케이스 2: 소셜 로그인 사용자(빈 비밀번호)는 검증 실패
+    async def test_verify_empty_hash(self, executor):
+        assert not await verify_password("anything", "")
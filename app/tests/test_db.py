@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy.pool import NullPool
+
+from app.database.db import (
+    create_engine, connect_args_for, POOLER_DIRECT, POOLER_PGBOUNCER, POOLER_PGBOUNCER_NO_CACHE,
+)
+from config.settings import settings
+
+
+class TestEngineFactory:
+
+    # 테스트 케이스 1: Settings 값으로 커넥션 풀 구성 (SQL 로그 기본 꺼짐)
+    def test_engine_from_settings(self):
+        engine = create_engine()
+        assert engine.echo is False
+        assert engine.pool.size() == settings.db_pool_size
+        assert engine.pool._max_overflow == settings.db_max_overflow
+        assert engine.pool._pre_ping == settings.db_pool_pre_ping
+        assert engine.pool._recycle == settings.db_pool_recycle
+        assert engine.url.render_as_string(hide_password=False) == settings.database_url
+
+    # 테스트 케이스 2: 마이그레이션용 NullPool 로 변경
+    def test_override_poolclass(self):
+        engine = create_engine(poolclass=NullPool)
+        assert isinstance(engine.pool, NullPool)
+
+    # 테스트 케이스 3: PgBouncer 모드는 고유한 prepared statement 이름 사용
+    def test_pgbouncer_connect_args(self):
+        direct = connect_args_for(POOLER_DIRECT)
+        assert "prepared_statement_name_func" not in direct
+        assert direct["statement_cache_size"] == settings.db_statement_cache_size
+
+        pgbouncer = connect_args_for(POOLER_PGBOUNCER)
+        name_func = pgbouncer["prepared_statement_name_func"]
+        assert name_func() != name_func()
+        assert pgbouncer["statement_cache_size"] == settings.db_statement_cache_size
+
+        no_cache = connect_args_for(POOLER_PGBOUNCER_NO_CACHE)
+        assert no_cache["statement_cache_size"] == 0
+        assert no_cache["prepared_statement_cache_size"] == 0
+
+    # 테스트 케이스 4: 알 수 없는 풀러 모드
+    def test_unknown_pooler_mode(self):
+        with pytest.raises(ValueError):
+            create_engine(pooler_mode="pgpool")
@@ -0,0 +1,53 @@
+from benchmarks.load.report import percentile, build_report, compare
+from benchmarks.load.workload import Recorder
+
+
+def make_report(latency: float, requests: int = 100, status: int = 200, duration: float = 10.0):
+    recorder = Recorder()
+    for i in range(requests):
+        recorder.record("GET /search/word", latency * (i + 1) / requests, status)
+    recorder.finished = recorder.started + duration
+    return build_report(recorder)
+
+
+class TestLoadReport:
+
+    # 테스트 케이스 1: nearest-rank 백분위수
+    def test_percentile(self):
+        values = [i / 100 for i in range(1, 101)]
+        assert percentile(values, 50) == 0.5
+        assert percentile(values, 95) == 0.95
+        assert percentile(values, 99) == 0.99
+        assert percentile([], 99) == 0.0
+
+    # 테스트 케이스 2: 라우트별 처리량 / 오류율 / 지연시간 요약 (404 는 오류 아님)
+    def test_build_report(self):
+        recorder = Recorder()
+        recorder.record("GET /search/word", 0.010, 200)
+        recorder.record("GET /search/word", 0.020, 404)
+        recorder.record("GET /search/word", 0.030, 500)
+        recorder.record("GET /search/word", 0.040, 0)
+        recorder.finished = recorder.started + 2.0
+
+        report = build_report(recorder)
+        route = report["routes"]["GET /search/word"]
+        assert route["requests"] == 4
+        assert route["throughput_rps"] == 2.0
+        assert route["error_rate"] == 50.0
+        assert route["p50_ms"] == 20.0
+        assert route["p99_ms"] == 40.0
+        assert route["status"] == {"200": 1, "404": 1, "500": 1, "0": 1}
+        assert report["throughput_rps"] == 2.0
+
+    # 테스트 케이스 3: 허용치 안의 변화는 통과
+    def test_compare_within_threshold(self):
+        assert compare(make_report(0.110), make_report(0.100)) == []
+
+    # 테스트 케이스 4: 지연시간 / 처리량 / 오류율 회귀 감지
+    def test_compare_regressions(self):
+        baseline = make_report(0.100)
+        assert any("p95_ms" in r for r in compare(make_report(0.200), baseline))
+        assert any("throughput" in r for r in compare(make_report(0.100, duration=20.0), baseline))
+        assert any("error rate" in r for r in compare(make_report(0.100, status=503), baseline))
+        # 허용치 변경
+        assert compare(make_report(0.200), baseline, {"latency_pct": 150.0}) == []
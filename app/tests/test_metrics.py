@@ -0,0 +1,150 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.request_metrics import RequestMetricsMiddleware
+from app.utils.metrics import (
+    DICTIONARY_UPSTREAM,
+    Registry,
+    HTTP_REQUEST_DURATION,
+    archive_snapshot,
+    merge_snapshots,
+    render_multiprocess,
+    render_snapshot,
+    snapshot_path,
+    upstream_timer,
+    UPSTREAM_ERRORS,
+    UPSTREAM_REQUEST_DURATION,
+    write_snapshot,
+)
+
+
+def worker_snapshot(requests: int, in_flight: int, latency: float) -> dict:
+    """워커 한 개의 지표 스냅샷"""
+    registry = Registry()
+    registry.counter("requests_total", "requests", ("route",)).labels("/a").inc(requests)
+    registry.gauge("in_flight", "in flight").set(float(in_flight))
+    registry.histogram("latency_seconds", "latency", buckets=(0.1, 1.0)).observe(latency)
+    return registry.collect()
+
+
+class TestRegistry:
+
+    # 테스트 케이스 1: 같은 라벨 조합은 같은 자식 지표 재사용
+    def test_labels_cached(self):
+        registry = Registry()
+        counter = registry.counter("cache_requests_total", "cache lookups", ("cache", "result"))
+        assert counter.labels("token", "hit") is counter.labels("token", "hit")
+        with pytest.raises(ValueError):
+            counter.labels("token")
+
+    # 테스트 케이스 2: Prometheus 텍스트 형식 출력
+    def test_render(self):
+        registry = Registry()
+        counter = registry.counter("requests_total", "requests", ("route",))
+        gauge = registry.gauge("in_flight", "in flight")
+        histogram = registry.histogram("latency_seconds", "latency", buckets=(0.1, 1.0))
+        counter.labels("/a").inc()
+        counter.labels("/a").inc(2)
+        gauge.inc()
+        histogram.observe(0.05)
+        histogram.observe(0.1)
+        histogram.observe(3)
+
+        lines = registry.render().splitlines()
+        assert "# TYPE requests_total counter" in lines
+        assert 'requests_total{route="/a"} 3.0' in lines
+        assert "in_flight 1.0" in lines
+        assert 'latency_seconds_bucket{le="0.1"} 2' in lines
+        assert 'latency_seconds_bucket{le="1.0"} 2' in lines
+        assert 'latency_seconds_bucket{le="+Inf"} 3' in lines
+        assert "latency_seconds_count 3" in lines
+
+    # 테스트 케이스 3: 수집 시점에 값을 읽는 게이지
+    def test_gauge_callback(self):
+        registry = Registry()
+        registry.gauge_callback("pool_connections", "pool", lambda: {("in_use",): 2}, ("state",))
+        assert 'pool_connections{state="in_use"} 2' in registry.render().splitlines()
+
+    # 테스트 케이스 4: 같은 이름 중복 등록 불가
+    def test_duplicate_name(self):
+        registry = Registry()
+        registry.gauge("in_flight", "in flight")
+        with pytest.raises(ValueError):
+            registry.gauge("in_flight", "in flight")
+
+
+class TestMultiprocess:
+
+    # 테스트 케이스 1: 워커별 스냅샷 합산 (counter / gauge 는 값, histogram 은 버킷 / 합계 / 개수)
+    def test_merge(self):
+        lines = render_snapshot(merge_snapshots([worker_snapshot(2, 1, 0.05), worker_snapshot(3, 2, 0.5)])).splitlines()
+        assert 'requests_total{route="/a"} 5.0' in lines
+        assert "in_flight 3.0" in lines
+        assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{le="1.0"} 2' in lines
+        assert "latency_seconds_count 2" in lines
+
+    # 테스트 케이스 2: 응답하는 워커는 자기 최신 값 + 다른 워커 파일 합산
+    def test_render_multiprocess(self, tmp_path):
+        directory = str(tmp_path)
+        write_snapshot(directory, worker_snapshot(4, 1, 0.05), path=snapshot_path(directory, pid=101))
+        lines = render_multiprocess(directory, worker_snapshot(1, 1, 0.05)).splitlines()
+        assert 'requests_total{route="/a"} 5.0' in lines
+        assert "in_flight 2.0" in lines
+
+    # 테스트 케이스 3: 종료된 워커의 누적값은 archive 로 옮겨 합계가 줄지 않음 (gauge 는 버림)
+    def test_archive(self, tmp_path):
+        directory = str(tmp_path)
+        write_snapshot(directory, worker_snapshot(4, 3, 0.05), path=snapshot_path(directory, pid=101))
+        archive_snapshot(directory, 101)
+        archive_snapshot(directory, 102)  # 스냅샷을 쓰기 전에 죽은 워커
+        assert not (tmp_path / "101.json").exists()
+
+        lines = render_multiprocess(directory, worker_snapshot(1, 1, 0.05)).splitlines()
+        assert 'requests_total{route="/a"} 5.0' in lines
+        assert "in_flight 1.0" in lines
+        assert "latency_seconds_count 2" in lines
+
+
+class TestUpstreamTimer:
+
+    # 테스트 케이스 1: 예외가 나면 실패로 집계
+    async def test_error_counted(self):
+        errors = UPSTREAM_ERRORS.labels("test_upstream")
+        duration = UPSTREAM_REQUEST_DURATION.labels("test_upstream")
+        with pytest.raises(RuntimeError):
+            async with upstream_timer("test_upstream"):
+                raise RuntimeError("boom")
+        async with upstream_timer("test_upstream"):
+            pass
+        assert errors.value == 1
+        assert duration.count == 2
+
+    # 테스트 케이스 2: 모듈에 만들어 둔 Upstream 은 같은 자식 지표를 재사용 (호출마다 labels() 조회 없음)
+    async def test_bound_upstream(self):
+        duration = UPSTREAM_REQUEST_DURATION.labels("dictionary")
+        before = duration.count
+        async with DICTIONARY_UPSTREAM.timer(url="http://dictionary/apple") as timer:
+            assert timer.duration is duration
+        assert duration.count == before + 1
+
+
+class TestRequestMetricsMiddleware:
+
+    # 테스트 케이스 1: 경로 템플릿 / 상태 코드별 지연시간 기록
+    def test_route_latency(self):
+        app = FastAPI()
+        app.add_middleware(RequestMetricsMiddleware)
+
+        @app.get("/metrics-test/{item_id}")
+        async def item(item_id: int):
+            return {"id": item_id}
+
+        client = TestClient(app)
+        client.get("/metrics-test/1")
+        client.get("/metrics-test/2")
+        client.get("/metrics-test/not-a-number")
+
+        assert HTTP_REQUEST_DURATION.labels("GET", "/metrics-test/{item_id}", 200).count == 2
+        assert HTTP_REQUEST_DURATION.labels("GET", "/metrics-test/{item_id}", 422).count == 1
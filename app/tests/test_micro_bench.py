@@ -0,0 +1,58 @@
+from app.models.models import BookmarkWord
+from app.routers.bookmark import router as bookmark_router
+from app.routers.word_search import router as word_search_router, shape_word_details
+from app.services.bookmark_service import serialize_bookmark_words
+from benchmarks.micro import BENCHMARKS, make_dictionary_entry, measure, compare, route_renderer, run
+
+
+class TestHotPathFunctions:
+
+    # 테스트 케이스 1: 사전 응답 변환
+    def test_shape_word_details(self):
+        details = shape_word_details("apple", make_dictionary_entry("apple", 2))
+        assert details["pronunciation"] == "/apple/"
+        assert [d["part_of_speech"] for d in details["definitions"]] == ["noun", "verb", "adjective"]
+        assert details["example"] == "An example sentence using apple (0)."
+        assert shape_word_details("apple", [{}])["example"] == "No example available"
+
+    # 테스트 케이스 2: 단어장 목록 직렬화 (id 는 word_id 문자열)
+    def test_serialize_bookmark_words(self):
+        word = BookmarkWord(word="apple", user_id=1, definition="A fruit", example="I ate an apple.")
+        word.word_id = "0b6f7c8e-0000-4000-8000-000000000000"
+        assert serialize_bookmark_words([word]) == [
+            {"id": "0b6f7c8e-0000-4000-8000-000000000000", "word": "apple", "definition": "A fruit",
+             "example": "I ate an apple."}
+        ]
+
+    # 테스트 케이스 3: response_model 직렬화 + orjson 인코딩 결과
+    def test_route_renderer(self):
+        word = BookmarkWord(word="apple", user_id=1, definition=None, example="I ate an apple.")
+        word.word_id = "0b6f7c8e-0000-4000-8000-000000000000"
+        body = route_renderer(bookmark_router, "/bookmark/words/")(serialize_bookmark_words([word]))
+        assert body == b'[{"id":"0b6f7c8e-0000-4000-8000-000000000000","word":"apple","definition":null,' \
+                       b'"example":"I ate an apple."}]'
+
+        body = route_renderer(word_search_router, "/search/word")(shape_word_details("apple", make_dictionary_entry("apple", 1)))
+        assert body.startswith(b'{"word":"apple","definitions":[{"part_of_speech":"noun","definitions":[{"definition":')
+
+
+class TestMicroBenchmark:
+
+    # 테스트 케이스 1: 통계 형식
+    def test_measure(self):
+        stats = measure(lambda: sum(range(10)), warmup=0, repeat=3, min_time=0.001)
+        assert stats["repeat"] == 3
+        assert stats["loops"] >= 1
+        assert 0 < stats["min_us"] <= stats["median_us"]
+
+    # 테스트 케이스 2: 등록된 벤치마크가 모두 오프라인으로 실행됨
+    def test_all_benchmarks_run(self):
+        results = run(list(BENCHMARKS), [1], warmup=0, repeat=1, min_time=0)
+        assert set(results) == {f"{name}[1]" for name in BENCHMARKS}
+
+    # 테스트 케이스 3: 기준 대비 회귀 판정
+    def test_compare(self):
+        baseline = {"a[1]": {"median_us": 10.0}, "b[1]": {"median_us": 10.0}}
+        results = {"a[1]": {"median_us": 10.5}, "b[1]": {"median_us": 12.0}, "c[1]": {"median_us": 1.0}}
+        regressions = compare(results, baseline, threshold=10.0)
+        assert len(regressions) == 1 and regressions[0].startswith("b[1]")
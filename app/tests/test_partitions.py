@@ -0,0 +1,135 @@
+from datetime import date
+from types import SimpleNamespace
+
+from app.database.partitions import (
+    DEFAULT_PARTITION,
+    add_months,
+    drop_expired_partitions,
+    ensure_partitions,
+    month_start,
+    parse_partition_month,
+    partition_name,
+    retention_cutoff,
+)
+
+
+class FakeConnection:
+    """
+    실행한 SQL / 파라미터를 기록하는 연결
+    partitions: pg_inherits 조회 결과, default_rows: DEFAULT 파티션에 행이 있는 월(1일) 집합
+    """
+
+    def __init__(self, partitions=(), default_rows=()):
+        self.partitions = list(partitions)
+        self.default_rows = set(default_rows)
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        sql = " ".join(str(statement).split())
+        self.statements.append((sql, params))
+        if "FROM pg_inherits" in sql:
+            return SimpleNamespace(all=lambda: [(name,) for name in self.partitions])
+        if sql.startswith("SELECT EXISTS"):
+            return SimpleNamespace(scalar=lambda: params["start"] in self.default_rows)
+        return None
+
+    def ddl(self):
+        """조회를 제외한 실행 문장"""
+        return [(sql, params) for sql, params in self.statements if not sql.startswith("SELECT")]
+
+
+class TestPartitionNaming:
+
+    # 테스트 케이스 1: 월 더하기/빼기 (연도 경계 포함)
+    def test_add_months(self):
+        assert add_months(date(2024, 11, 1), 2) == date(2025, 1, 1)
+        assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+        assert add_months(date(2025, 3, 1), -12) == date(2024, 3, 1)
+
+    # 테스트 케이스 2: 해당 월 1일
+    def test_month_start(self):
+        assert month_start(date(2024, 11, 19)) == date(2024, 11, 1)
+
+    # 테스트 케이스 3: 파티션 이름 생성/해석
+    def test_partition_name_round_trip(self):
+        name = partition_name(date(2024, 3, 1))
+        assert name == "search_history_y2024m03"
+        assert parse_partition_month(name) == date(2024, 3, 1)
+
+    # 테스트 케이스 4: 규칙에 맞지 않는 테이블은 무시
+    def test_parse_ignores_other_tables(self):
+        assert parse_partition_month("search_history_legacy") is None
+        assert parse_partition_month("search_history_default") is None
+
+
+class TestEnsurePartitions:
+
+    # 테스트 케이스 1: 파티션이 없으면 DEFAULT 파티션과 이번 달 ~ months_ahead 개월 뒤 파티션 생성
+    async def test_create_all(self):
+        conn = FakeConnection()
+        created = await ensure_partitions(conn, months_ahead=2, today=date(2024, 11, 19))
+
+        assert created == [DEFAULT_PARTITION, "search_history_y2024m11", "search_history_y2024m12", "search_history_y2025m01"]
+        assert [sql for sql, _ in conn.ddl()] == [
+            'CREATE TABLE IF NOT EXISTS "search_history_default" PARTITION OF search_history DEFAULT',
+            'CREATE TABLE IF NOT EXISTS "search_history_y2024m11" PARTITION OF search_history '
+            "FOR VALUES FROM ('2024-11-01') TO ('2024-12-01')",
+            'CREATE TABLE IF NOT EXISTS "search_history_y2024m12" PARTITION OF search_history '
+            "FOR VALUES FROM ('2024-12-01') TO ('2025-01-01')",
+            'CREATE TABLE IF NOT EXISTS "search_history_y2025m01" PARTITION OF search_history '
+            "FOR VALUES FROM ('2025-01-01') TO ('2025-02-01')",
+        ]
+
+    # 테스트 케이스 2: 이미 있는 파티션은 건너뜀
+    async def test_existing_skipped(self):
+        conn = FakeConnection(partitions=[DEFAULT_PARTITION, "search_history_y2024m11"])
+        created = await ensure_partitions(conn, months_ahead=1, today=date(2024, 11, 19))
+        assert created == ["search_history_y2024m12"]
+        assert len(conn.ddl()) == 1
+
+    # 테스트 케이스 3: DEFAULT 파티션에 그 달의 행이 있으면 새 테이블로 옮긴 뒤 ATTACH
+    async def test_move_from_default(self):
+        conn = FakeConnection(partitions=[DEFAULT_PARTITION], default_rows={date(2024, 11, 1)})
+        created = await ensure_partitions(conn, months_ahead=1, today=date(2024, 11, 19))
+
+        assert created == ["search_history_y2024m11", "search_history_y2024m12"]
+        statements = conn.ddl()
+        assert statements[0][0] == (
+            'CREATE TABLE "search_history_y2024m11" (LIKE search_history INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+        )
+        assert statements[1][0] == (
+            'WITH moved AS (DELETE FROM "search_history_default" WHERE created_at >= :start AND created_at < :end '
+            'RETURNING *) INSERT INTO "search_history_y2024m11" SELECT * FROM moved'
+        )
+        assert statements[1][1] == {"start": date(2024, 11, 1), "end": date(2024, 12, 1)}
+        assert statements[2][0] == (
+            'ALTER TABLE search_history ATTACH PARTITION "search_history_y2024m11" '
+            "FOR VALUES FROM ('2024-11-01') TO ('2024-12-01')"
+        )
+        # 행이 없는 달은 바로 PARTITION OF 로 생성
+        assert statements[3][0].startswith('CREATE TABLE IF NOT EXISTS "search_history_y2024m12" PARTITION OF')
+
+
+class TestDropExpiredPartitions:
+
+    # 테스트 케이스 1: 보관 기간 시작 월 (연도 경계 포함)
+    def test_retention_cutoff(self):
+        assert retention_cutoff(date(2025, 2, 19), 3) == date(2024, 11, 1)
+        assert retention_cutoff(date(2025, 2, 1), 0) == date(2025, 2, 1)
+
+    # 테스트 케이스 2: 보관 기간 이전 월 파티션만 삭제, DEFAULT 파티션의 오래된 행은 DELETE
+    async def test_drop(self):
+        conn = FakeConnection(partitions=[
+            "search_history_y2024m10",
+            "search_history_y2024m11",
+            "search_history_y2025m02",
+            DEFAULT_PARTITION,
+            "search_history_legacy",
+        ])
+        dropped = await drop_expired_partitions(conn, retention_months=3, today=date(2025, 2, 19))
+
+        assert dropped == ["search_history_y2024m10"]
+        assert conn.ddl() == [
+            ('DROP TABLE IF EXISTS "search_history_y2024m10"', None),
+            ('DELETE FROM "search_history_default" WHERE created_at < :cutoff', {"cutoff": date(2024, 11, 1)}),
+        ]
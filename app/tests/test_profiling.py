@@ -0,0 +1,121 @@
+import asyncio
+import marshal
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.profiling import PROFILER_SAMPLING, FileProfileStore, ProfilingMiddleware, profile_store
+from app.routers.admin import router as admin_router
+from config.settings import settings
+
+ADMIN_TOKEN = "test-admin-token"
+
+
+def busy(seconds: float):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(settings, "admin_token", ADMIN_TOKEN)
+    monkeypatch.setattr(settings, "profiling_sample_rate", 0.0)
+    profile_store.clear()
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware)
+    app.include_router(admin_router)
+
+    @app.get("/profile-test/{item_id}")
+    async def item(item_id: int):
+        busy(0.03)
+        return {"id": item_id}
+
+    yield TestClient(app)
+    profile_store.clear()
+
+
+class TestProfilingMiddleware:
+
+    # 테스트 케이스 1: 헤더가 없거나 토큰이 틀리면 프로파일링하지 않음
+    def test_not_profiled(self, client):
+        assert "x-profile-id" not in client.get("/profile-test/1").headers
+        assert "x-profile-id" not in client.get("/profile-test/1", headers={"X-Profile": "wrong"}).headers
+        assert profile_store.list() == []
+
+    # 테스트 케이스 2: cProfile 결과를 관리자 API 로 조회 / 다운로드
+    def test_cprofile(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "profiling_profiler", "cprofile")
+        response = client.get("/profile-test/1", headers={"X-Profile": ADMIN_TOKEN})
+        assert response.json() == {"id": 1}
+        profile_id = response.headers["x-profile-id"]
+
+        admin = {"X-Admin-Token": ADMIN_TOKEN}
+        summary = client.get("/admin/profiles", headers=admin).json()["profiles"][0]
+        assert summary["route"] == "/profile-test/{item_id}"
+        assert summary["status"] == 200
+        assert summary["duration_ms"] >= 30
+
+        report = client.get(f"/admin/profiles/{profile_id}", headers=admin, params={"sort": "tottime"}).text
+        assert "busy" in report
+
+        raw = client.get(f"/admin/profiles/{profile_id}/raw", headers=admin).content
+        assert any(func[2] == "busy" for func in marshal.loads(raw))
+
+    # 테스트 케이스 3: 샘플링 프로파일러는 collapsed stacks 반환
+    def test_sampling(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "profiling_profiler", "sampling")
+        monkeypatch.setattr(settings, "profiling_sample_interval", 0.001)
+        monkeypatch.setattr(settings, "profiling_sample_rate", 1.0)
+        profile_id = client.get("/profile-test/1").headers["x-profile-id"]
+
+        stacks = client.get(f"/admin/profiles/{profile_id}", headers={"X-Admin-Token": ADMIN_TOKEN}).text
+        assert any(line.split(";")[-1].startswith("busy ") for line in stacks.splitlines())
+
+    # 테스트 케이스 4: 관리자 토큰 없이는 조회 불가
+    def test_admin_required(self, client, monkeypatch):
+        assert client.get("/admin/profiles").status_code == 403
+        assert client.get("/admin/profiles", headers={"X-Admin-Token": "wrong"}).status_code == 403
+        monkeypatch.setattr(settings, "admin_token", "")
+        assert client.get("/admin/profiles", headers={"X-Admin-Token": ""}).status_code == 403
+
+    # 테스트 케이스 5: 결과 저장은 이벤트 루프 스레드 밖에서 실행
+    def test_store_off_loop(self, client, monkeypatch):
+        on_loop = []
+        store_add = profile_store.add
+
+        def add(result):
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(True)
+            except RuntimeError:
+                on_loop.append(False)
+            store_add(result)
+
+        monkeypatch.setattr(profile_store, "add", add)
+        profile_id = client.get("/profile-test/1", headers={"X-Profile": ADMIN_TOKEN}).headers["x-profile-id"]
+        assert on_loop == [False]
+        assert profile_store.get(profile_id) is not None
+
+
+class TestFileProfileStore:
+
+    # 테스트 케이스 1: 다른 워커(인스턴스)가 저장한 결과도 조회, 최대 개수를 넘으면 오래된 것부터 삭제
+    def test_shared(self, tmp_path):
+        writer = FileProfileStore(2, str(tmp_path))
+        reader = FileProfileStore(2, str(tmp_path))
+        ids = []
+        for i in range(3):
+            result = writer.new("GET", f"/words/{i}", PROFILER_SAMPLING)
+            result.created_at += i
+            result.data = f"main;busy {i}"
+            writer.add(result)
+            ids.append(result.id)
+
+        assert [summary["id"] for summary in reader.list()] == [ids[2], ids[1]]
+        assert reader.get(ids[0]) is None
+        assert reader.get(ids[2]).render() == "main;busy 2"
+        reader.clear()
+        assert writer.list() == []
@@ -0,0 +1,264 @@
+import asyncio
+import json
+import uuid
+from datetime import datetime, time, timedelta
+
+import pytest
+from sqlalchemy import delete, insert, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.database.db import AsyncSessionLocal
+from app.database.partitions import DEFAULT_PARTITION, ensure_partitions, month_start, parse_partition_month, partition_name
+from app.models.models import User, BookmarkWord, SearchHistory, SearchHistorySummary
+from app.services.bookmark_service import (
+    bookmark_words_by_user_query,
+    bookmark_word_query,
+    search_bookmark_words_query,
+    search_history_entry_query,
+)
+from app.services.user_service import user_by_kakao_id_query, search_history_page_query, search_history_summary_page_query
+
+# 시드 데이터 규모 (다른 테스트 데이터와 겹치지 않도록 큰 ID 사용)
+# 대상 사용자의 행이 전체의 1% 이하가 되도록 해서, 인덱스 사용 여부를 실제 통계(ANALYZE)로 판단하게 함
+# (users 는 몇 페이지짜리 테이블이면 Seq Scan 이 더 싸므로 단어/기록이 없는 사용자도 넣음)
+BASE_USER_ID = 900000
+USER_COUNT = 2000
+ACTIVE_USER_COUNT = 100  # 단어 / 검색 기록이 있는 사용자 수
+WORDS_PER_USER = 50
+HISTORY_PER_USER = 300
+TARGET_USER_ID = BASE_USER_ID + 1
+TARGET_WORD_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+# 검색 기록은 이번 달 파티션에만 넣음 (비어 있는 다른 월 파티션의 계획은 확인하지 않음)
+SEED_TIME = datetime.combine(month_start(datetime.utcnow().date()).replace(day=15), time(12))
+SEARCH_HISTORY_PARTITION = partition_name(month_start(SEED_TIME.date()))
+
+# 인덱스 기반 접근 노드
+INDEX_SCAN_NODES = {"Index Scan", "Index Only Scan", "Bitmap Heap Scan"}
+
+# 서비스 쿼리 목록: (이름, 쿼리 생성 함수, 확인할 테이블, 사용해야 하는 인덱스(이름 끝부분, None 이면 아무 인덱스), 인덱스 순서로 정렬)
+# 파티션 인덱스 이름은 "<파티션>_user_id_created_at_idx" 처럼 자동 생성되므로 끝부분으로 비교
+SERVICE_QUERIES = [
+    ("bookmark_words_by_user", lambda: bookmark_words_by_user_query(TARGET_USER_ID),
+     "bookmark_words", "bookmark_words_user_id_word_key", False),
+    ("bookmark_word", lambda: bookmark_word_query(TARGET_WORD_ID, TARGET_USER_ID),
+     "bookmark_words", "bookmark_words_pkey", False),
+    ("search_bookmark_words", lambda: search_bookmark_words_query(TARGET_USER_ID, "fruit", 1, 10),
+     "bookmark_words", None, False),
+    ("search_history_entry", lambda: search_history_entry_query(1, TARGET_USER_ID),
+     SEARCH_HISTORY_PARTITION, "_pkey", False),
+    ("delete_all_bookmark_words", lambda: delete(BookmarkWord).where(BookmarkWord.user_id == TARGET_USER_ID),
+     "bookmark_words", "bookmark_words_user_id_word_key", False),
+    ("delete_all_search_history", lambda: delete(SearchHistory).where(SearchHistory.user_id == TARGET_USER_ID),
+     SEARCH_HISTORY_PARTITION, "_user_id_created_at_idx", False),
+    ("delete_all_search_history_summary",
+     lambda: delete(SearchHistorySummary).where(SearchHistorySummary.user_id == TARGET_USER_ID),
+     "search_history_summary", None, False),
+    ("user_by_kakao_id", lambda: user_by_kakao_id_query(BASE_USER_ID + 1),
+     "users", "users_kakao_id_key", False),
+    ("search_history_page", lambda: search_history_page_query(TARGET_USER_ID, month_start(SEED_TIME.date()), 20),
+     SEARCH_HISTORY_PARTITION, "_user_id_created_at_idx", True),
+    ("search_history_summary_recent", lambda: search_history_summary_page_query(TARGET_USER_ID, 1, 10, "recent"),
+     "search_history_summary", "search_history_summary_user_id_last_searched_at_idx", True),
+    # 두 번째 정렬 키(last_searched_at)는 Incremental Sort 로 처리 (search_count 순서는 인덱스에서)
+    ("search_history_summary_frequency",
+     lambda: search_history_summary_page_query(TARGET_USER_ID, 1, 10, "frequency"),
+     "search_history_summary", "search_history_summary_user_id_search_count_idx", True),
+]
+
+# 월 범위로 제한한 쿼리: 해당 월 파티션 외의 search_history 파티션(DEFAULT 포함)은 계획에 없어야 함
+SINGLE_PARTITION_QUERIES = {"search_history_page"}
+
+# DB 연결 확인 결과 (모듈에서 한 번만 확인)
+_postgres_available = {}
+
+
+def plan_scans(plan: dict):
+    """
+    실행 계획 트리의 테이블 접근 노드 목록: (노드 종류, 테이블 이름, 사용한 인덱스 이름 목록)
+    Bitmap Heap Scan 은 하위 Bitmap Index Scan 들의 인덱스를 함께 반환
+    """
+    scans = []
+    if "Relation Name" in plan:
+        if plan["Node Type"] == "Bitmap Heap Scan":
+            indexes = bitmap_indexes(plan)
+        else:
+            indexes = [plan["Index Name"]] if "Index Name" in plan else []
+        scans.append((plan["Node Type"], plan["Relation Name"], indexes))
+    for child in plan.get("Plans", []):
+        scans.extend(plan_scans(child))
+    return scans
+
+
+def bitmap_indexes(plan: dict):
+    """Bitmap Heap Scan 아래 Bitmap Index Scan (BitmapAnd / BitmapOr 포함) 의 인덱스 이름"""
+    indexes = []
+    for child in plan.get("Plans", []):
+        if child["Node Type"] == "Bitmap Index Scan":
+            indexes.append(child["Index Name"])
+        elif child["Node Type"] in ("BitmapAnd", "BitmapOr"):
+            indexes.extend(bitmap_indexes(child))
+    return indexes
+
+
+def sorted_relations(plan: dict):
+    """Sort 노드 아래에서 읽는 테이블 이름 집합 (인덱스 순서로 읽지 못하고 따로 정렬하는 테이블)"""
+    relations = set()
+    if plan.get("Node Type") == "Sort":
+        relations.update(relation for _, relation, _ in plan_scans(plan))
+    for child in plan.get("Plans", []):
+        relations.update(sorted_relations(child))
+    return relations
+
+
+@pytest.fixture
+async def postgres_available():
+    """Postgres 에 연결할 수 없으면 DB 가 필요한 테스트는 건너뜀"""
+    if "ok" not in _postgres_available:
+        try:
+            async with AsyncSessionLocal() as session:
+                await asyncio.wait_for(session.execute(text("SELECT 1")), timeout=5)
+            _postgres_available["ok"] = True
+        except (OSError, SQLAlchemyError, asyncio.TimeoutError):
+            _postgres_available["ok"] = False
+    if not _postgres_available["ok"]:
+        pytest.skip("PostgreSQL is not reachable")
+
+
+@pytest.fixture(scope="function")
+async def seeded_db(postgres_available):
+    """
+    시드 데이터를 넣고 통계를 갱신한 세션 (테스트 후 롤백)
+    플래너 설정은 바꾸지 않으므로 실제 통계로 고른 계획을 확인합니다.
+    """
+    async with AsyncSessionLocal() as session:
+        await session.begin()
+        user_ids = range(BASE_USER_ID, BASE_USER_ID + USER_COUNT)
+        active_user_ids = range(BASE_USER_ID, BASE_USER_ID + ACTIVE_USER_COUNT)
+
+        await ensure_partitions(await session.connection(), months_ahead=0, today=SEED_TIME.date())
+        await session.execute(insert(User), [
+            {"id": user_id, "kakao_id": user_id, "nickname": f"user{user_id}", "email": f"{user_id}@example.com"}
+            for user_id in user_ids
+        ])
+        await session.execute(insert(BookmarkWord), [
+            {
+                "word_id": TARGET_WORD_ID if (user_id, i) == (TARGET_USER_ID, 0) else uuid.uuid4(),
+                "user_id": user_id,
+                "word": f"word{i}",
+                "definition": f"definition {i} of a fruit" if i % 5 == 0 else f"definition {i}",
+                "example": f"example sentence {i}",
+            }
+            for user_id in active_user_ids
+            for i in range(WORDS_PER_USER)
+        ])
+        await session.execute(insert(SearchHistory), [
+            {"user_id": user_id, "word": f"word{i}", "created_at": SEED_TIME - timedelta(seconds=i)}
+            for user_id in active_user_ids
+            for i in range(HISTORY_PER_USER)
+        ])
+        await session.execute(insert(SearchHistorySummary), [
+            {
+                "user_id": user_id,
+                "word": f"word{i}",
+                "search_count": i % 7 + 1,
+                "last_searched_at": SEED_TIME - timedelta(seconds=i),
+            }
+            for user_id in active_user_ids
+            for i in range(HISTORY_PER_USER)
+        ])
+        # 시드 후 통계 갱신 (파티션 테이블은 하위 파티션까지 분석)
+        await session.execute(text("ANALYZE users"))
+        await session.execute(text("ANALYZE bookmark_words"))
+        await session.execute(text("ANALYZE search_history"))
+        await session.execute(text("ANALYZE search_history_summary"))
+        yield session
+        await session.rollback()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "name, build_query, relation, index, ordered", SERVICE_QUERIES, ids=[case[0] for case in SERVICE_QUERIES]
+)
+async def test_service_query_plan(seeded_db, name, build_query, relation, index, ordered):
+    """
+    서비스 쿼리가 대상 테이블을 인덱스로 읽는지, 정렬이 필요한 쿼리는 인덱스 순서로 읽어 Sort 노드가 없는지 확인
+    """
+    conn = await seeded_db.connection()
+    compiled = build_query().compile(dialect=conn.dialect)
+    params = tuple(compiled.params[key] for key in compiled.positiontup)
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params)
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    plan = plan[0]["Plan"]
+
+    scans = [(node_type, indexes) for node_type, scanned, indexes in plan_scans(plan) if scanned == relation]
+    assert scans, f"{name} 쿼리 계획에 {relation} 접근이 없습니다: {plan_scans(plan)}"
+    for node_type, indexes in scans:
+        assert node_type in INDEX_SCAN_NODES, f"{name} 쿼리가 {relation} 을 {node_type} 로 읽습니다"
+        if index is not None:
+            assert any(used.endswith(index) for used in indexes), f"{name} 쿼리가 {index} 대신 {indexes} 사용"
+    if ordered:
+        assert relation not in sorted_relations(plan), f"{name} 쿼리가 {relation} 을 읽은 뒤 따로 정렬합니다"
+    if name in SINGLE_PARTITION_QUERIES:
+        partitions = {
+            scanned for _, scanned, _ in plan_scans(plan)
+            if scanned == DEFAULT_PARTITION or parse_partition_month(scanned) is not None
+        }
+        assert partitions == {relation}, f"{name} 쿼리가 다른 파티션도 읽습니다: {sorted(partitions)}"
+
+
+class TestPlanHelpers:
+
+    # 테스트 케이스 1: 테이블 접근 노드와 사용한 인덱스 (Bitmap 은 하위 인덱스 포함)
+    def test_plan_scans(self):
+        plan = {
+            "Node Type": "Nested Loop",
+            "Plans": [
+                {"Node Type": "Index Scan", "Relation Name": "users", "Index Name": "users_pkey"},
+                {
+                    "Node Type": "Bitmap Heap Scan",
+                    "Relation Name": "bookmark_words",
+                    "Plans": [{
+                        "Node Type": "BitmapOr",
+                        "Plans": [
+                            {"Node Type": "Bitmap Index Scan", "Index Name": "bookmark_words_word_trgm_idx"},
+                            {"Node Type": "Bitmap Index Scan", "Index Name": "bookmark_words_search_vector_idx"},
+                        ],
+                    }],
+                },
+                {"Node Type": "Seq Scan", "Relation Name": "search_history_summary"},
+            ],
+        }
+        assert plan_scans(plan) == [
+            ("Index Scan", "users", ["users_pkey"]),
+            ("Bitmap Heap Scan", "bookmark_words",
+             ["bookmark_words_word_trgm_idx", "bookmark_words_search_vector_idx"]),
+            ("Seq Scan", "search_history_summary", []),
+        ]
+
+    # 테스트 케이스 2: Sort 아래에서 읽는 테이블만 정렬 대상 (Incremental Sort 는 인덱스 순서를 이용)
+    def test_sorted_relations(self):
+        plan = {
+            "Node Type": "Limit",
+            "Plans": [{
+                "Node Type": "Append",
+                "Plans": [
+                    {
+                        "Node Type": "Sort",
+                        "Plans": [{"Node Type": "Seq Scan", "Relation Name": "search_history_y2024m12"}],
+                    },
+                    {
+                        "Node Type": "Incremental Sort",
+                        "Plans": [{
+                            "Node Type": "Index Scan",
+                            "Scan Direction": "Backward",
+                            "Relation Name": "search_history_summary",
+                            "Index Name": "search_history_summary_user_id_search_count_idx",
+                        }],
+                    },
+                ],
+            }],
+        }
+        assert sorted_relations(plan) == {"search_history_y2024m12"}
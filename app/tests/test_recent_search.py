@@ -0,0 +1,223 @@
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database.redis_client import get_redis
+from app.services.recent_search_service import (
+    BACKFILL_RECENT_SEARCHES_SCRIPT,
+    RECENT_SEARCH_LIMIT,
+    RECENT_SEARCH_TTL,
+    get_recent_searches,
+    push_recent_search,
+    recent_searches_key,
+)
+from app.services.user_service import SEARCH_HISTORY_LOG
+from config.settings import settings
+from dependencies import get_current_user
+from main import app
+
+
+class FakePipeline:
+    """명령을 모았다가 execute() 에서 순서대로 실행"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self.commands.append((name, args))
+            return self
+        return queue
+
+    async def execute(self):
+        return [getattr(self.redis, name)(*args) for name, args in self.commands]
+
+
+class FakeBackfillScript:
+    """BACKFILL_RECENT_SEARCHES_SCRIPT 와 같은 동작 (리스트가 없을 때만 채움)"""
+
+    async def __call__(self, keys, args, client):
+        key, (ttl, *entries) = keys[0], args
+        if key in client.lists:
+            return 0
+        client.rpush(key, *entries)
+        client.expire(key, ttl)
+        return 1
+
+
+class FakeRedis:
+    """최근 검색어 서비스가 쓰는 리스트 명령만 구현한 Redis"""
+
+    def __init__(self):
+        self.lists = {}
+        self.ttls = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def register_script(self, script):
+        assert script == BACKFILL_RECENT_SEARCHES_SCRIPT
+        return FakeBackfillScript()
+
+    def lpushx(self, key, value):
+        if key not in self.lists:
+            return 0
+        self.lists[key].insert(0, value)
+        return len(self.lists[key])
+
+    def rpush(self, key, *values):
+        self.lists.setdefault(key, []).extend(values)
+        return len(self.lists[key])
+
+    def ltrim(self, key, start, end):
+        if key in self.lists:
+            self.lists[key] = self.lists[key][start:end + 1]
+
+    def expire(self, key, seconds):
+        if key not in self.lists:
+            return False
+        self.ttls[key] = seconds
+        return True
+
+    async def delete(self, key):
+        self.ttls.pop(key, None)
+        return int(self.lists.pop(key, None) is not None)
+
+    async def lrange(self, key, start, end):
+        return self.lists.get(key, [])[start:end + 1]
+
+
+class FakeSession:
+    """
+    검색 기록 조회 결과만 돌려주는 DB 세션 (on_query: 첫 조회 직후 실행할 동작)
+    기록은 모두 이번 달 것이므로 첫 조회(이번 달)에만 반환하고 이전 달 조회는 빈 결과
+    """
+
+    def __init__(self, records, on_query=None):
+        self.records = records
+        self.queries = 0
+        self.on_query = on_query
+
+    async def execute(self, query):
+        self.queries += 1
+        if self.on_query and self.queries == 1:
+            await self.on_query()
+        records = self.records if self.queries == 1 else []
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: records))
+
+
+def history(words):
+    """최신순 검색 기록 (첫 번째가 가장 최근)"""
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    return [SimpleNamespace(word=word, created_at=now - timedelta(minutes=i)) for i, word in enumerate(words)]
+
+
+@pytest.fixture(autouse=True)
+def log_mode(monkeypatch):
+    monkeypatch.setattr(settings, "search_history_mode", SEARCH_HISTORY_LOG)
+
+
+class TestRecentSearches:
+
+    # 테스트 케이스 1: 리스트 앞에 추가, RECENT_SEARCH_LIMIT 개로 자르고 만료 시간 갱신
+    async def test_push_trim_expire(self):
+        redis = FakeRedis()
+        key = recent_searches_key(1)
+        redis.lists[key] = []
+        for i in range(RECENT_SEARCH_LIMIT + 5):
+            await push_recent_search(redis, 1, f"word{i}")
+        words = [json.loads(entry)["word"] for entry in redis.lists[key]]
+        assert words == [f"word{i}" for i in reversed(range(5, RECENT_SEARCH_LIMIT + 5))]
+        assert redis.ttls[key] == RECENT_SEARCH_TTL
+
+    # 테스트 케이스 2: 캐시 미스면 DB 에서 조회해 채우고, 다음 조회는 Redis 에서 응답
+    async def test_miss_backfill(self):
+        redis, db = FakeRedis(), FakeSession(history(["apple", "banana", "cherry"]))
+        records = await get_recent_searches(1, redis, db)
+        assert [record["word"] for record in records] == ["apple", "banana", "cherry"]
+        assert redis.ttls[recent_searches_key(1)] == RECENT_SEARCH_TTL
+
+        queries = db.queries
+        records = await get_recent_searches(1, redis, db, limit=2)
+        assert [record["word"] for record in records] == ["apple", "banana"]
+        assert db.queries == queries
+
+    # 테스트 케이스 3: 리스트가 만료된 뒤 검색해도 한 개짜리 리스트를 만들지 않음 (이전 기록이 잘리지 않음)
+    async def test_push_after_expiry_keeps_history(self):
+        redis = FakeRedis()
+        await push_recent_search(redis, 1, "durian")
+        assert recent_searches_key(1) not in redis.lists
+
+        # 검색 기록은 DB 에 먼저 저장되므로 backfill 에 새 검색어와 이전 기록이 모두 포함됨
+        db = FakeSession(history(["durian", "apple", "banana"]))
+        records = await get_recent_searches(1, redis, db)
+        assert [record["word"] for record in records] == ["durian", "apple", "banana"]
+
+    # 테스트 케이스 4: 기록이 없는 사용자는 빈 목록 (Redis 에 키를 만들지 않음)
+    async def test_empty_history(self):
+        redis = FakeRedis()
+        assert await get_recent_searches(1, redis, FakeSession([])) == []
+        assert redis.lists == {}
+
+    # 테스트 케이스 5: DB 조회 중 다른 요청이 리스트를 채우고 검색어를 추가했으면 덮어쓰지 않음
+    async def test_backfill_does_not_overwrite(self):
+        redis = FakeRedis()
+        key = recent_searches_key(1)
+
+        async def concurrent_backfill_and_push():
+            redis.rpush(key, json.dumps({"word": "apple", "searched_at": "2026-01-01T11:59:00"}))
+            await push_recent_search(redis, 1, "durian")
+
+        db = FakeSession(history(["apple"]), on_query=concurrent_backfill_and_push)
+        await get_recent_searches(1, redis, db)
+        assert [json.loads(entry)["word"] for entry in redis.lists[key]] == ["durian", "apple"]
+
+
+class TestRecentSearchInvalidation:
+
+    @pytest.fixture
+    def redis(self, override_get_db):
+        """로그인 사용자(id=1)의 최근 검색어가 채워진 Redis"""
+        redis = FakeRedis()
+        redis.lists[recent_searches_key(1)] = [json.dumps({"word": "apple", "searched_at": "2026-01-01T12:00:00"})]
+        app.dependency_overrides[get_redis] = lambda: redis
+        app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=1)
+        yield redis
+        app.dependency_overrides.pop(get_redis)
+        app.dependency_overrides.pop(get_current_user)
+
+    # 테스트 케이스 1: 검색 기록 하나를 삭제하면 최근 검색어 리스트 삭제
+    def test_delete_single(self, redis, override_get_db):
+        result = MagicMock()
+        result.scalars.return_value.first.return_value = SimpleNamespace(id=5)
+        override_get_db.execute.return_value = result
+
+        assert TestClient(app).delete("/bookmark/words/history/5").status_code == 200
+        assert recent_searches_key(1) not in redis.lists
+
+    # 테스트 케이스 2: 전체 삭제해도 최근 검색어 리스트 삭제
+    def test_delete_all(self, redis, override_get_db):
+        override_get_db.execute.return_value = MagicMock(rowcount=1)
+
+        assert TestClient(app).delete("/bookmark/words/remove").status_code == 200
+        assert recent_searches_key(1) not in redis.lists
+
+    # 테스트 케이스 3: 삭제할 기록이 없으면 리스트는 그대로
+    def test_not_found(self, redis, override_get_db):
+        result = MagicMock()
+        result.scalars.return_value.first.return_value = None
+        override_get_db.execute.return_value = result
+
+        assert TestClient(app).delete("/bookmark/words/history/5").status_code == 404
+        assert recent_searches_key(1) in redis.lists
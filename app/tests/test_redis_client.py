@@ -0,0 +1,42 @@
+import pytest
+
+from app.database import redis_client
+from app.database.redis_client import RedisMetrics, InstrumentedPipeline, init_redis, close_redis, get_redis_client
+
+
+class TestRedisMetrics:
+
+    # 테스트 케이스 1: 명령 횟수 / 실패 / 지연시간 집계
+    def test_observe(self):
+        metrics = RedisMetrics()
+        metrics.observe(0.002)
+        metrics.observe(0.004, failed=True)
+        snapshot = metrics.snapshot()
+        assert snapshot["commands"] == 2
+        assert snapshot["errors"] == 1
+        assert snapshot["avg_ms"] == 3.0
+        assert snapshot["max_ms"] == 4.0
+
+    # 테스트 케이스 2: 파이프라인은 왕복 1회로 집계하고 포함된 명령 수는 따로 기록
+    def test_observe_pipeline(self):
+        metrics = RedisMetrics()
+        metrics.observe(0.001, pipelined=3)
+        snapshot = metrics.snapshot()
+        assert snapshot["commands"] == 1
+        assert snapshot["pipelines"] == 1
+        assert snapshot["pipelined_commands"] == 3
+
+
+class TestSharedClient:
+
+    # 테스트 케이스 1: 같은 커넥션 풀을 공유하는 단일 클라이언트
+    @pytest.mark.asyncio
+    async def test_shared_client(self):
+        client = init_redis()
+        assert get_redis_client() is client
+        assert init_redis() is client
+        assert isinstance(client.pipeline(), InstrumentedPipeline)
+        assert redis_client.pool_stats()["in_use"] == 0
+
+        await close_redis()
+        assert redis_client._client is None
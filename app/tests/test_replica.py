@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+
+from app.database.replica import ReplicaLagMonitor, request_user_id, recent_write_key
+from app.utils.utils import create_jwt_token
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar(self):
+        return self.value
+
+
+class FakeConnection:
+    def __init__(self, engine):
+        self.engine = engine
+
+    async def __aenter__(self):
+        if self.engine.error:
+            raise ConnectionError("replica down")
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement):
+        self.engine.queries += 1
+        return FakeResult(self.engine.lag)
+
+
+class FakeEngine:
+    def __init__(self, lag=0.0, error=False):
+        self.lag = lag
+        self.error = error
+        self.queries = 0
+
+    def connect(self):
+        return FakeConnection(self)
+
+
+class TestReplicaLagMonitor:
+
+    # 테스트 케이스 1: 지연이 허용 범위 안이면 replica 사용, 주기 안에서는 다시 조회하지 않음
+    async def test_usable_and_cached(self):
+        engine = FakeEngine(lag=0.5)
+        monitor = ReplicaLagMonitor(engine, max_lag=5, check_interval=60)
+        assert await monitor.is_usable()
+        assert await monitor.is_usable()
+        assert engine.queries == 1
+
+    # 테스트 케이스 2: 지연이 크면 primary 로
+    async def test_lagging_replica(self):
+        monitor = ReplicaLagMonitor(FakeEngine(lag=30), max_lag=5, check_interval=60)
+        assert not await monitor.is_usable()
+
+    # 테스트 케이스 3: replica 에 연결할 수 없으면 primary 로
+    async def test_unreachable_replica(self):
+        monitor = ReplicaLagMonitor(FakeEngine(error=True), max_lag=5, check_interval=60)
+        assert not await monitor.is_usable()
+        assert monitor.lag is None
+
+
+class TestRequestUserId:
+
+    # 테스트 케이스 1: Bearer 토큰의 사용자 ID
+    def test_bearer_token(self):
+        token = create_jwt_token({"user_id": 7, "kakao_id": 123})
+        request = SimpleNamespace(headers={"authorization": f"Bearer {token}"})
+        assert request_user_id(request) == 7
+
+    # 테스트 케이스 2: 토큰이 없거나 잘못된 경우
+    def test_missing_or_invalid_token(self):
+        assert request_user_id(SimpleNamespace(headers={})) is None
+        assert request_user_id(SimpleNamespace(headers={"authorization": "Bearer invalid"})) is None
+
+    # 테스트 케이스 3: 키 형식
+    def test_recent_write_key(self):
+        assert recent_write_key(7) == "recent_write:7"
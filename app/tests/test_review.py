@@ -0,0 +1,46 @@
+import pytest
+from app.services.review_service import calculate_sm2, review_queue_key, MIN_EASE_FACTOR
+
+
+class TestCalculateSM2:
+
+    # 테스트 케이스 1: 첫 정답은 1일 뒤 복습
+    def test_first_correct_answer(self):
+        repetitions, interval_days, ease_factor = calculate_sm2(5, 0, 0, 2.5)
+        assert repetitions == 1
+        assert interval_days == 1
+        assert ease_factor == pytest.approx(2.6)
+
+    # 테스트 케이스 2: 두 번째 정답은 6일 뒤 복습
+    def test_second_correct_answer(self):
+        repetitions, interval_days, _ = calculate_sm2(4, 1, 1, 2.5)
+        assert repetitions == 2
+        assert interval_days == 6
+
+    # 테스트 케이스 3: 이후에는 간격 * 난이도 계수
+    def test_interval_grows_with_ease_factor(self):
+        repetitions, interval_days, ease_factor = calculate_sm2(4, 2, 6, 2.5)
+        assert repetitions == 3
+        assert interval_days == 15
+        assert ease_factor == pytest.approx(2.5)
+
+    # 테스트 케이스 4: 틀리면 처음부터 다시
+    def test_wrong_answer_resets(self):
+        repetitions, interval_days, ease_factor = calculate_sm2(1, 5, 40, 2.5)
+        assert repetitions == 0
+        assert interval_days == 1
+        assert ease_factor < 2.5
+
+    # 테스트 케이스 5: 난이도 계수는 최소값 아래로 내려가지 않음
+    def test_ease_factor_floor(self):
+        _, _, ease_factor = calculate_sm2(0, 0, 0, MIN_EASE_FACTOR)
+        assert ease_factor == MIN_EASE_FACTOR
+
+    # 테스트 케이스 6: 점수 범위 검증
+    def test_invalid_quality(self):
+        with pytest.raises(ValueError):
+            calculate_sm2(6, 0, 0, 2.5)
+
+
+def test_review_queue_key():
+    assert review_queue_key(1) == "review_queue:1"
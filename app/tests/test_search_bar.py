@@ -1,6 +1,7 @@
 import pytest
 from fastapi.testclient import TestClient
 from main import app  # FastAPI 앱을 임포트합니다
+from app.services.suggestion_service import SuggestionIndex, load_suggestion_index
 
 client = TestClient(app)
 
@@ -44,3 +45,26 @@ class TestWordSearchBar:
         assert "detail" in data
         assert "String should have at least 1 character" in data["detail"][0]["msg"]
 
+
+
+class TestSuggestionIndex:
+
+    # 테스트 케이스 1: 접두사 범위를 사전순으로 반환 (대소문자 무시, 중복 제거)
+    def test_suggest(self):
+        index = SuggestionIndex(["banana", "Apple", "application", "apple", "apply", "band"])
+        assert index.suggest("ap") == ["apple", "application", "apply"]
+        assert index.suggest("AP", limit=2) == ["apple", "application"]
+        assert index.suggest("band") == ["band"]
+        assert index.suggest("z") == []
+        assert len(index) == 5
+
+    # 테스트 케이스 2: 단어 파일을 기본 단어와 합쳐서 로드
+    def test_load_words_file(self, tmp_path):
+        path = tmp_path / "words.txt"
+        path.write_text("zebra\nzero\n")
+        index = load_suggestion_index(str(path))
+        try:
+            assert index.suggest("ze") == ["zebra", "zero"]
+            assert "apple" in index.suggest("a")
+        finally:
+            load_suggestion_index("")
@@ -0,0 +1,195 @@
+from datetime import date, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from app.database.partitions import add_months, month_start
+from app.database.redis_client import get_redis
+from app.models.models import SearchHistory
+from app.services.user_service import (
+    SEARCH_HISTORY_DEDUP,
+    SEARCH_HISTORY_LOG,
+    fetch_search_history_page,
+    record_search_history,
+)
+from config.settings import settings
+from dependencies import get_current_user
+from main import app
+
+
+def compile_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+class FakeSession:
+    """실행한 문장 / 추가한 객체만 기록하는 DB 세션"""
+
+    def __init__(self):
+        self.statements = []
+        self.added = []
+        self.commits = 0
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def commit(self):
+        self.commits += 1
+
+
+@pytest.fixture
+def client(override_get_db):
+    """인증된 사용자(id=7)로 요청하는 클라이언트 (DB 세션은 conftest 의 mock, Redis 도 mock)"""
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = [
+        SimpleNamespace(to_dict=lambda: {"word": "apple"}),
+    ]
+    override_get_db.execute.return_value = result
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=7)
+    app.dependency_overrides[get_redis] = lambda: AsyncMock()
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_current_user)
+    app.dependency_overrides.pop(get_redis)
+
+
+def executed_sql(session) -> str:
+    return compile_sql(session.execute.call_args.args[0])
+
+
+class TestSearchHistoryRoute:
+
+    # 테스트 케이스 1: 로그인하지 않으면 조회할 수 없음
+    def test_requires_login(self):
+        assert TestClient(app).get("/search/history").status_code == 401
+
+    # 테스트 케이스 2: 로그 모드는 로그인 사용자의 기록을 이번 달 파티션 범위부터 최신순으로 조회
+    def test_log_mode_recent(self, client, override_get_db, monkeypatch):
+        monkeypatch.setattr(settings, "search_history_mode", SEARCH_HISTORY_LOG)
+        response = client.get("/search/history", params={"page": 1, "page_size": 1})
+        assert response.json() == {"records": [{"word": "apple"}]}
+        sql = executed_sql(override_get_db)
+        month = month_start(datetime.utcnow().date())
+        assert "search_history.user_id = 7" in sql
+        assert f"search_history.created_at >= '{month.isoformat()} 00:00:00'" in sql
+        assert f"search_history.created_at < '{add_months(month, 1).isoformat()} 00:00:00'" in sql
+        assert "ORDER BY search_history.created_at DESC" in sql
+        assert "LIMIT 1" in sql
+        assert override_get_db.execute.await_count == 1
+
+    # 테스트 케이스 3: 중복 제거 모드는 많이 검색한 순 정렬 지원
+    def test_dedup_mode_frequency(self, client, override_get_db, monkeypatch):
+        monkeypatch.setattr(settings, "search_history_mode", SEARCH_HISTORY_DEDUP)
+        assert client.get("/search/history", params={"order_by": "frequency"}).status_code == 200
+        sql = executed_sql(override_get_db)
+        assert "search_history_summary.user_id = 7" in sql
+        assert "ORDER BY search_history_summary.search_count DESC, search_history_summary.last_searched_at DESC" in sql
+
+    # 테스트 케이스 4: 로그 모드에서는 많이 검색한 순 정렬 불가
+    def test_log_mode_frequency(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "search_history_mode", SEARCH_HISTORY_LOG)
+        assert client.get("/search/history", params={"order_by": "frequency"}).status_code == 400
+
+
+class TestDeleteAllSearchHistory:
+
+    @staticmethod
+    def deleted(*rowcounts):
+        """DELETE 문마다 삭제된 행 수를 돌려주는 실행 결과"""
+        return [MagicMock(rowcount=rowcount) for rowcount in rowcounts]
+
+    # 테스트 케이스 1: 중복 제거 모드 (로그 테이블은 비어 있음) 에서도 요약 기록까지 삭제
+    def test_dedup_mode(self, client, override_get_db, monkeypatch):
+        monkeypatch.setattr(settings, "search_history_mode", SEARCH_HISTORY_DEDUP)
+        override_get_db.execute.side_effect = self.deleted(0, 3)
+
+        response = client.delete("/bookmark/words/remove")
+        assert response.status_code == 200
+        statements = [compile_sql(call.args[0]) for call in override_get_db.execute.call_args_list]
+        assert statements == [
+            "DELETE FROM search_history WHERE search_history.user_id = 7",
+            "DELETE FROM search_history_summary WHERE search_history_summary.user_id = 7",
+        ]
+        override_get_db.commit.assert_awaited_once()
+
+    # 테스트 케이스 2: 두 테이블 모두 삭제된 행이 없으면 404
+    def test_nothing_deleted(self, client, override_get_db):
+        override_get_db.execute.side_effect = self.deleted(0, 0)
+        assert client.delete("/bookmark/words/remove").status_code == 404
+        override_get_db.commit.assert_not_called()
+
+
+class TestFetchSearchHistoryPage:
+
+    @staticmethod
+    def session(rows_by_month):
+        """월(1일)별 행 목록을 가진 세션: 쿼리의 created_at 하한으로 달을 찾아 LIMIT 만큼 반환"""
+        session = MagicMock()
+        session.months = []
+
+        async def execute(query):
+            params = query.compile(dialect=postgresql.dialect()).params
+            month = params["created_at_1"].date()
+            session.months.append(month)
+            rows = rows_by_month.get(month, [])[:params["param_1"]]
+            result = MagicMock()
+            result.scalars.return_value.all.return_value = rows
+            return result
+
+        session.execute = execute
+        return session
+
+    # 테스트 케이스 1: 이번 달에 페이지가 차면 이전 달은 조회하지 않음
+    async def test_current_month_only(self):
+        db = self.session({date(2026, 3, 1): list(range(30))})
+        records = await fetch_search_history_page(db, 7, page=2, page_size=10, today=date(2026, 3, 19))
+        assert records == list(range(10, 20))
+        assert db.months == [date(2026, 3, 1)]
+
+    # 테스트 케이스 2: 부족하면 이전 달로 이어서 조회 (앞 페이지에 해당하는 행은 건너뜀)
+    async def test_spans_months(self):
+        db = self.session({date(2026, 3, 1): ["m1", "m2", "m3"], date(2026, 1, 1): ["j1", "j2", "j3", "j4"]})
+        records = await fetch_search_history_page(db, 7, page=2, page_size=2, today=date(2026, 3, 19))
+        assert records == ["m3", "j1"]
+        assert db.months == [date(2026, 3, 1), date(2026, 2, 1), date(2026, 1, 1)]
+
+    # 테스트 케이스 3: 보관 기간 시작 월까지만 조회
+    async def test_stops_at_retention(self, monkeypatch):
+        monkeypatch.setattr(settings, "search_history_retention_months", 2)
+        db = self.session({})
+        assert await fetch_search_history_page(db, 7, today=date(2026, 3, 19)) == []
+        assert db.months == [date(2026, 3, 1), date(2026, 2, 1), date(2026, 1, 1)]
+
+
+class TestRecordSearchHistory:
+
+    # 테스트 케이스 1: 중복 제거 모드는 (user_id, word) upsert 로 횟수 / 마지막 검색 시각 갱신
+    async def test_dedup_upsert(self, monkeypatch):
+        monkeypatch.setattr(settings, "search_history_mode", SEARCH_HISTORY_DEDUP)
+        db = FakeSession()
+        await record_search_history(db, 7, "apple")
+
+        sql = compile_sql(db.statements[0])
+        assert sql.startswith("INSERT INTO search_history_summary")
+        assert "ON CONFLICT (user_id, word) DO UPDATE SET" in sql
+        assert "search_count = (search_history_summary.search_count + " in sql
+        assert "last_searched_at = " in sql
+        assert db.added == []
+        # 일간 검색 통계도 같은 트랜잭션에서 증가 후 한 번만 커밋
+        assert "user_daily_search_stats" in compile_sql(db.statements[1])
+        assert db.commits == 1
+
+    # 테스트 케이스 2: 로그 모드는 검색마다 한 행 추가
+    async def test_log_insert(self, monkeypatch):
+        monkeypatch.setattr(settings, "search_history_mode", SEARCH_HISTORY_LOG)
+        db = FakeSession()
+        await record_search_history(db, 7, "apple")
+
+        assert len(db.added) == 1 and isinstance(db.added[0], SearchHistory)
+        assert (db.added[0].user_id, db.added[0].word) == (7, "apple")
+        assert len(db.statements) == 1
+        assert db.commits == 1
@@ -0,0 +1,80 @@
+import importlib.util
+import os
+
+import pytest
+
+pytest.importorskip("uvicorn")
+
+import serve  # noqa: E402
+from app.utils.metrics import snapshot_path, write_snapshot  # noqa: E402
+from config.settings import settings  # noqa: E402
+
+
+class TestWorkerSizing:
+
+    # 테스트 케이스 1: cgroup v2 CPU 제한
+    def test_cgroup_v2(self, tmp_path):
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("150000 100000\n")
+        assert serve.cgroup_cpu_limit(str(cpu_max)) == 1.5
+        cpu_max.write_text("max 100000\n")
+        assert serve.cgroup_cpu_limit(str(cpu_max)) is None
+
+    # 테스트 케이스 2: cgroup v1 CPU 제한 (quota -1 은 제한 없음)
+    def test_cgroup_v1(self, tmp_path):
+        quota, period = tmp_path / "quota", tmp_path / "period"
+        quota.write_text("200000")
+        period.write_text("100000")
+        missing = str(tmp_path / "missing")
+        assert serve.cgroup_cpu_limit(missing, str(quota), str(period)) == 2.0
+        quota.write_text("-1")
+        assert serve.cgroup_cpu_limit(missing, str(quota), str(period)) is None
+
+    # 테스트 케이스 3: 워커 수 = 설정값 또는 CPU 제한 올림
+    def test_worker_count(self, monkeypatch):
+        assert serve.worker_count(3) == 3
+        monkeypatch.setattr(serve, "available_cpus", lambda: 1.5)
+        assert serve.worker_count(0) == 2
+        monkeypatch.setattr(serve, "available_cpus", lambda: 0.5)
+        assert serve.worker_count(0) == 1
+
+    # 테스트 케이스 4: 빠른 이벤트 루프 / HTTP 파서 선택 (설치되어 있지 않으면 기본 구현)
+    def test_config(self):
+        config = serve.build_config()
+        assert config.loop == ("uvloop" if importlib.util.find_spec("uvloop") else "asyncio")
+        assert config.http == ("httptools" if importlib.util.find_spec("httptools") else "h11")
+
+
+class TestSupervisor:
+
+    # 테스트 케이스 1: 공유 디렉토리가 없으면 임시 디렉토리에 만들고, 남은 스냅샷은 삭제
+    def test_prepare_shared_dirs(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "metrics_multiprocess_dir", str(tmp_path / "metrics"))
+        monkeypatch.setattr(settings, "profiling_store_dir", "")
+        os.makedirs(settings.metrics_multiprocess_dir)
+        (tmp_path / "metrics" / "123.json").write_text("{}")
+
+        created = serve.prepare_shared_dirs()
+        try:
+            assert settings.profiling_store_dir == os.path.join(created, "profiles")
+            assert os.listdir(settings.metrics_multiprocess_dir) == []
+        finally:
+            os.rmdir(created)
+
+    # 테스트 케이스 2: 종료된 워커는 같은 번호로 다시 띄우고 지표는 보관 파일로 합침
+    def test_respawn_same_slot(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "metrics_multiprocess_dir", str(tmp_path))
+        write_snapshot(str(tmp_path), {}, path=snapshot_path(str(tmp_path), pid=101))
+        waits = iter([(101, 0), (0, 0)])
+        monkeypatch.setattr(serve.os, "waitpid", lambda pid, options: next(waits))
+        monkeypatch.setattr(serve, "RESPAWN_BACKOFF", 0)
+
+        supervisor = serve.Supervisor(config=None, workers=2, graceful_timeout=1)
+        supervisor.children = {101: (0, 0.0), 102: (1, 0.0)}
+        spawned = []
+        supervisor.spawn = spawned.append
+        supervisor.reap(respawn=True)
+
+        assert spawned == [0]
+        assert list(supervisor.children) == [102]
+        assert not os.path.exists(snapshot_path(str(tmp_path), pid=101))
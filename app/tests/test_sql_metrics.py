@@ -0,0 +1,113 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.middleware import sql_metrics
+from app.middleware.sql_metrics import SQLMetricsMiddleware, NPlusOneError, track_queries, route_metrics
+from config.settings import settings
+
+engine = create_engine("sqlite://")
+
+
+def run_queries(count: int):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        for word_id in range(count):
+            conn.execute(text("SELECT :id"), {"id": word_id})
+
+
+def make_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(SQLMetricsMiddleware)
+
+    @app.get("/words/{count}")
+    async def words(count: int):
+        run_queries(count)
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+class TestTrackQueries:
+
+    # 테스트 케이스 1: 실행 횟수와 반복 SQL 집계
+    def test_counts(self):
+        with track_queries() as stats:
+            run_queries(3)
+        assert stats.count == 4
+        assert stats.total_seconds >= stats.slowest_seconds > 0
+        assert stats.repeated_statements(3) == [("SELECT ?", 3)]
+        assert stats.repeated_statements(4) == []
+
+    # 테스트 케이스 2: 블록 밖의 SQL 은 집계하지 않음
+    def test_outside_block(self):
+        with track_queries() as stats:
+            pass
+        run_queries(1)
+        assert stats.count == 0
+
+    # 테스트 케이스 3: 실패한 SQL 의 시작 시각은 스택에서 제거
+    def test_failed_statement(self):
+        with track_queries() as stats, engine.connect() as conn:
+            with pytest.raises(Exception):
+                conn.execute(text("SELECT * FROM missing_table"))
+            assert conn.info["query_started_at"] == []
+            conn.execute(text("SELECT 1"))
+        assert stats.count == 1
+
+
+class TestSQLMetricsMiddleware:
+
+    @pytest.fixture(autouse=True)
+    def reset_metrics(self, monkeypatch):
+        route_metrics.reset()
+        monkeypatch.setattr(settings, "sql_n_plus_one_threshold", 5)
+        yield
+        route_metrics.reset()
+
+    # 테스트 케이스 1: 디버그 모드에서 응답 헤더로 SQL 통계 노출
+    def test_debug_headers(self, monkeypatch):
+        monkeypatch.setattr(settings, "debug", True)
+        response = make_client().get("/words/2")
+        assert response.headers["x-db-query-count"] == "3"
+        assert float(response.headers["x-db-time-ms"]) >= float(response.headers["x-db-slowest-ms"])
+
+    # 테스트 케이스 2: 운영 모드에서는 헤더 없이 라우트별 지표만 기록
+    def test_route_metrics(self, monkeypatch):
+        monkeypatch.setattr(settings, "debug", False)
+        client = make_client()
+        client.get("/words/1")
+        response = client.get("/words/3")
+        assert "x-db-query-count" not in response.headers
+
+        metrics = route_metrics.snapshot()["GET /words/{count}"]
+        assert metrics["requests"] == 2
+        assert metrics["avg_queries"] == 3.0
+        assert metrics["max_queries"] == 4
+        assert metrics["n_plus_one"] == 0
+
+    # 테스트 케이스 3: 같은 SQL 이 임계값 이상 반복되면 N+1 로 감지 (raise 모드)
+    def test_n_plus_one_raise(self, monkeypatch):
+        monkeypatch.setattr(settings, "sql_n_plus_one_action", sql_metrics.N_PLUS_ONE_RAISE)
+        with pytest.raises(NPlusOneError):
+            make_client().get("/words/5")
+        assert route_metrics.snapshot()["GET /words/{count}"]["n_plus_one"] == 1
+
+    # 테스트 케이스 4: raise 모드는 응답을 보내기 전에 예외 (응답 시작 메시지가 전송되지 않음)
+    async def test_n_plus_one_raise_before_response(self, monkeypatch):
+        monkeypatch.setattr(settings, "sql_n_plus_one_action", sql_metrics.N_PLUS_ONE_RAISE)
+
+        async def app(scope, receive, send):
+            run_queries(5)
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        with pytest.raises(NPlusOneError):
+            await SQLMetricsMiddleware(app)({"type": "http", "method": "GET"}, None, send)
+        assert sent == []
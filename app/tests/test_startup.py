@@ -0,0 +1,25 @@
+import pytest
+
+from benchmarks.startup import measure_once, STARTUP_BUDGET_SECONDS
+
+
+@pytest.fixture(scope="module")
+def startup():
+    # 새 인터프리터에서 import main → 앱 생성 → 첫 요청
+    return measure_once()
+
+
+class TestStartup:
+
+    # 테스트 케이스 1: import main 은 앱 / 라우터 / 무거운 라이브러리를 불러오지 않음
+    def test_import_is_side_effect_free(self, startup):
+        assert startup["loaded_on_import"] == []
+
+    # 테스트 케이스 2: lifespan 밖에서는 DB / Redis 커넥션 풀을 만들지 않음
+    def test_no_pools_outside_lifespan(self, startup):
+        assert startup["status"] == 200
+        assert startup["pools_created"] is False
+
+    # 테스트 케이스 3: import + 앱 생성 + 첫 요청이 예산 안에 끝남
+    def test_startup_budget(self, startup):
+        assert startup["total_s"] < STARTUP_BUDGET_SECONDS, startup
@@ -0,0 +1,194 @@
+import uuid
+from datetime import date, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from app.models.models import StudyCategory
+from app.services.stats_service import (
+    BOOKMARK_LIMIT,
+    change_bookmark_category,
+    increment_daily_searches,
+    release_bookmark_slots,
+    reserve_bookmark_slot,
+    reset_bookmark_stats,
+)
+from app.database.redis_client import get_redis
+from dependencies import get_current_user
+from main import app
+
+
+def compile_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+class FakeSession:
+    """실행한 문장을 기록하고 RETURNING 결과(returning)를 돌려주는 DB 세션"""
+
+    def __init__(self, returning=None):
+        self.statements = []
+        self.returning = returning
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return SimpleNamespace(scalar_one_or_none=lambda: self.returning)
+
+    def sql(self, index: int = 0) -> str:
+        return compile_sql(self.statements[index])
+
+    def params(self, index: int = 0) -> dict:
+        """ON CONFLICT 절 값은 literal_binds 로 그려지지 않으므로 바인드 값으로 확인"""
+        return self.statements[index].compile(dialect=postgresql.dialect()).params
+
+
+@pytest.fixture
+def login_user():
+    """인증된 사용자(id=7)로 요청"""
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=7)
+    yield
+    app.dependency_overrides.pop(get_current_user)
+
+
+class TestBookmarkStats:
+
+    # 테스트 케이스 1: 최대 개수 미만일 때만 증가하는 조건부 upsert
+    async def test_reserve_upsert(self):
+        db = FakeSession(returning=1)
+        await reserve_bookmark_slot(db, 7, "GRAMMAR")
+
+        sql = db.sql()
+        assert sql.startswith("INSERT INTO user_stats")
+        assert "ON CONFLICT (user_id) DO UPDATE SET " \
+               "total_bookmarks = (user_stats.total_bookmarks + %(total_bookmarks_1)s), " \
+               "grammar_count = (user_stats.grammar_count + %(grammar_count_1)s) " \
+               "WHERE user_stats.total_bookmarks < %(total_bookmarks_2)s" in sql
+        assert sql.endswith("RETURNING user_stats.total_bookmarks")
+        params = db.params()
+        assert (params["user_id"], params["total_bookmarks"], params["grammar_count"]) == (7, 1, 1)
+        assert (params["total_bookmarks_1"], params["grammar_count_1"]) == (1, 1)
+        assert params["total_bookmarks_2"] == BOOKMARK_LIMIT
+
+    # 테스트 케이스 2: 최대 개수에 도달하면 갱신된 행이 없어 400
+    async def test_reserve_at_limit(self):
+        with pytest.raises(HTTPException) as exc:
+            await reserve_bookmark_slot(FakeSession(returning=None), 7)
+        assert exc.value.status_code == 400
+
+    # 테스트 케이스 3: 삭제된 단어 수만큼 종류별 / 전체 감소 (삭제된 단어가 없으면 실행하지 않음)
+    async def test_release(self):
+        db = FakeSession()
+        await release_bookmark_slots(db, 7, [StudyCategory.VOCABULARY, "GRAMMAR", "Vocabulary"])
+
+        sql = db.sql()
+        assert "vocabulary_count=(user_stats.vocabulary_count - 2)" in sql
+        assert "grammar_count=(user_stats.grammar_count - 1)" in sql
+        assert "total_bookmarks=(user_stats.total_bookmarks - 3)" in sql
+        assert sql.endswith("WHERE user_stats.user_id = 7")
+
+        db = FakeSession()
+        await release_bookmark_slots(db, 7, [])
+        assert db.statements == []
+
+    # 테스트 케이스 4: 전체 삭제 시 모든 개수 0
+    async def test_reset(self):
+        db = FakeSession()
+        await reset_bookmark_stats(db, 7)
+        sql = db.sql()
+        for column in ("total_bookmarks", "vocabulary_count", "grammar_count", "reading_count", "writing_count"):
+            assert f"{column}=0" in sql
+        assert sql.endswith("WHERE user_stats.user_id = 7")
+
+    # 테스트 케이스 5: 학습 종류 변경은 이전 종류 -1, 새 종류 +1 (같으면 실행하지 않음)
+    async def test_change_category(self):
+        db = FakeSession()
+        await change_bookmark_category(db, 7, StudyCategory.VOCABULARY, "Reading")
+        sql = db.sql()
+        assert "vocabulary_count=(user_stats.vocabulary_count - 1)" in sql
+        assert "reading_count=(user_stats.reading_count + 1)" in sql
+        assert "total_bookmarks" not in sql
+
+        db = FakeSession()
+        await change_bookmark_category(db, 7, "VOCABULARY", StudyCategory.VOCABULARY)
+        assert db.statements == []
+
+    # 테스트 케이스 6: 일간 검색 횟수 upsert
+    async def test_increment_daily_searches(self):
+        db = FakeSession()
+        await increment_daily_searches(db, 7, day=date(2026, 1, 2))
+        sql = db.sql()
+        assert sql.startswith(
+            "INSERT INTO user_daily_search_stats (user_id, day, search_count) VALUES (7, '2026-01-02', 1)"
+        )
+        assert "ON CONFLICT (user_id, day) DO UPDATE SET search_count = " \
+               "(user_daily_search_stats.search_count + %(search_count_1)s)" in sql
+        assert db.params()["search_count_1"] == 1
+
+
+class TestStatsRoutes:
+
+    # 테스트 케이스 1: 내 통계 조회 (통계 행 + 최근 일간 행)
+    def test_my_stats(self, override_get_db, login_user):
+        stats = MagicMock()
+        stats.scalars.return_value.first.return_value = SimpleNamespace(
+            total_bookmarks=3, vocabulary_count=2, grammar_count=1, reading_count=0, writing_count=0,
+        )
+        daily = MagicMock()
+        daily.all.return_value = [(date(2026, 1, 1), 2), (date(2026, 1, 2), 5)]
+        override_get_db.execute.side_effect = [stats, daily]
+
+        response = TestClient(app).get("/users/me/stats", params={"days": 3})
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total_bookmarks"] == 3
+        assert body["bookmark_limit"] == BOOKMARK_LIMIT
+        assert body["by_category"] == {"Vocabulary": 2, "Grammar": 1, "Reading": 0, "Writing": 0}
+        assert body["searches_last_days"] == 7
+        assert body["daily_searches"] == [{"day": "2026-01-01", "count": 2}, {"day": "2026-01-02", "count": 5}]
+
+        sql = compile_sql(override_get_db.execute.call_args_list[1].args[0])
+        assert "user_daily_search_stats.user_id = 7" in sql
+        assert "ORDER BY user_daily_search_stats.day" in sql
+
+    # 테스트 케이스 2: 통계 행이 없는 사용자는 0
+    def test_my_stats_empty(self, override_get_db, login_user):
+        result = MagicMock()
+        result.scalars.return_value.first.return_value = None
+        result.all.return_value = []
+        override_get_db.execute.return_value = result
+
+        body = TestClient(app).get("/users/me/stats").json()
+        assert body["total_bookmarks"] == 0
+        assert body["searches_last_days"] == 0
+
+    # 테스트 케이스 3: 알 수 없는 학습 종류로 수정하면 400 (단어 / 통계는 그대로)
+    def test_update_invalid_category(self, override_get_db, login_user):
+        word = SimpleNamespace(study_category=StudyCategory.VOCABULARY, created_at=datetime(2026, 1, 1))
+        result = MagicMock()
+        result.scalars.return_value.first.return_value = word
+        override_get_db.execute.return_value = result
+
+        response = TestClient(app).patch(f"/bookmark/words/{uuid.uuid4()}", json={"study_category": "Music"})
+        assert response.status_code == 400
+        assert word.study_category == StudyCategory.VOCABULARY
+        assert override_get_db.execute.call_count == 1
+        override_get_db.commit.assert_not_called()
+
+    # 테스트 케이스 4: 이미 단어장에 있는 단어를 추가하면 유니크 제약 위반 -> 409 (복습 큐에 등록하지 않음)
+    def test_add_duplicate_word(self, override_get_db, login_user):
+        override_get_db.begin = MagicMock(return_value=AsyncMock())
+        override_get_db.execute.return_value = SimpleNamespace(scalar_one_or_none=lambda: 1)
+        override_get_db.commit.side_effect = IntegrityError("INSERT", {}, Exception("bookmark_words_user_id_word_key"))
+        redis_client = AsyncMock()
+        app.dependency_overrides[get_redis] = lambda: redis_client
+        try:
+            response = TestClient(app).post("/bookmark/words", json={"word": "peach"})
+        finally:
+            app.dependency_overrides.pop(get_redis)
+
+        assert response.status_code == 409
+        redis_client.zadd.assert_not_called()
@@ -0,0 +1,90 @@
+import asyncio
+import json
+import logging
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.middleware.tracing import TracingMiddleware
+from app.utils.metrics import upstream_timer
+from app.utils.tracing import record_span, current_trace, _statement_name, SPAN_DB, SPAN_UPSTREAM
+from config.settings import settings
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "trace_export_path", str(tmp_path / "trace.json"))
+    monkeypatch.setattr(settings, "trace_export_all", False)
+    engine = create_engine("sqlite://")
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware)
+
+    @app.get("/trace-test/{word}")
+    async def item(word: str):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        async with upstream_timer("dictionary", url=f"http://dictionary/{word}"):
+            await asyncio.sleep(0.02)
+        return {"word": word}
+
+    yield TestClient(app)
+    engine.dispose()
+
+
+class TestTracing:
+
+    # 테스트 케이스 1: 요청 밖에서는 기록하지 않음
+    def test_no_trace_outside_request(self):
+        assert current_trace() is None
+        record_span(SPAN_DB, "SELECT users", 0.0, 0.1)
+
+    # 테스트 케이스 2: 느린 요청은 구간별 합계를 로그로 남김
+    def test_slow_request_log(self, client, monkeypatch, caplog):
+        monkeypatch.setattr(settings, "trace_slow_request_ms", 10)
+        with caplog.at_level(logging.WARNING, logger="app.middleware.tracing"):
+            client.get("/trace-test/apple")
+
+        summary = json.loads(caplog.records[-1].getMessage())
+        assert summary["event"] == "slow_request"
+        assert summary["route"] == "/trace-test/{word}"
+        assert summary["status"] == 200
+        assert summary["breakdown"]["upstream"]["count"] == 1
+        assert summary["breakdown"]["upstream"]["ms"] >= 20
+        assert summary["breakdown"]["db"]["count"] >= 1
+        slowest = summary["slowest_spans"][0]
+        assert slowest["kind"] == SPAN_UPSTREAM
+        assert slowest["url"] == "http://dictionary/apple"
+
+    # 테스트 케이스 3: 예산 안의 요청은 로그 / 내보내기 없음
+    def test_fast_request_not_logged(self, client, monkeypatch, caplog):
+        monkeypatch.setattr(settings, "trace_slow_request_ms", 60_000)
+        with caplog.at_level(logging.WARNING, logger="app.middleware.tracing"):
+            client.get("/trace-test/apple")
+        assert not caplog.records
+        assert not os.path.exists(settings.trace_export_path)
+
+    # 테스트 케이스 4: Chrome trace 형식으로 내보내기 (닫는 ']' 없는 JSON 배열)
+    def test_chrome_trace_export(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "trace_slow_request_ms", 60_000)
+        monkeypatch.setattr(settings, "trace_export_all", True)
+        client.get("/trace-test/apple")
+        client.get("/trace-test/banana")
+
+        with open(settings.trace_export_path) as f:
+            content = f.read()
+        assert content.startswith("[\n")
+        events = json.loads(content.rstrip().rstrip(",") + "]")
+        requests = [event for event in events if event["cat"] == "request"]
+        assert [event["name"] for event in requests] == ["GET /trace-test/{word}"] * 2
+        assert {event["cat"] for event in events} >= {"request", "db", "upstream"}
+        assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+
+    # 테스트 케이스 5: SQL span 이름
+    def test_statement_name(self):
+        assert _statement_name("SELECT users.id FROM users WHERE users.id = $1") == "SELECT users"
+        assert _statement_name("INSERT INTO bookmark_words (word) VALUES ($1)") == "INSERT bookmark_words"
+        assert _statement_name("UPDATE user_stats SET total = 1") == "UPDATE user_stats"
+        assert _statement_name("BEGIN") == "BEGIN"
@@ -0,0 +1,94 @@
+import pytest
+import redis.asyncio as redis
+
+from app.services import trending_service
+from app.services.trending_service import (
+    TRENDING_BUCKET_SECONDS,
+    TRENDING_MAX_WORD_LENGTH,
+    bucket_of,
+    bucket_key,
+    normalize_word,
+    record_trending_search,
+    get_trending_words,
+    unique_users_key,
+    unique_users_prefix,
+    window_buckets,
+)
+from config.settings import settings
+
+
+@pytest.fixture
+async def redis_client():
+    """실제 Redis 서버 (연결할 수 없으면 건너뜀)"""
+    client = redis.Redis.from_url(settings.redis_url, decode_responses=True, socket_connect_timeout=1)
+    try:
+        await client.ping()
+    except (redis.ConnectionError, redis.TimeoutError, OSError):
+        await client.aclose()
+        pytest.skip("Redis server is not reachable")
+    await client.flushdb()
+    yield client
+    await client.flushdb()
+    await client.aclose()
+
+
+class TestTrendingBuckets:
+
+    # 테스트 케이스 1: 같은 버킷 구간의 시각은 같은 버킷
+    def test_bucket_of(self):
+        start = 1_700_000_100 - 1_700_000_100 % TRENDING_BUCKET_SECONDS
+        assert bucket_of(start) == bucket_of(start + TRENDING_BUCKET_SECONDS - 1)
+        assert bucket_of(start + TRENDING_BUCKET_SECONDS) == bucket_of(start) + 1
+
+    # 테스트 케이스 2: 조회 기간에 맞는 버킷 수 (현재 버킷부터 과거 순)
+    def test_window_buckets(self):
+        now = 1_700_000_000
+        buckets = window_buckets(60, now=now)
+        assert len(buckets) == 60 * 60 // TRENDING_BUCKET_SECONDS
+        assert buckets[0] == bucket_of(now)
+        assert buckets == sorted(buckets, reverse=True)
+
+    # 테스트 케이스 3: 버킷보다 짧은 기간도 현재 버킷은 포함
+    def test_window_shorter_than_bucket(self):
+        assert window_buckets(1, now=1_700_000_000) == [bucket_of(1_700_000_000)]
+
+    # 테스트 케이스 4: 키 형식
+    def test_keys(self):
+        assert bucket_key(10) == "trending:10"
+        assert unique_users_key(10, "apple") == "trending:users:10:apple"
+        assert unique_users_key(10, "apple").startswith(unique_users_prefix(10))
+
+    # 테스트 케이스 5: 키에 쓰는 단어는 소문자 + 길이 제한
+    def test_normalize_word(self):
+        assert normalize_word(" Apple ") == "apple"
+        assert len(normalize_word("a" * 10_000)) == TRENDING_MAX_WORD_LENGTH
+
+
+class TestTrendingRedis:
+
+    # 테스트 케이스 1: K 개보다 많은 단어가 들어와도 버킷 크기와 HLL 키 수는 K 이하
+    async def test_bounded_keys(self, redis_client, monkeypatch):
+        monkeypatch.setattr(trending_service, "TRENDING_TOP_K", 5)
+        monkeypatch.setattr(trending_service, "_record_script", None)
+        for i in range(50):
+            await record_trending_search(redis_client, f"word{i}", user_id=i)
+
+        buckets = [int(key.split(":")[1]) for key in await redis_client.keys("trending:[0-9]*")]
+        assert buckets
+        for bucket in buckets:
+            assert await redis_client.zcard(bucket_key(bucket)) <= 5
+        assert len(await redis_client.keys("trending:users:*")) <= 5 * len(buckets)
+
+    # 테스트 케이스 2: 가득 찬 버킷에도 새로 많이 검색되는 단어가 들어옴 (가장 적은 단어와 교체)
+    async def test_rising_word_enters_full_bucket(self, redis_client, monkeypatch):
+        monkeypatch.setattr(trending_service, "TRENDING_TOP_K", 3)
+        monkeypatch.setattr(trending_service, "_record_script", None)
+        for word in ("apple", "banana", "cherry"):
+            for user_id in range(3):
+                await record_trending_search(redis_client, word, user_id=user_id)
+        for user_id in range(10):
+            await record_trending_search(redis_client, "durian", user_id=user_id)
+
+        trending = await get_trending_words(redis_client, limit=3, window_minutes=5)
+        assert trending[0]["word"] == "durian"
+        assert len(await redis_client.keys("trending:users:*")) <= 3
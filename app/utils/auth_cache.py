@@ -0,0 +1,137 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+import jwt
+from sqlalchemy import event
+
+from app.models.models import User
+from app.utils.metrics import CACHE_REQUESTS
+from app.utils.utils import SECRET_KEY, ALGORITHM
+from config.settings import settings
+
+# 캐시에 저장하는 사용자 컬럼 (비밀번호 제외)
+PRINCIPAL_FIELDS = ("id", "kakao_id", "email", "nickname")
+
+
+class TTLCache:
+    """
+    만료 시각이 있는 LRU 캐시 (이벤트 루프 단일 스레드에서 사용)
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, tuple]" = OrderedDict()
+
+    def get(self, key):
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key, value, expires_in: Optional[float] = None):
+        expires_in = self.ttl if expires_in is None else expires_in
+        if expires_in is None or expires_in <= 0:
+            return
+        self._data[key] = (value, time.monotonic() + expires_in)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key):
+        self._data.pop(key, None)
+
+    def clear(self):
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+TOKEN_CACHE_HIT = CACHE_REQUESTS.labels("token", "hit")
+TOKEN_CACHE_MISS = CACHE_REQUESTS.labels("token", "miss")
+PRINCIPAL_CACHE_HIT = CACHE_REQUESTS.labels("principal", "hit")
+PRINCIPAL_CACHE_MISS = CACHE_REQUESTS.labels("principal", "miss")
+PRINCIPAL_REDIS_HIT = CACHE_REQUESTS.labels("principal_redis", "hit")
+PRINCIPAL_REDIS_MISS = CACHE_REQUESTS.labels("principal_redis", "miss")
+
+# 검증된 토큰 -> payload (토큰 exp 까지 유지)
+token_cache = TTLCache(settings.token_cache_size)
+# 사용자 ID -> 사용자 정보
+principal_cache = TTLCache(settings.principal_cache_size, settings.principal_cache_ttl)
+
+
+def principal_key(user_id: int) -> str:
+    """Redis 사용자 캐시 키"""
+    return f"principal:{user_id}"
+
+
+def decode_access_token(token: str) -> dict:
+    """
+    JWT 서명/만료 검증 후 payload 반환.
+    같은 토큰은 exp 까지 캐시해 서명 검증을 다시 하지 않습니다. (jwt 예외는 그대로 전달)
+    """
+    payload = token_cache.get(token)
+    if payload is not None:
+        TOKEN_CACHE_HIT.inc()
+        return payload
+    TOKEN_CACHE_MISS.inc()
+
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    exp = payload.get("exp")
+    if exp is not None:
+        token_cache.set(token, payload, expires_in=exp - time.time())
+    return payload
+
+
+def forget_token(token: str):
+    """로그아웃 등으로 토큰 캐시 제거"""
+    token_cache.pop(token)
+
+
+def _to_principal(data: dict) -> User:
+    # 세션에 연결되지 않은 읽기 전용 User 객체
+    return User(**data)
+
+
+async def get_cached_principal(user_id: int, redis_client=None) -> Optional[User]:
+    """캐시된 사용자 조회 (로컬 LRU -> Redis 순)"""
+    data = principal_cache.get(user_id)
+    (PRINCIPAL_CACHE_MISS if data is None else PRINCIPAL_CACHE_HIT).inc()
+    if data is None and redis_client is not None and settings.principal_cache_redis:
+        raw = await redis_client.get(principal_key(user_id))
+        (PRINCIPAL_REDIS_HIT if raw else PRINCIPAL_REDIS_MISS).inc()
+        if raw:
+            data = json.loads(raw)
+            principal_cache.set(user_id, data)
+    return _to_principal(data) if data is not None else None
+
+
+async def cache_principal(user: User, redis_client=None) -> User:
+    """DB 에서 조회한 사용자를 캐시에 저장하고 캐시용 객체 반환"""
+    data = {field: getattr(user, field) for field in PRINCIPAL_FIELDS}
+    principal_cache.set(user.id, data)
+    if redis_client is not None and settings.principal_cache_redis:
+        await redis_client.setex(principal_key(user.id), settings.principal_cache_ttl, json.dumps(data))
+    return _to_principal(data)
+
+
+async def invalidate_principal(user_id: int, redis_client=None):
+    """사용자 정보 변경/삭제 시 캐시 무효화"""
+    principal_cache.pop(user_id)
+    if redis_client is not None and settings.principal_cache_redis:
+        await redis_client.delete(principal_key(user_id))
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_on_change(mapper, connection, target):
+    """ORM 으로 사용자가 수정/삭제되면 로컬 캐시 제거 (Redis 캐시는 TTL 또는 invalidate_principal 로 정리)"""
+    principal_cache.pop(target.id)
@@ -0,0 +1,127 @@
+import asyncio
+import functools
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from config.settings import settings
+
+# 실행기 종류: "thread" (GIL 을 놓는 C 확장 - bcrypt, zlib 등) / "process" (순수 파이썬 CPU 작업)
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+
+
+class CPUExecutorMetrics:
+    """
+    CPU 작업 실행기 통계 (대기열 길이 / 대기 시간 / 실행 시간)
+    이벤트 루프 스레드에서만 갱신합니다.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    @property
+    def in_flight(self) -> int:
+        return self.submitted - self.completed - self.failed
+
+    def observe(self, wait: float, run: float, failed: bool = False):
+        if failed:
+            self.failed += 1
+        else:
+            self.completed += 1
+        self.total_wait_seconds += wait
+        self.total_run_seconds += run
+        if wait > self.max_wait_seconds:
+            self.max_wait_seconds = wait
+
+    def snapshot(self, workers: int) -> Dict:
+        finished = self.completed + self.failed
+        return {
+            "workers": workers,
+            "in_flight": self.in_flight,
+            "queue_depth": max(0, self.in_flight - workers),
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "avg_wait_ms": round(self.total_wait_seconds / finished * 1000, 3) if finished else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+            "avg_run_ms": round(self.total_run_seconds / finished * 1000, 3) if finished else 0.0,
+        }
+
+
+metrics = CPUExecutorMetrics()
+
+# 프로세스 단위 실행기 (lifespan 에서 생성/종료)
+_executor: Optional[Executor] = None
+_workers = 0
+
+
+def _default_workers() -> int:
+    return settings.cpu_executor_workers or min(4, os.cpu_count() or 1)
+
+
+def start_executor(kind: str = None, workers: int = None) -> Executor:
+    """CPU 작업 실행기 생성 (이미 있으면 그대로 반환)"""
+    global _executor, _workers
+    if _executor is None:
+        kind = kind or settings.cpu_executor_kind
+        _workers = workers or _default_workers()
+        if kind == EXECUTOR_PROCESS:
+            _executor = ProcessPoolExecutor(max_workers=_workers)
+        elif kind == EXECUTOR_THREAD:
+            _executor = ThreadPoolExecutor(max_workers=_workers, thread_name_prefix="cpu-worker")
+        else:
+            raise ValueError(f"Unknown CPU executor kind: {kind}")
+    return _executor
+
+
+def shutdown_executor(wait: bool = True):
+    """실행 중인 작업을 마치고 실행기 종료"""
+    global _executor, _workers
+    if _executor is not None:
+        _executor.shutdown(wait=wait, cancel_futures=not wait)
+    _executor = None
+    _workers = 0
+
+
+def _timed_call(func: Callable, submitted_at: float, *args):
+    # 작업자에서 실행: 대기 시간 / 실행 시간 측정 (프로세스 간에도 비교 가능한 time.time 사용)
+    started_at = time.time()
+    result = func(*args)
+    return started_at - submitted_at, time.time() - started_at, result
+
+
+async def run_cpu(func: Callable, *args, **kwargs):
+    """
+    CPU 작업을 실행기에서 실행하고 결과를 기다립니다. (이벤트 루프는 다른 요청을 계속 처리)
+    프로세스 실행기를 쓰는 경우 func 와 인자는 pickle 가능해야 합니다.
+    """
+    executor = _executor if _executor is not None else start_executor()
+    if kwargs:
+        func = functools.partial(func, **kwargs)
+
+    metrics.submitted += 1
+    submitted_at = time.time()
+    try:
+        wait, run, result = await asyncio.get_running_loop().run_in_executor(
+            executor, _timed_call, func, submitted_at, *args
+        )
+    except BaseException:
+        metrics.observe(time.time() - submitted_at, 0.0, failed=True)
+        raise
+    metrics.observe(wait, run)
+    return result
+
+
+def executor_stats() -> Dict:
+    """실행기 현황"""
+    return metrics.snapshot(_workers or _default_workers())
@@ -0,0 +1,413 @@
+"""
+Prometheus 텍스트 형식으로 내보내는 가벼운 지표 레지스트리
+
+- prometheus_client 대신 직접 구현: pre-fork 워커(serve.py)의 값을 합치려면 prometheus_client 는 multiprocess 모드
+  (PROMETHEUS_MULTIPROCESS_DIR)가 필요한데, 이 모드에서는 수집 시점에 값을 읽는 커스텀 콜렉터(풀 사용량 등 GaugeCallback)가
+  합산되지 않고 의존성도 추가됩니다. API 모양(labels().inc() / observe())은 prometheus_client 와 맞춰 두었습니다.
+- 라벨 조합별 자식 지표는 처음 한 번만 만들고 재사용합니다. (라벨 값이 고정인 호출 위치는 모듈에서 미리 labels() 로 받아두기)
+- 값 갱신은 숫자 더하기 / 버킷 인덱스 증가뿐이라 요청마다 객체를 만들지 않습니다.
+- 이벤트 루프 단일 스레드에서 갱신한다고 가정하므로 락을 쓰지 않습니다.
+- pre-fork 멀티 워커(serve.py)에서는 워커마다 스냅샷을 공유 디렉토리에 쓰고, /metrics 에서 모든 워커의 값을 합산합니다.
+"""
+import asyncio
+import json
+import os
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from app.utils.tracing import record_span, SPAN_UPSTREAM
+
+# 기본 지연시간 버킷(초)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+
+class _HistogramChild:
+    __slots__ = ("upper_bounds", "counts", "sum", "count")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.upper_bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _Metric:
+    kind = ""
+    child_class = None
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        if not self.labelnames:
+            self._default = self._children[()] = self._new_child()
+
+    def _new_child(self):
+        return self.child_class()
+
+    def labels(self, *values):
+        """라벨 값 조합의 자식 지표 (같은 조합은 항상 같은 객체)"""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            child = self._children[values] = self._new_child()
+        return child
+
+    def sample_values(self) -> Iterable[Tuple[Tuple[str, ...], object]]:
+        for values, child in self._children.items():
+            yield values, child.value
+
+    def collect(self) -> Dict:
+        """현재 값 (JSON 으로 저장해 다른 프로세스의 값과 합칠 수 있는 형식)"""
+        return {
+            "kind": self.kind,
+            "documentation": self.documentation,
+            "labelnames": list(self.labelnames),
+            "samples": [[list(values), value] for values, value in self.sample_values()],
+        }
+
+
+class Counter(_Metric):
+    kind = "counter"
+    child_class = _CounterChild
+
+    def inc(self, amount: float = 1.0):
+        self._default.value += amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+    child_class = _GaugeChild
+
+    def inc(self, amount: float = 1.0):
+        self._default.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self._default.value -= amount
+
+    def set(self, value: float):
+        self._default.value = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets=DEFAULT_BUCKETS):
+        self.upper_bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.upper_bounds)
+
+    def observe(self, value: float):
+        self._default.observe(value)
+
+    def sample_values(self) -> Iterable[Tuple[Tuple[str, ...], object]]:
+        for values, child in self._children.items():
+            yield values, {"counts": list(child.counts), "sum": child.sum, "count": child.count}
+
+    def collect(self) -> Dict:
+        collected = super().collect()
+        collected["buckets"] = list(self.upper_bounds)
+        return collected
+
+
+class GaugeCallback(_Metric):
+    """수집 시점에 함수를 호출해 값을 읽는 게이지 (예: 풀 사용량) - callback 은 {라벨 값 튜플: 값} 반환"""
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, callback: Callable[[], Dict], labelnames: Sequence[str] = ()):
+        self.callback = callback
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def sample_values(self) -> Iterable[Tuple[Tuple[str, ...], object]]:
+        return self.callback().items()
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge_callback(self, name: str, documentation: str, callback, labelnames: Sequence[str] = ()) -> GaugeCallback:
+        return self.register(GaugeCallback(name, documentation, callback, labelnames))
+
+    def collect(self) -> Dict[str, Dict]:
+        """전체 지표의 현재 값 스냅샷 (이름 -> Metric.collect())"""
+        return {name: metric.collect() for name, metric in self._metrics.items()}
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (version 0.0.4)"""
+        return render_snapshot(self.collect())
+
+
+def merge_snapshots(snapshots: Iterable[Dict[str, Dict]]) -> Dict[str, Dict]:
+    """
+    여러 프로세스의 스냅샷 합산 (라벨 조합별로 counter / gauge 는 값, histogram 은 버킷별 개수 / 합계를 더함)
+    gauge 도 더하므로 처리 중인 요청 수, 풀 커넥션 수 등은 전체 워커 합계가 됩니다.
+    """
+    merged: Dict[str, Dict] = {}
+    for snapshot in snapshots:
+        for name, metric in snapshot.items():
+            target = merged.get(name)
+            if target is None:
+                target = merged[name] = {key: value for key, value in metric.items() if key != "samples"}
+                target["samples"] = {}
+            samples = target["samples"]
+            for values, value in metric["samples"]:
+                key = tuple(values)
+                current = samples.get(key)
+                if current is None:
+                    samples[key] = dict(value, counts=list(value["counts"])) if isinstance(value, dict) else value
+                elif isinstance(value, dict):
+                    current["counts"] = [a + b for a, b in zip(current["counts"], value["counts"])]
+                    current["sum"] += value["sum"]
+                    current["count"] += value["count"]
+                else:
+                    samples[key] = current + value
+    for metric in merged.values():
+        metric["samples"] = [[list(key), value] for key, value in metric["samples"].items()]
+    return merged
+
+
+def render_snapshot(snapshot: Dict[str, Dict]) -> str:
+    """스냅샷 → Prometheus 텍스트 형식"""
+    lines: List[str] = []
+    for name, metric in snapshot.items():
+        lines.append(f"# HELP {name} {metric['documentation']}")
+        lines.append(f"# TYPE {name} {metric['kind']}")
+        labelnames = metric["labelnames"]
+        if metric["kind"] != "histogram":
+            for values, value in metric["samples"]:
+                lines.append(f"{name}{_format_labels(labelnames, values)} {_format_value(value)}")
+            continue
+        bounds = list(metric["buckets"]) + [float("inf")]
+        for values, value in metric["samples"]:
+            cumulative = 0
+            for bound, count in zip(bounds, value["counts"]):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{name}_bucket{_format_labels(labelnames, values, le)} {cumulative}")
+            labels = _format_labels(labelnames, values)
+            lines.append(f"{name}_sum{labels} {_format_value(value['sum'])}")
+            lines.append(f"{name}_count{labels} {value['count']}")
+    return "\n".join(lines) + "\n"
+
+
+# 멀티 워커 지표 파일: 워커별 <pid>.json + 종료된 워커의 누적값 archive.json
+METRICS_ARCHIVE_FILE = "archive.json"
+
+
+def snapshot_path(directory: str, pid: int = None) -> str:
+    return os.path.join(directory, f"{os.getpid() if pid is None else pid}.json")
+
+
+def write_snapshot(directory: str, snapshot: Dict[str, Dict], path: str = None):
+    """임시 파일에 쓴 뒤 교체 (읽는 쪽이 쓰다 만 파일을 보지 않도록)"""
+    path = path or snapshot_path(directory)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(snapshot, f)
+    os.replace(temp_path, path)
+
+
+def read_snapshot(path: str) -> Dict[str, Dict]:
+    """스냅샷 파일 (없으면 빈 스냅샷 - 그 사이 archive 로 옮겨진 워커 파일 등)"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def read_snapshots(directory: str, exclude: str = None) -> List[Dict[str, Dict]]:
+    paths = [
+        os.path.join(directory, filename) for filename in sorted(os.listdir(directory)) if filename.endswith(".json")
+    ]
+    return [read_snapshot(path) for path in paths if path != exclude]
+
+
+def archive_snapshot(directory: str, pid: int):
+    """
+    종료된 워커의 스냅샷을 archive 에 합침 (마스터에서만 호출)
+    counter / histogram 은 누적값이 줄어들지 않도록 남기고, gauge 는 살아 있는 워커 값만 의미가 있으므로 버림
+    """
+    path = snapshot_path(directory, pid)
+    snapshot = read_snapshot(path)
+    if snapshot:
+        cumulative = {name: metric for name, metric in snapshot.items() if metric["kind"] != "gauge"}
+        archive_path = os.path.join(directory, METRICS_ARCHIVE_FILE)
+        write_snapshot(directory, merge_snapshots([read_snapshot(archive_path), cumulative]), path=archive_path)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def render_multiprocess(directory: str, own: Dict[str, Dict]) -> str:
+    """
+    이 워커의 최신 값(own) + 다른 워커들이 마지막으로 쓴 스냅샷 + archive 합산
+    (다른 워커 값은 최대 METRICS_FLUSH_INTERVAL 초 전 값)
+    """
+    write_snapshot(directory, own)
+    return render_snapshot(merge_snapshots([own] + read_snapshots(directory, exclude=snapshot_path(directory))))
+
+
+async def metrics_flush_loop(directory: str, registry: "Registry", interval: float):
+    """워커 지표 스냅샷을 주기적으로 기록 (다른 워커가 /metrics 요청을 받았을 때 합산되도록)"""
+    while True:
+        await asyncio.to_thread(write_snapshot, directory, registry.collect())
+        await asyncio.sleep(interval)
+
+
+# 앱 전체에서 공유하는 레지스트리
+registry = Registry()
+
+# HTTP 요청
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route", ("method", "route", "status")
+)
+HTTP_REQUESTS_IN_FLIGHT = registry.gauge("http_requests_in_flight", "HTTP requests currently being served")
+
+# 외부 API (dictionary, kakao)
+UPSTREAM_REQUEST_DURATION = registry.histogram(
+    "upstream_request_duration_seconds", "Upstream API call latency", ("upstream",)
+)
+UPSTREAM_ERRORS = registry.counter("upstream_errors_total", "Upstream API calls that failed", ("upstream",))
+
+# DB / Redis
+DB_POOL_CHECKOUT_WAIT = registry.histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a DB connection from the pool"
+)
+REDIS_COMMAND_DURATION = registry.histogram(
+    "redis_command_duration_seconds", "Redis round-trip latency (a pipeline counts as one round trip)", ("kind",)
+)
+REDIS_COMMAND_DURATION_SINGLE = REDIS_COMMAND_DURATION.labels("command")
+REDIS_COMMAND_DURATION_PIPELINE = REDIS_COMMAND_DURATION.labels("pipeline")
+
+# 캐시 (hit / miss)
+CACHE_REQUESTS = registry.counter("cache_requests_total", "Cache lookups by cache and result", ("cache", "result"))
+
+
+class Upstream:
+    """외부 API 하나의 지표 자식 (모듈에서 한 번 만들어 두면 호출마다 labels() 조회 없음)"""
+
+    __slots__ = ("name", "duration", "errors")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.duration = UPSTREAM_REQUEST_DURATION.labels(name)
+        self.errors = UPSTREAM_ERRORS.labels(name)
+
+    def timer(self, **attrs) -> "UpstreamTimer":
+        return UpstreamTimer(self, **attrs)
+
+
+DICTIONARY_UPSTREAM = Upstream("dictionary")
+KAKAO_UPSTREAM = Upstream("kakao")
+
+
+class UpstreamTimer:
+    """
+    외부 API 호출 지연시간 / 실패 기록 (요청 중이면 trace 에 upstream span 도 추가)
+
+        async with DICTIONARY_UPSTREAM.timer(url=url):
+            response = await client.get(url)
+    """
+
+    __slots__ = ("upstream", "duration", "errors", "started", "failed", "attrs")
+
+    def __init__(self, upstream: Upstream, **attrs):
+        self.upstream = upstream.name
+        self.duration = upstream.duration
+        self.errors = upstream.errors
+        self.started = 0.0
+        self.failed = False
+        self.attrs = attrs
+
+    async def __aenter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.started
+        self.duration.observe(elapsed)
+        if exc_type is not None and not self.failed:
+            self.mark_error()
+        record_span(SPAN_UPSTREAM, self.upstream, self.started, elapsed, error=self.failed, **self.attrs)
+        return False
+
+    def mark_error(self):
+        """예외 없이 실패한 응답(5xx 등) 기록"""
+        self.failed = True
+        self.errors.inc()
+
+
+def upstream_timer(upstream: str, **attrs) -> UpstreamTimer:
+    """attrs 는 trace span 에 함께 남길 정보 (예: url) - 자주 호출하는 곳은 모듈의 Upstream.timer() 사용"""
+    return UpstreamTimer(Upstream(upstream), **attrs)
@@ -0,0 +1,211 @@
+"""
+요청 단위 span 기록 (DB / Redis / 외부 API 호출 구간)
+
+- 요청마다 Trace 하나를 contextvar 에 두고, 계측 지점에서 끝난 구간을 record_span 으로 추가합니다.
+- 요청 밖(백그라운드 작업 등)에서는 contextvar 가 비어 있어 아무것도 기록하지 않습니다.
+- 결과는 느린 요청 로그의 구간별 합계와 Chrome trace 형식(chrome://tracing, Perfetto) 내보내기에 사용합니다.
+"""
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# span 종류 (Chrome trace 에서는 종류별로 다른 줄에 표시)
+SPAN_DB = "db"
+SPAN_REDIS = "redis"
+SPAN_UPSTREAM = "upstream"
+SPAN_KINDS = (SPAN_DB, SPAN_REDIS, SPAN_UPSTREAM)
+
+
+class Span:
+    __slots__ = ("kind", "name", "start", "duration", "attrs")
+
+    def __init__(self, kind: str, name: str, start: float, duration: float, attrs: Dict):
+        self.kind = kind
+        self.name = name
+        self.start = start  # time.perf_counter() 기준
+        self.duration = duration
+        self.attrs = attrs
+
+
+class Trace:
+    """요청 하나의 span 목록 (max_spans 를 넘으면 개수만 셈)"""
+
+    __slots__ = ("method", "path", "route", "status", "start", "duration", "spans", "dropped", "max_spans")
+
+    def __init__(self, method: str, path: str, max_spans: int = 1000):
+        self.method = method
+        self.path = path
+        self.route: Optional[str] = None
+        self.status: Optional[int] = None
+        self.start = time.perf_counter()
+        self.duration = 0.0
+        self.spans: List[Span] = []
+        self.dropped = 0
+        self.max_spans = max_spans
+
+    def add(self, span: Span):
+        if len(self.spans) < self.max_spans:
+            self.spans.append(span)
+        else:
+            self.dropped += 1
+
+    def finish(self, status: Optional[int], route: Optional[str]):
+        self.duration = time.perf_counter() - self.start
+        self.status = status
+        self.route = route
+
+    def breakdown(self) -> Dict:
+        """종류별 span 수 / 합계 시간 (동시 실행된 span 은 겹쳐서 합산됨)"""
+        totals = {}
+        for span in self.spans:
+            entry = totals.setdefault(span.kind, {"count": 0, "ms": 0.0})
+            entry["count"] += 1
+            entry["ms"] += span.duration * 1000
+        for entry in totals.values():
+            entry["ms"] = round(entry["ms"], 3)
+        return totals
+
+    def summary(self, slowest: int = 5) -> Dict:
+        """느린 요청 로그에 남기는 구조화된 요약"""
+        spans = sorted(self.spans, key=lambda span: span.duration, reverse=True)[:slowest]
+        return {
+            "event": "slow_request",
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "status": self.status,
+            "duration_ms": round(self.duration * 1000, 3),
+            "breakdown": self.breakdown(),
+            "slowest_spans": [
+                {
+                    "kind": span.kind,
+                    "name": span.name,
+                    "offset_ms": round((span.start - self.start) * 1000, 3),
+                    "ms": round(span.duration * 1000, 3),
+                    **span.attrs,
+                }
+                for span in spans
+            ],
+            "dropped_spans": self.dropped,
+        }
+
+    def chrome_events(self, pid: int, trace_id: int) -> List[Dict]:
+        """Chrome trace 'X'(complete) 이벤트 (시간 단위 us, 요청은 tid 0, span 종류별로 tid 1..)"""
+        base = self.start
+        # 프로세스 안에서 요청들이 시간 순으로 놓이도록 perf_counter 를 그대로 사용
+        events = [{
+            "name": f"{self.method} {self.route or self.path}",
+            "cat": "request",
+            "ph": "X",
+            "ts": round(base * 1e6, 3),
+            "dur": round(self.duration * 1e6, 3),
+            "pid": pid,
+            "tid": 0,
+            "args": {"trace_id": trace_id, "path": self.path, "status": self.status},
+        }]
+        for span in self.spans:
+            events.append({
+                "name": span.name,
+                "cat": span.kind,
+                "ph": "X",
+                "ts": round(span.start * 1e6, 3),
+                "dur": round(span.duration * 1e6, 3),
+                "pid": pid,
+                "tid": SPAN_KINDS.index(span.kind) + 1 if span.kind in SPAN_KINDS else len(SPAN_KINDS) + 1,
+                "args": {"trace_id": trace_id, **span.attrs},
+            })
+        return events
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("trace", default=None)
+
+
+def start_trace(method: str, path: str, max_spans: int = 1000):
+    """현재 컨텍스트에서 새 trace 시작 (반환값은 end_trace 에 전달)"""
+    trace = Trace(method, path, max_spans)
+    return trace, _current_trace.set(trace)
+
+
+def end_trace(token):
+    _current_trace.reset(token)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+def record_span(kind: str, name: str, start: float, duration: float, **attrs):
+    """끝난 구간을 현재 요청의 trace 에 추가 (요청 밖이면 무시)"""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add(Span(kind, name, start, duration, attrs))
+
+
+class ChromeTraceWriter:
+    """
+    Chrome trace JSON 배열 형식 파일에 이벤트 추가
+    (닫는 ']' 없이도 chrome://tracing / Perfetto 에서 열림 - 여러 워커가 같은 파일에 이어 쓸 수 있음)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._trace_ids = 0
+
+    def write(self, trace: Trace):
+        with self._lock:
+            self._trace_ids += 1
+            events = trace.chrome_events(os.getpid(), self._trace_ids)
+            lines = "".join(json.dumps(event, ensure_ascii=False) + ",\n" for event in events)
+            new_file = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(("[\n" if new_file else "") + lines)
+
+
+# SQL 실행 구간 (sql_metrics 와 같은 전역 Engine 이벤트, trace 가 있을 때만 기록)
+@event.listens_for(Engine, "before_cursor_execute")
+def _trace_before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_trace.get() is not None:
+        conn.info.setdefault("trace_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _trace_after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("trace_started_at")
+    if started and _current_trace.get() is not None:
+        start = started.pop()
+        record_span(SPAN_DB, _statement_name(statement), start, time.perf_counter() - start, statement=statement[:500])
+
+
+@event.listens_for(Engine, "handle_error")
+def _trace_handle_error(exception_context):
+    connection = exception_context.connection
+    started = connection.info.get("trace_started_at") if connection is not None else None
+    if started:
+        start = started.pop()
+        record_span(SPAN_DB, "error", start, time.perf_counter() - start,
+                    statement=(exception_context.statement or "")[:500], error=True)
+
+
+def _statement_name(statement: str) -> str:
+    """span 이름: SQL 첫 단어 + 대상 테이블 (예: SELECT users)"""
+    words = statement.split()
+    if not words:
+        return "SQL"
+    verb = words[0].upper()
+    keyword = {"SELECT": "FROM", "DELETE": "FROM", "INSERT": "INTO", "UPDATE": None}.get(verb, "")
+    if keyword is None and len(words) > 1:
+        return f"{verb} {words[1]}"
+    if keyword:
+        upper = [word.upper() for word in words]
+        if keyword in upper:
+            index = upper.index(keyword)
+            if index + 1 < len(words):
+                return f"{verb} {words[index + 1].strip('()')}"
+    return verb
@@ -1,16 +1,27 @@
+import uuid
+import bcrypt
 import jwt
 from datetime import datetime, timedelta
-import redis
-from dotenv import load_dotenv
-import os
+from redis.exceptions import RedisError
 from fastapi import HTTPException
-from redis_set import get_redis_client
 
-load_dotenv()
+from app.utils.cpu_executor import run_cpu
+from config.settings import settings
 
-SECRET_KEY = os.getenv("SECRET_KEY", "fallback_secret_key")
+SECRET_KEY = settings.secret_key
 ALGORITHM = "HS256"
 
+async def hash_password(password: str) -> str:
+    """비밀번호 bcrypt 해시 (CPU 실행기에서 실행)"""
+    hashed = await run_cpu(bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt())
+    return hashed.decode("utf-8")
+
+async def verify_password(password: str, hashed_password: str) -> bool:
+    """비밀번호와 bcrypt 해시 비교 (CPU 실행기에서 실행)"""
+    if not hashed_password:
+        return False
+    return await run_cpu(bcrypt.checkpw, password.encode("utf-8"), hashed_password.encode("utf-8"))
+
 def create_jwt_token(data: dict):
     """JWT 토큰 생성"""
     expire = datetime.utcnow() + timedelta(days=1)  # 1일 유효기간
@@ -22,15 +33,14 @@ def create_refresh_token(data: dict):
     """JWT 리프레시 토큰 생성"""
     expire = datetime.utcnow() + timedelta(days=30)  # 30일 유효기간
     to_encode = data.copy()
-    to_encode.update({"exp": expire})
+    # jti: 같은 초에 발급해도 토큰이 달라야 교체(rotation) 비교가 의미 있음
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
-def delete_access_token(token: str):
+async def delete_access_token(token: str, redis_client):
     """Redis에서 엑세스 토큰 삭제"""
     try:
-
-        redis_client = get_redis_client()  # Redis 클라이언트 가져오기
-        result = redis_client.delete(f"access_token:{token}")
+        result = await redis_client.delete(f"access_token:{token}")
 
         if result == 0:
             # 유효하지 않은 토큰에 대해 401 응답
@@ -38,18 +48,17 @@ def delete_access_token(token: str):
 
         return {"message": "Logout successful"}
 
-    except redis.exceptions.RedisError as e:
+    except RedisError as e:
         raise HTTPException(status_code=500, detail=f"Redis error: {str(e)}")
     except HTTPException as e:
         raise e  # 이 예외는 그대로 전달
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
-def delete_refresh_token(user_id: str):
+async def delete_refresh_token(user_id: str, redis_client):
     """Redis에서 리프레시 토큰 삭제"""
     try:
-        redis_client = get_redis_client()  # Redis 클라이언트 가져오기
-        result = redis_client.delete(f"refresh_token:{user_id}")
+        result = await redis_client.delete(f"refresh_token:{user_id}")
 
         if result == 0:
             # 유효하지 않은 리프레시 토큰에 대해 401 응답
@@ -57,7 +66,7 @@ def delete_refresh_token(user_id: str):
 
         return {"message": "Refresh token deleted successfully"}
 
-    except redis.exceptions.RedisError as e:
+    except RedisError as e:
         raise HTTPException(status_code=500, detail=f"Redis error: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
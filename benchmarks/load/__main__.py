@@ -0,0 +1,151 @@
+"""
+로컬 스텁 업스트림으로 앱 전체 부하 테스트
+
+사전 API / 카카오 OAuth 대신 로컬 스텁을 띄우고, 앱을 uvicorn 으로 실행한 뒤
+가상 사용자 트래픽(검색, 자동완성, 단어장 CRUD, 검색 기록)을 보내 라우트별 결과를 JSON 으로 저장합니다.
+Postgres / Redis 는 평소처럼 settings(.env) 의 주소를 사용합니다.
+
+    python -m benchmarks.load --users 50 --duration 60 --output load-report.json
+    # 업스트림 지연 80ms ± 20ms, 오류 2% 주입
+    python -m benchmarks.load --upstream-latency-ms 80 --upstream-jitter-ms 20 --upstream-error-rate 0.02
+    # 이전 결과와 비교 (회귀가 있으면 종료 코드 1)
+    python -m benchmarks.load --baseline load-report.json --output load-report-new.json
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+from benchmarks.load.report import DEFAULT_THRESHOLDS, build_report, compare, format_table, load_report, save_report
+from benchmarks.load.stubs import start_stub
+from benchmarks.load.workload import run_load
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def start_app(port: int, workers: int, dictionary_port: int, kakao_port: int) -> subprocess.Popen:
+    """업스트림 주소를 스텁으로 바꿔 앱 실행"""
+    env = {
+        **os.environ,
+        "DICTIONARY_API_URL": f"http://127.0.0.1:{dictionary_port}/api/v2/entries/en",
+        "KAKAO_AUTH_URL": f"http://127.0.0.1:{kakao_port}",
+        "KAKAO_API_URL": f"http://127.0.0.1:{kakao_port}",
+        "KAKAO_CLIENT_ID": os.environ.get("KAKAO_CLIENT_ID", "load-test"),
+        "KAKAO_REDIRECT_URI": os.environ.get("KAKAO_REDIRECT_URI", "http://127.0.0.1/callback"),
+    }
+    command = [
+        sys.executable, "-m", "uvicorn", "main:app",
+        "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers),
+        "--log-level", "warning", "--no-access-log",
+    ]
+    return subprocess.Popen(command, cwd=ROOT_DIR, env=env)
+
+
+async def wait_until_ready(base_url: str, timeout: float, process: subprocess.Popen = None):
+    """앱이 요청을 받을 때까지 대기"""
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url, timeout=1.0) as client:
+        while time.monotonic() < deadline:
+            if process is not None and process.poll() is not None:
+                raise RuntimeError(f"app exited with code {process.returncode}")
+            try:
+                if (await client.get("/health/executor")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.2)
+    raise TimeoutError(f"app at {base_url} did not become ready in {timeout}s")
+
+
+def stop(process):
+    process.terminate()
+    if isinstance(process, subprocess.Popen):
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+    else:
+        process.join(timeout=10)
+
+
+async def main(args) -> int:
+    latency = args.upstream_latency_ms / 1000
+    jitter = args.upstream_jitter_ms / 1000
+    processes = [
+        start_stub("dictionary", args.dictionary_port, latency, jitter, args.upstream_error_rate),
+        start_stub("kakao", args.kakao_port, latency, jitter, args.upstream_error_rate),
+    ]
+    base_url = args.base_url
+    try:
+        if base_url is None:
+            base_url = f"http://127.0.0.1:{args.app_port}"
+            app = start_app(args.app_port, args.workers, args.dictionary_port, args.kakao_port)
+            processes.append(app)
+            await wait_until_ready(base_url, args.startup_timeout, app)
+        else:
+            await wait_until_ready(base_url, args.startup_timeout)
+
+        recorder = await run_load(
+            base_url, args.users, args.duration,
+            think_time=args.think_time_ms / 1000, seed=args.seed, ramp_up=args.ramp_up,
+        )
+    finally:
+        for process in reversed(processes):
+            stop(process)
+
+    config = {
+        key: value for key, value in vars(args).items()
+        if key not in ("output", "baseline", "base_url")
+    }
+    report = build_report(recorder, config)
+    print(format_table(report))
+    save_report(report, args.output)
+    print(f"report saved to {args.output}")
+
+    if args.baseline:
+        regressions = compare(report, load_report(args.baseline), {
+            "latency_pct": args.latency_threshold,
+            "throughput_pct": args.throughput_threshold,
+            "error_rate_pp": args.error_threshold,
+            "min_samples": args.min_samples,
+        })
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.baseline}:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print(f"no regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="스텁 업스트림을 사용한 앱 전체 부하 테스트")
+    parser.add_argument("--users", type=int, default=20, help="동시 가상 사용자 수")
+    parser.add_argument("--duration", type=float, default=30.0, help="측정 시간(초)")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="가상 사용자를 모두 시작하기까지 걸리는 시간(초)")
+    parser.add_argument("--think-time-ms", type=float, default=0.0, help="요청 사이 평균 대기 시간(ms)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1, help="앱 uvicorn 워커 수")
+    parser.add_argument("--app-port", type=int, default=8100)
+    parser.add_argument("--dictionary-port", type=int, default=8101)
+    parser.add_argument("--kakao-port", type=int, default=8102)
+    parser.add_argument("--base-url", default=None,
+                        help="이미 실행 중인 앱 주소 (해당 앱은 스텁 주소로 설정되어 있어야 함)")
+    parser.add_argument("--startup-timeout", type=float, default=30.0)
+    parser.add_argument("--upstream-latency-ms", type=float, default=0.0, help="스텁 응답 지연(ms)")
+    parser.add_argument("--upstream-jitter-ms", type=float, default=0.0, help="스텁 응답 지연 편차(ms)")
+    parser.add_argument("--upstream-error-rate", type=float, default=0.0, help="스텁 503 응답 비율 (0~1)")
+    parser.add_argument("--output", default="load-report.json", help="결과 JSON 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument("--latency-threshold", type=float, default=DEFAULT_THRESHOLDS["latency_pct"],
+                        help="p95/p99 허용 증가율(%%)")
+    parser.add_argument("--throughput-threshold", type=float, default=DEFAULT_THRESHOLDS["throughput_pct"],
+                        help="처리량 허용 감소율(%%)")
+    parser.add_argument("--error-threshold", type=float, default=DEFAULT_THRESHOLDS["error_rate_pp"],
+                        help="오류율 허용 증가폭(%%p)")
+    parser.add_argument("--min-samples", type=int, default=DEFAULT_THRESHOLDS["min_samples"])
+    sys.exit(asyncio.run(main(parser.parse_args())))
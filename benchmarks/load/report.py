@@ -0,0 +1,128 @@
+"""
+부하 테스트 결과 요약 / 이전 결과와 비교
+
+라우트별 처리량과 p50/p95/p99 지연시간을 JSON 으로 저장하고,
+기준(baseline) 결과보다 허용치 이상 나빠진 항목을 회귀로 보고합니다.
+"""
+import json
+import math
+from typing import Dict, List, Sequence
+
+from benchmarks.load.workload import Recorder
+
+# 회귀 판정 기본 허용치
+DEFAULT_THRESHOLDS = {
+    "latency_pct": 20.0,  # p95 / p99 가 기준보다 20% 이상 느려지면 회귀
+    "throughput_pct": 10.0,  # 전체 / 라우트별 처리량이 10% 이상 줄면 회귀
+    "error_rate_pp": 1.0,  # 오류율이 1%p 이상 늘면 회귀
+    "min_samples": 50,  # 표본이 이보다 적은 라우트는 지연시간 비교 생략
+}
+
+
+def percentile(ordered: Sequence[float], pct: float) -> float:
+    """정렬된 값의 nearest-rank 백분위수"""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def is_error(status: int) -> bool:
+    """연결 실패 / 타임아웃(0) 또는 5xx (404 같은 4xx 는 정상 응답으로 취급)"""
+    return status == 0 or status >= 500
+
+
+def summarize_route(samples: List, duration: float) -> Dict:
+    latencies = sorted(elapsed for elapsed, _ in samples)
+    statuses: Dict[str, int] = {}
+    errors = 0
+    for _, status in samples:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+        errors += is_error(status)
+    return {
+        "requests": len(samples),
+        "throughput_rps": round(len(samples) / duration, 2) if duration else 0.0,
+        "error_rate": round(errors / len(samples) * 100, 2),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3),
+        "status": statuses,
+    }
+
+
+def build_report(recorder: Recorder, config: Dict = None) -> Dict:
+    duration = recorder.duration
+    routes = {route: summarize_route(samples, duration) for route, samples in sorted(recorder.samples.items())}
+    total = sum(route["requests"] for route in routes.values())
+    errors = sum(route["requests"] * route["error_rate"] / 100 for route in routes.values())
+    return {
+        "config": config or {},
+        "duration_s": round(duration, 3),
+        "requests": total,
+        "throughput_rps": round(total / duration, 2) if duration else 0.0,
+        "error_rate": round(errors / total * 100, 2) if total else 0.0,
+        "routes": routes,
+    }
+
+
+def _slower(current: float, baseline: float, pct: float) -> bool:
+    return baseline > 0 and current > baseline * (1 + pct / 100)
+
+
+def _lower(current: float, baseline: float, pct: float) -> bool:
+    return baseline > 0 and current < baseline * (1 - pct / 100)
+
+
+def compare(current: Dict, baseline: Dict, thresholds: Dict = None) -> List[str]:
+    """기준 결과 대비 회귀 목록 (비어 있으면 통과)"""
+    limits = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+    regressions = []
+
+    if _lower(current["throughput_rps"], baseline["throughput_rps"], limits["throughput_pct"]):
+        regressions.append(
+            f"total throughput {current['throughput_rps']} rps < baseline {baseline['throughput_rps']} rps"
+        )
+    if current["error_rate"] - baseline["error_rate"] >= limits["error_rate_pp"]:
+        regressions.append(f"total error rate {current['error_rate']}% > baseline {baseline['error_rate']}%")
+
+    for route, base in baseline["routes"].items():
+        now = current["routes"].get(route)
+        if now is None:
+            regressions.append(f"{route}: no requests in this run")
+            continue
+        if now["error_rate"] - base["error_rate"] >= limits["error_rate_pp"]:
+            regressions.append(f"{route}: error rate {now['error_rate']}% > baseline {base['error_rate']}%")
+        if min(now["requests"], base["requests"]) < limits["min_samples"]:
+            continue
+        if _lower(now["throughput_rps"], base["throughput_rps"], limits["throughput_pct"]):
+            regressions.append(f"{route}: throughput {now['throughput_rps']} rps < baseline {base['throughput_rps']} rps")
+        for key in ("p95_ms", "p99_ms"):
+            if _slower(now[key], base[key], limits["latency_pct"]):
+                regressions.append(f"{route}: {key} {now[key]} > baseline {base[key]}")
+    return regressions
+
+
+def format_table(report: Dict) -> str:
+    lines = [
+        f"{'route':<34}{'reqs':>8}{'rps':>9}{'err%':>7}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}",
+    ]
+    for route, stats in report["routes"].items():
+        lines.append(
+            f"{route:<34}{stats['requests']:>8}{stats['throughput_rps']:>9}{stats['error_rate']:>7}"
+            f"{stats['p50_ms']:>10}{stats['p95_ms']:>10}{stats['p99_ms']:>10}"
+        )
+    lines.append(
+        f"{'total':<34}{report['requests']:>8}{report['throughput_rps']:>9}{report['error_rate']:>7}"
+    )
+    return "\n".join(lines)
+
+
+def load_report(path: str) -> Dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_report(report: Dict, path: str):
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,123 @@
+"""
+부하 테스트용 외부 API 스텁 (dictionaryapi.dev / Kakao OAuth)
+
+실제 서비스 대신 로컬에서 응답하며, 지연시간과 오류 비율을 주입할 수 있습니다.
+"""
+import asyncio
+import random
+import zlib
+from multiprocessing import Process
+from urllib.parse import parse_qs
+
+import uvicorn
+from fastapi import FastAPI, Header, HTTPException, Request
+
+
+class FaultInjection:
+    """요청마다 latency 초(± jitter) 대기 후 error_rate 확률로 503 응답"""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, seed: int = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+
+    async def apply(self):
+        delay = self.latency + self.random.uniform(-self.jitter, self.jitter) if self.jitter else self.latency
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.error_rate and self.random.random() < self.error_rate:
+            raise HTTPException(status_code=503, detail="injected upstream error")
+
+
+def dictionary_entry(word: str) -> list:
+    """dictionaryapi.dev 응답 형식의 단어 정보"""
+    return [
+        {
+            "word": word,
+            "phonetic": f"/{word}/",
+            "meanings": [
+                {
+                    "partOfSpeech": "noun",
+                    "definitions": [
+                        {"definition": f"A stub definition of {word}.", "example": f"This is {word}."},
+                        {"definition": f"Another sense of {word}."},
+                    ],
+                    "synonyms": [f"{word}-like", f"{word}ish"],
+                },
+                {
+                    "partOfSpeech": "verb",
+                    "definitions": [{"definition": f"To {word}."}],
+                    "synonyms": [],
+                },
+            ],
+        }
+    ]
+
+
+def create_dictionary_stub(faults: FaultInjection) -> FastAPI:
+    """GET /api/v2/entries/en/{word} (zz 로 시작하는 단어는 404)"""
+    app = FastAPI()
+
+    @app.get("/api/v2/entries/en/{word}")
+    async def entries(word: str):
+        await faults.apply()
+        if word.startswith("zz"):
+            raise HTTPException(status_code=404, detail="No Definitions Found")
+        return dictionary_entry(word)
+
+    return app
+
+
+def kakao_id_for(code: str) -> int:
+    """인가 코드마다 고정된 카카오 ID (가상 사용자별로 같은 계정)"""
+    return zlib.crc32(code.encode()) % 2_000_000_000
+
+
+def create_kakao_stub(faults: FaultInjection) -> FastAPI:
+    """POST /oauth/token, GET /v2/user/me (토큰에 인가 코드를 담아 사용자 구분)"""
+    app = FastAPI()
+
+    @app.post("/oauth/token")
+    async def token(request: Request):
+        # python-multipart 없이 form 본문 파싱
+        form = parse_qs((await request.body()).decode())
+        if "code" not in form:
+            raise HTTPException(status_code=400, detail="code is required")
+        await faults.apply()
+        code = form["code"][0]
+        return {"access_token": f"stub-{code}", "token_type": "bearer", "expires_in": 21599}
+
+    @app.get("/v2/user/me")
+    async def user_me(authorization: str = Header(...)):
+        await faults.apply()
+        code = authorization.removeprefix("Bearer ").removeprefix("stub-")
+        kakao_id = kakao_id_for(code)
+        return {
+            "id": kakao_id,
+            "kakao_account": {"email": f"{code}@load.test"},
+            "properties": {"nickname": code},
+        }
+
+    return app
+
+
+STUB_FACTORIES = {
+    "dictionary": create_dictionary_stub,
+    "kakao": create_kakao_stub,
+}
+
+
+def _serve_stub(kind: str, port: int, latency: float, jitter: float, error_rate: float):
+    app = STUB_FACTORIES[kind](FaultInjection(latency, jitter, error_rate))
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning", access_log=False)
+
+
+def start_stub(kind: str, port: int, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0) -> Process:
+    """
+    스텁 서버를 별도 프로세스로 실행 (부하 생성기와 CPU 를 나눠 쓰지 않도록)
+    반환된 프로세스는 terminate() 로 종료합니다.
+    """
+    process = Process(target=_serve_stub, args=(kind, port, latency, jitter, error_rate), daemon=True)
+    process.start()
+    return process
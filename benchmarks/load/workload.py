@@ -0,0 +1,155 @@
+"""
+가상 사용자 부하 생성기
+
+가상 사용자마다 카카오 로그인(스텁) 후 가중치에 따라 검색 / 자동완성 / 단어장 CRUD / 검색 기록 요청을 반복합니다.
+요청 결과는 라우트 템플릿 이름으로 기록하므로 단어나 ID 가 달라도 같은 라우트로 집계됩니다.
+"""
+import asyncio
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+# 검색 / 단어장에 사용하는 단어 (zz 로 시작하는 단어는 사전 스텁이 404 응답)
+WORDS = [
+    "apple", "application", "banana", "band", "cat", "dog", "elephant", "forest", "garden", "harbor",
+    "island", "journey", "kitchen", "library", "mountain", "notebook", "ocean", "pencil", "river", "sunset",
+]
+SUGGEST_PREFIXES = ["a", "ap", "app", "b", "ba", "c", "d", "x"]
+
+# 동작별 가중치 (실제 사용 비율에 맞춰 조정)
+DEFAULT_WEIGHTS = {
+    "search_word": 30,
+    "suggest": 15,
+    "bookmark_add": 8,
+    "bookmark_list": 15,
+    "bookmark_search": 10,
+    "bookmark_delete": 5,
+    "history": 7,
+    "history_recent": 10,
+}
+
+
+class Recorder:
+    """요청 결과 수집: {라우트: [(지연시간, 상태 코드)]} (상태 코드 0 = 연결 실패 / 타임아웃)"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[Tuple[float, int]]] = {}
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+
+    def record(self, route: str, elapsed: float, status: int):
+        self.samples.setdefault(route, []).append((elapsed, status))
+
+    def stop(self):
+        self.finished = time.perf_counter()
+
+    @property
+    def duration(self) -> float:
+        return (self.finished or time.perf_counter()) - self.started
+
+
+class VirtualUser:
+    def __init__(self, index: int, client: httpx.AsyncClient, recorder: Recorder, weights: Dict[str, int], seed: int):
+        self.index = index
+        self.client = client
+        self.recorder = recorder
+        self.random = random.Random(seed + index)
+        self.actions = list(weights)
+        self.weights = [weights[action] for action in self.actions]
+        self.headers: Dict[str, str] = {}
+        self.bookmark_ids: List[str] = []
+
+    async def request(self, route: str, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, headers=self.headers, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.record(route, time.perf_counter() - started, 0)
+            return None
+        self.recorder.record(route, time.perf_counter() - started, response.status_code)
+        return response
+
+    async def login(self) -> bool:
+        response = await self.request(
+            "GET /auth/kakao/callback", "GET", "/auth/kakao/callback", params={"code": f"vu-{self.index}"}
+        )
+        if response is None or response.status_code != 200:
+            return False
+        access_token = response.json()["access_token"]
+        self.headers = {"Authorization": f"Bearer {access_token}"}
+        return True
+
+    async def search_word(self):
+        word = self.random.choice(WORDS) if self.random.random() > 0.05 else "zzunknown"
+        await self.request("GET /search/word", "GET", "/search/word", params={"word": word})
+
+    async def suggest(self):
+        await self.request("POST /search/suggest", "POST", "/search/suggest",
+                           json={"query": self.random.choice(SUGGEST_PREFIXES)})
+
+    async def bookmark_add(self):
+        word = self.random.choice(WORDS)
+        await self.request("POST /bookmark/words", "POST", "/bookmark/words", json={
+            "word": word,
+            "definition": f"Definition of {word}",
+            "example": f"An example with {word}.",
+        })
+
+    async def bookmark_list(self):
+        response = await self.request("GET /bookmark/words/", "GET", "/bookmark/words/")
+        if response is not None and response.status_code == 200:
+            self.bookmark_ids = [str(word["id"]) for word in response.json()]
+
+    async def bookmark_search(self):
+        await self.request("GET /bookmark/words/search", "GET", "/bookmark/words/search",
+                           params={"q": self.random.choice(WORDS)[:3]})
+
+    async def bookmark_delete(self):
+        if not self.bookmark_ids:
+            await self.bookmark_list()
+        if self.bookmark_ids:
+            word_id = self.bookmark_ids.pop(self.random.randrange(len(self.bookmark_ids)))
+            await self.request("DELETE /bookmark/words/{id}", "DELETE", f"/bookmark/words/{word_id}")
+
+    async def history(self):
+        await self.request("GET /search/history", "GET", "/search/history")
+
+    async def history_recent(self):
+        await self.request("GET /search/history/recent", "GET", "/search/history/recent")
+
+    async def run(self, deadline: float, think_time: float):
+        if not await self.login():
+            return
+        while time.perf_counter() < deadline:
+            action = self.random.choices(self.actions, self.weights)[0]
+            await getattr(self, action)()
+            if think_time:
+                await asyncio.sleep(self.random.uniform(0, think_time * 2))
+
+
+async def run_load(
+    base_url: str,
+    users: int,
+    duration: float,
+    think_time: float = 0.0,
+    weights: Dict[str, int] = None,
+    seed: int = 0,
+    ramp_up: float = 0.0,
+) -> Recorder:
+    """users 명의 가상 사용자가 duration 초 동안 요청 (ramp_up 초에 걸쳐 순차 시작)"""
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        deadline = time.perf_counter() + ramp_up + duration
+        virtual_users = [VirtualUser(i, client, recorder, weights or DEFAULT_WEIGHTS, seed) for i in range(users)]
+
+        async def start(user: VirtualUser):
+            if ramp_up:
+                await asyncio.sleep(ramp_up * user.index / users)
+            await user.run(deadline, think_time)
+
+        await asyncio.gather(*(start(user) for user in virtual_users))
+    recorder.stop()
+    return recorder
@@ -0,0 +1,287 @@
+"""
+요청마다 실행되는 함수의 마이크로 벤치마크 (DB / Redis / 네트워크 없이 실행)
+
+    # 전체 실행
+    python -m benchmarks.micro
+    # 일부만 (이름 접두사), 크기 지정
+    python -m benchmarks.micro --filter bookmark --sizes 100 1000
+    # 기준 결과 저장 / 비교 (중앙값이 10% 이상 느려지면 종료 코드 1)
+    python -m benchmarks.micro --save
+    python -m benchmarks.micro --compare --threshold 10
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRouter, serialize_response
+
+from app.middleware.compression import GzipCompressor
+from app.models.models import BookmarkWord
+from app.routers.bookmark import router as bookmark_router
+from app.routers.word_search import router as word_search_router, shape_word_details
+from app.services.bookmark_service import serialize_bookmark_words
+from app.services.suggestion_service import SuggestionIndex
+from app.utils.utils import create_jwt_token, create_refresh_token, verify_refresh_token
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "micro.json")
+
+# 이름 -> (입력 크기 목록, 크기를 받아 측정할 함수(인자 없음)를 반환하는 준비 함수)
+BENCHMARKS: Dict[str, tuple] = {}
+
+
+def benchmark(name: str, sizes=(1,)):
+    """벤치마크 등록 (준비 단계는 측정하지 않음)"""
+    def register(setup: Callable[[int], Callable[[], object]]):
+        BENCHMARKS[name] = (tuple(sizes), setup)
+        return setup
+    return register
+
+
+def run_sync(coroutine):
+    """중간에 await 로 멈추지 않는 코루틴을 이벤트 루프 없이 실행"""
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coroutine.close()
+    raise RuntimeError("coroutine suspended")
+
+
+def route_renderer(router: APIRouter, path: str) -> Callable[[object], bytes]:
+    """
+    라우트 반환값을 응답 본문으로 인코딩하는 함수 (FastAPI 응답 경로와 동일)
+    라우트의 response_model 로 검증 / 직렬화한 뒤 앱 기본 응답 클래스(ORJSONResponse)로 인코딩
+    """
+    route = next(route for route in router.routes if route.path == path)
+
+    def render(content) -> bytes:
+        value = run_sync(serialize_response(field=route.response_field, response_content=content))
+        return ORJSONResponse(value).body
+
+    return render
+
+
+def make_words(count: int) -> List[str]:
+    """자동완성 검색 대상 단어 (결정적으로 생성)"""
+    prefixes = ["ap", "ba", "ca", "do", "el", "fo", "ga", "ha"]
+    return [f"{prefixes[i % len(prefixes)]}{i:06d}" for i in range(count)]
+
+
+def make_dictionary_entry(word: str, definitions: int) -> list:
+    """dictionaryapi.dev 응답 형식 (품사 3개 x 품사별 정의 definitions 개)"""
+    return [
+        {
+            "word": word,
+            "phonetic": f"/{word}/",
+            "meanings": [
+                {
+                    "partOfSpeech": part,
+                    "definitions": [
+                        {
+                            "definition": f"Definition {i} of {word} as a {part}.",
+                            "example": f"An example sentence using {word} ({i}).",
+                            "synonyms": [],
+                            "antonyms": [],
+                        }
+                        for i in range(definitions)
+                    ],
+                    "synonyms": [f"{word}-{i}" for i in range(5)],
+                    "antonyms": [],
+                }
+                for part in ("noun", "verb", "adjective")
+            ],
+        }
+    ]
+
+
+def make_bookmark_words(count: int) -> List[BookmarkWord]:
+    return [
+        BookmarkWord(
+            word=f"word{i}",
+            user_id=1,
+            definition=f"Definition of word{i}",
+            example=f"An example sentence with word{i}.",
+        )
+        for i in range(count)
+    ]
+
+
+@benchmark("suggest.match", sizes=(100, 1_000, 10_000))
+def bench_suggest_match(size: int):
+    index = SuggestionIndex(make_words(size))
+    return lambda: index.suggest("Ap")
+
+
+@benchmark("search_word.shape", sizes=(5, 50, 500))
+def bench_search_word_shape(size: int):
+    word_info = make_dictionary_entry("apple", size)
+    return lambda: shape_word_details("apple", word_info)
+
+
+@benchmark("search_word.response", sizes=(5, 50, 500))
+def bench_search_word_response(size: int):
+    word_info = make_dictionary_entry("apple", size)
+    render = route_renderer(word_search_router, "/search/word")
+    return lambda: render(shape_word_details("apple", word_info))
+
+
+@benchmark("search_word.gzip", sizes=(5, 50, 500))
+def bench_search_word_gzip(size: int):
+    body = route_renderer(word_search_router, "/search/word")(shape_word_details("apple", make_dictionary_entry("apple", size)))
+
+    def compress():
+        compressor = GzipCompressor(6)
+        return compressor.compress(body) + compressor.finish()
+
+    return compress
+
+
+@benchmark("bookmark.serialize", sizes=(10, 100, 1_000))
+def bench_bookmark_serialize(size: int):
+    words = make_bookmark_words(size)
+    return lambda: serialize_bookmark_words(words)
+
+
+@benchmark("bookmark.response", sizes=(10, 100, 1_000))
+def bench_bookmark_response(size: int):
+    words = make_bookmark_words(size)
+    render = route_renderer(bookmark_router, "/bookmark/words/")
+    return lambda: render(serialize_bookmark_words(words))
+
+
+@benchmark("jwt.create_access")
+def bench_jwt_create_access(size: int):
+    return lambda: create_jwt_token({"user_id": 1, "kakao_id": 123})
+
+
+@benchmark("jwt.create_refresh")
+def bench_jwt_create_refresh(size: int):
+    return lambda: create_refresh_token({"user_id": 1, "kakao_id": 123})
+
+
+@benchmark("jwt.verify_refresh")
+def bench_jwt_verify_refresh(size: int):
+    token = create_refresh_token({"user_id": 1, "kakao_id": 123})
+    return lambda: verify_refresh_token(token)
+
+
+def calibrate(func: Callable[[], object], min_time: float) -> int:
+    """한 번 측정에 min_time 초 이상 걸리도록 반복 횟수 결정 (timeit.autorange 방식)"""
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        if time.perf_counter() - started >= min_time:
+            return loops
+        loops *= 2
+
+
+def measure(func: Callable[[], object], warmup: float, repeat: int, min_time: float) -> Dict:
+    """warmup 초 동안 실행 후 repeat 번 측정, 호출 1회당 시간 통계"""
+    deadline = time.perf_counter() + warmup
+    while time.perf_counter() < deadline:
+        func()
+
+    loops = calibrate(func, min_time)
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - started) / loops)
+
+    median = statistics.median(samples)
+    return {
+        "loops": loops,
+        "repeat": repeat,
+        "min_us": round(min(samples) * 1e6, 3),
+        "median_us": round(median * 1e6, 3),
+        "mean_us": round(statistics.fmean(samples) * 1e6, 3),
+        "stdev_us": round(statistics.stdev(samples) * 1e6, 3) if repeat > 1 else 0.0,
+        "ops_per_s": round(1 / median, 1),
+    }
+
+
+def run(names: List[str], sizes: Optional[List[int]], warmup: float, repeat: int, min_time: float) -> Dict:
+    results = {}
+    for name in names:
+        default_sizes, setup = BENCHMARKS[name]
+        # 크기 인자가 없는 벤치마크(JWT 등)는 --sizes 무시
+        for size in (sizes if sizes and default_sizes != (1,) else default_sizes):
+            results[f"{name}[{size}]"] = measure(setup(size), warmup, repeat, min_time)
+    return results
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """기준보다 중앙값이 threshold% 이상 느려진 항목"""
+    regressions = []
+    for key, stats in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        change = (stats["median_us"] - base["median_us"]) / base["median_us"] * 100
+        if change >= threshold:
+            regressions.append(f"{key}: {stats['median_us']}us vs baseline {base['median_us']}us (+{change:.1f}%)")
+    return regressions
+
+
+def format_table(results: Dict, baseline: Dict = None) -> str:
+    lines = [f"{'benchmark':<32}{'median(us)':>12}{'stdev(us)':>11}{'ops/s':>13}" + ("   vs baseline" if baseline else "")]
+    for key, stats in results.items():
+        line = f"{key:<32}{stats['median_us']:>12}{stats['stdev_us']:>11}{stats['ops_per_s']:>13}"
+        base = (baseline or {}).get(key)
+        if base:
+            line += f"   {(stats['median_us'] - base['median_us']) / base['median_us'] * 100:+.1f}%"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(args) -> int:
+    names = [name for name in BENCHMARKS if not args.filter or any(name.startswith(f) for f in args.filter)]
+    results = run(names, args.sizes, args.warmup, args.repeat, args.min_time)
+
+    baseline = None
+    if args.compare:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_table(results, baseline))
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump({"python": sys.version.split()[0], "results": results}, f, indent=2)
+        print(f"baseline saved to {args.baseline}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s):")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="핫 패스 함수 마이크로 벤치마크")
+    parser.add_argument("--filter", nargs="+", help="실행할 벤치마크 이름 접두사")
+    parser.add_argument("--sizes", nargs="+", type=int, help="입력 크기 (기본: 벤치마크별 크기)")
+    parser.add_argument("--warmup", type=float, default=0.2, help="측정 전 준비 실행 시간(초)")
+    parser.add_argument("--repeat", type=int, default=7, help="측정 횟수")
+    parser.add_argument("--min-time", type=float, default=0.05, help="측정 1회 최소 시간(초)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="기준 결과 JSON 경로")
+    parser.add_argument("--save", action="store_true", help="결과를 기준으로 저장")
+    parser.add_argument("--compare", action="store_true", help="기준 결과와 비교")
+    parser.add_argument("--threshold", type=float, default=10.0, help="허용 중앙값 증가율(%%)")
+    parser.add_argument("--json", action="store_true", help="JSON 으로 출력")
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,76 @@
+"""
+워커 시작 시간 측정 (새 인터프리터에서 import main → 앱 생성 → 첫 요청)
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 10 --budget 3.0   # 중앙값이 예산을 넘으면 종료 코드 1
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 시작 시간 예산(초): import + 앱 생성 + 첫 요청 (tests/test_startup.py 에서도 사용)
+STARTUP_BUDGET_SECONDS = 3.0
+
+# 새 프로세스에서 실행하는 측정 코드 (결과는 JSON 한 줄)
+PROBE = r"""
+import json, sys, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+loaded_on_import = sorted(name for name in ("fastapi", "sqlalchemy", "httpx", "redis", "app.routers.auth") if name in sys.modules)
+app = main.app
+created = time.perf_counter()
+from fastapi.testclient import TestClient
+response = TestClient(app).get("/health/executor")
+finished = time.perf_counter()
+from app.database import db, redis_client
+print(json.dumps({
+    "import_s": imported - started,
+    "create_app_s": created - imported,
+    "first_request_s": finished - created,
+    "total_s": finished - started,
+    "status": response.status_code,
+    "loaded_on_import": loaded_on_import,
+    # lifespan 밖에서는 커넥션 풀을 만들지 않아야 함
+    "pools_created": db.engine is not None or redis_client._pool is not None,
+}))
+"""
+
+
+def measure_once() -> Dict:
+    """새 인터프리터에서 한 번 측정 (이전 실행의 import 캐시 영향 없음, .pyc 는 사용)"""
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure(runs: int) -> Dict:
+    samples: List[Dict] = [measure_once() for _ in range(runs)]
+    summary = {
+        key: round(statistics.median(sample[key] for sample in samples), 4)
+        for key in ("import_s", "create_app_s", "first_request_s", "total_s")
+    }
+    summary["status"] = samples[-1]["status"]
+    summary["loaded_on_import"] = samples[-1]["loaded_on_import"]
+    summary["pools_created"] = samples[-1]["pools_created"]
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="앱 시작 시간 측정")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET_SECONDS, help="허용 시작 시간(초, 중앙값)")
+    args = parser.parse_args()
+
+    result = measure(args.runs)
+    print(json.dumps(result, indent=2))
+    if result["total_s"] > args.budget:
+        print(f"startup {result['total_s']}s exceeds budget {args.budget}s")
+        sys.exit(1)
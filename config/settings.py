@@ -1,10 +1,9 @@
 import os
 
-import redis
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
 
-load_dotenv()  # .env 파일을 로드하여 환경 변수를 읽어옴
+load_dotenv()  # .env 파일을 로드하여 환경 변수를 읽어옴 (프로젝트에서 이곳에서만 로드)
 
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = os.getenv("REDIS_PORT", 6379)
@@ -17,10 +16,108 @@ class Settings(BaseSettings):
     postgres_port: int = int(os.getenv("POSTGRES_PORT", 5432))
     postgres_db: str = os.getenv("POSTGRES_DB", "voca")
 
+    # JWT 서명 키
+    secret_key: str = os.getenv("SECRET_KEY", "fallback_secret_key")
+
+    # 카카오 OAuth 앱 설정
+    kakao_client_id: str = os.getenv("KAKAO_CLIENT_ID", "")
+    kakao_redirect_uri: str = os.getenv("KAKAO_REDIRECT_URI", "")
+
+    # 외부 API 주소 (부하 테스트에서는 benchmarks/load 의 로컬 스텁 주소로 변경)
+    dictionary_api_url: str = os.getenv("DICTIONARY_API_URL", "https://api.dictionaryapi.dev/api/v2/entries/en")
+    kakao_auth_url: str = os.getenv("KAKAO_AUTH_URL", "https://kauth.kakao.com")
+    kakao_api_url: str = os.getenv("KAKAO_API_URL", "https://kapi.kakao.com")
+
+    # 개발 모드 (응답 헤더로 요청별 SQL 통계 노출 등)
+    debug: bool = os.getenv("DEBUG", "false").lower() == "true"
+
+    # SQL 계측: 한 요청에서 같은 SQL 이 이 횟수 이상 실행되면 N+1 로 판단 (0 이면 검사 안 함)
+    sql_n_plus_one_threshold: int = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", 10))
+    sql_n_plus_one_action: str = os.getenv("SQL_N_PLUS_ONE_ACTION", "log")  # "log" / "raise" (테스트)
+
+    # DB 커넥션 풀 (app/database/db.py create_engine)
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", 10))  # 유지하는 커넥션 수
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", 10))  # 순간적으로 추가 허용하는 커넥션 수
+    db_pool_timeout: float = float(os.getenv("DB_POOL_TIMEOUT", 30))  # 커넥션 대기 최대 시간(초)
+    db_pool_pre_ping: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"  # 꺼내기 전 연결 확인
+    db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", 1800))  # 커넥션 재생성 주기(초)
+    db_statement_cache_size: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 100))  # asyncpg prepared statement 캐시
+    db_pooler_mode: str = os.getenv("DB_POOLER_MODE", "direct")  # "direct" / "pgbouncer" / "pgbouncer_no_cache"
+    db_echo: bool = os.getenv("DB_ECHO", "false").lower() == "true"  # SQL 로그 출력 (개발용)
+
+    # 읽기 전용 replica (호스트를 지정하지 않으면 모든 읽기를 primary 로)
+    replica_postgres_host: str = os.getenv("REPLICA_POSTGRES_HOST", "")
+    replica_postgres_port: int = int(os.getenv("REPLICA_POSTGRES_PORT", os.getenv("POSTGRES_PORT", 5432)))
+    replica_max_lag_seconds: float = float(os.getenv("REPLICA_MAX_LAG_SECONDS", 5))  # 이 이상 지연되면 primary 사용
+    replica_lag_check_interval: float = float(os.getenv("REPLICA_LAG_CHECK_INTERVAL", 5))  # 지연 확인 주기(초)
+    read_your_writes_seconds: int = int(os.getenv("READ_YOUR_WRITES_SECONDS", 10))  # 쓰기 후 primary 에서 읽는 기간(초)
+
     # Redis 설정
     redis_host: str = os.getenv("REDIS_HOST", "localhost")
     redis_port: int = int(os.getenv("REDIS_PORT", 6379))
     redis_db: int = int(os.getenv("REDIS_DB", 0))
+    redis_max_connections: int = int(os.getenv("REDIS_MAX_CONNECTIONS", 50))  # 커넥션 풀 최대 크기
+    redis_socket_timeout: float = float(os.getenv("REDIS_SOCKET_TIMEOUT", 2.0))  # 연결/명령 타임아웃(초)
+    redis_health_check_interval: int = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", 30))  # 유휴 커넥션 점검 주기(초)
+
+    # 검색 기록 파티션 관리 (월 단위 파티션)
+    search_history_retention_months: int = int(os.getenv("SEARCH_HISTORY_RETENTION_MONTHS", 12))  # 보관 기간(개월)
+    search_history_partitions_ahead: int = int(os.getenv("SEARCH_HISTORY_PARTITIONS_AHEAD", 2))  # 미리 만들 파티션 수
+    partition_maintenance_interval: int = int(os.getenv("PARTITION_MAINTENANCE_INTERVAL", 6 * 3600))  # 관리 작업 주기(초)
+
+    # 검색 기록 저장 방식: "log" (검색마다 한 행) / "dedup" ((user_id, word) 당 한 행 + 횟수)
+    search_history_mode: str = os.getenv("SEARCH_HISTORY_MODE", "log")
+
+    # 인증 사용자 캐시 (프로세스 내 LRU, 선택적으로 Redis 공유)
+    principal_cache_ttl: int = int(os.getenv("PRINCIPAL_CACHE_TTL", 60))  # 사용자 정보 캐시 유지 시간(초)
+    principal_cache_size: int = int(os.getenv("PRINCIPAL_CACHE_SIZE", 10000))  # 최대 캐시 사용자 수
+    principal_cache_redis: bool = os.getenv("PRINCIPAL_CACHE_REDIS", "false").lower() == "true"  # Redis 2차 캐시 사용
+    token_cache_size: int = int(os.getenv("TOKEN_CACHE_SIZE", 10000))  # 검증된 토큰 캐시 최대 개수
+
+    # CPU 작업 실행기 (비밀번호 해시 등 이벤트 루프를 막는 작업)
+    cpu_executor_kind: str = os.getenv("CPU_EXECUTOR_KIND", "thread")  # "thread" / "process"
+    cpu_executor_workers: int = int(os.getenv("CPU_EXECUTOR_WORKERS", 0))  # 0 이면 min(4, CPU 수)
+
+    # 자동완성 단어 파일 (한 줄에 단어 하나, 없으면 기본 단어만 사용)
+    suggestion_words_path: str = os.getenv("SUGGESTION_WORDS_PATH", "")
+
+    # 운영 서버 (serve.py)
+    server_host: str = os.getenv("SERVER_HOST", "0.0.0.0")
+    server_port: int = int(os.getenv("SERVER_PORT", 8000))
+    web_concurrency: int = int(os.getenv("WEB_CONCURRENCY", 0))  # 워커 수 (0 이면 사용 가능한 CPU 수)
+    graceful_timeout: float = float(os.getenv("GRACEFUL_TIMEOUT", 30))  # 종료 시 처리 중인 요청을 기다리는 시간(초)
+    server_keep_alive: int = int(os.getenv("SERVER_KEEP_ALIVE", 5))  # keep-alive 유휴 연결 유지 시간(초)
+    server_access_log: bool = os.getenv("SERVER_ACCESS_LOG", "false").lower() == "true"
+
+    # 관리자 API 토큰 (/admin/*, 요청 프로파일링 헤더) - 비어 있으면 관리자 기능 사용 불가
+    admin_token: str = os.getenv("ADMIN_TOKEN", "")
+
+    # 요청 프로파일링 (켜면 X-Profile: <ADMIN_TOKEN> 헤더 요청과 샘플링된 요청을 프로파일링)
+    profiling_enabled: bool = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+    profiling_profiler: str = os.getenv("PROFILING_PROFILER", "cprofile")  # "cprofile" / "sampling"
+    profiling_sample_rate: float = float(os.getenv("PROFILING_SAMPLE_RATE", 0))  # 무작위 프로파일링 비율 (0~1)
+    profiling_sample_interval: float = float(os.getenv("PROFILING_SAMPLE_INTERVAL", 0.005))  # 스택 샘플링 주기(초)
+    profiling_max_results: int = int(os.getenv("PROFILING_MAX_RESULTS", 50))  # 보관할 최근 결과 수
+    profiling_store_dir: str = os.getenv("PROFILING_STORE_DIR", "")  # 결과 저장 디렉토리 (비어 있으면 메모리, serve.py 는 워커 공유 디렉토리 지정)
+
+    # 멀티 워커 지표 합산 (serve.py 가 비어 있으면 임시 디렉토리 지정, 워커는 METRICS_FLUSH_INTERVAL 초마다 스냅샷 기록)
+    metrics_multiprocess_dir: str = os.getenv("METRICS_MULTIPROCESS_DIR", "")
+    metrics_flush_interval: float = float(os.getenv("METRICS_FLUSH_INTERVAL", 5))
+
+    # search_history 파티션 관리 루프 실행 여부 (serve.py 는 첫 번째 워커에서만 실행)
+    partition_maintenance_enabled: bool = os.getenv("PARTITION_MAINTENANCE_ENABLED", "true").lower() == "true"
+
+    # 요청 추적 (DB / Redis / 외부 API 구간)
+    trace_slow_request_ms: float = float(os.getenv("TRACE_SLOW_REQUEST_MS", 1000))  # 이보다 느린 요청은 구간별 로그 (0 이면 끔)
+    trace_export_path: str = os.getenv("TRACE_EXPORT_PATH", "")  # Chrome trace 파일 경로 (비어 있으면 내보내지 않음)
+    trace_export_all: bool = os.getenv("TRACE_EXPORT_ALL", "false").lower() == "true"  # false 면 느린 요청만 내보냄
+    trace_max_spans: int = int(os.getenv("TRACE_MAX_SPANS", 1000))  # 요청당 최대 span 수
+
+    # 응답 압축 (Accept-Encoding 협상: brotli 패키지가 있으면 br, 없으면 gzip)
+    compression_enabled: bool = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    compression_minimum_size: int = int(os.getenv("COMPRESSION_MINIMUM_SIZE", 1024))  # 이보다 작은 응답(바이트)은 압축하지 않음
+    compression_gzip_level: int = int(os.getenv("COMPRESSION_GZIP_LEVEL", 6))  # 1(빠름) ~ 9(작음)
+    compression_brotli_quality: int = int(os.getenv("COMPRESSION_BROTLI_QUALITY", 4))  # 0(빠름) ~ 11(작음)
 
     # PostgreSQL DB URL 생성
     @property
@@ -30,6 +127,16 @@ class Settings(BaseSettings):
             f"{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
         )
 
+    # replica DB URL 생성 (계정/DB 이름은 primary 와 동일)
+    @property
+    def read_replica_url(self):
+        if not self.replica_postgres_host:
+            return None
+        return (
+            f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}@"
+            f"{self.replica_postgres_host}:{self.replica_postgres_port}/{self.postgres_db}"
+        )
+
     # Redis 연결 URL 생성
     @property
     def redis_url(self):
@@ -39,17 +146,12 @@ class Settings(BaseSettings):
 settings = Settings()
 
 
-# Redis 클라이언트 생성 함수
-
-#     Redis 서버와 통신할 클라이언트를 생성.
-#     - host, port, db 정보를 Settings 클래스에서 가져와서 초기화.
-
-def get_redis_client():
-    settings = Settings()
-    return redis.StrictRedis(host=settings.redis_host, port=settings.redis_port, db=settings.redis_db)
-
 # 예제 실행 코드 - 실행 전 redis 서버 실행
 if __name__ == "__main__":
+    import asyncio
+
+    from app.database.redis_client import get_redis_client, close_redis
+
     settings = Settings()  # Settings 클래스 인스턴스 생성.
 
     # PostgreSQL 연결 URL 출력
@@ -58,7 +160,11 @@ if __name__ == "__main__":
     # Redis 연결 URL 출력
     print("Redis URL:", settings.redis_url)  # redis_url 속성 값을 출력.
 
-    # Redis 클라이언트를 생성하고, 키-값 저장 테스트
-    redis_client = get_redis_client()  # Redis 클라이언트 생성.
-    redis_client.set("test_key", "test_value")  # Redis에 "test_key"라는 키로 "test_value" 값을 저장.
-    print("Redis test_key:", redis_client.get("test_key").decode("utf-8"))  # "test_key" 값을 가져와서 디코딩 후 출력.
+    # 공유 Redis 클라이언트로 키-값 저장 테스트
+    async def check_redis():
+        redis_client = get_redis_client()
+        await redis_client.set("test_key", "test_value")  # Redis에 "test_key"라는 키로 "test_value" 값을 저장.
+        print("Redis test_key:", await redis_client.get("test_key"))
+        await close_redis()
+
+    asyncio.run(check_redis())
@@ -1,20 +1,19 @@
-import os
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.models import User
-from app.database.db import get_db
+from app.database.db import get_db, get_read_db, get_engine, AsyncSessionLocal
 import jwt
 from sqlalchemy import select
 
-from app.schemas.oauth import oauth2_scheme
-
-# 시크릿 키 및 알고리즘
-SECRET_KEY = os.getenv("SECRET_KEY", "fallback_secret_key")
-ALGORITHM = "HS256"
+from app.schemas.oauth import oauth2_scheme, oauth2_scheme_optional
+from app.utils.auth_cache import decode_access_token, get_cached_principal, cache_principal
+from app.database.redis_client import get_redis
+from typing import Optional
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),  # 클라이언트에서 제공한 토큰
-    db: AsyncSession = Depends(get_db)   # DB 연결
+    db: AsyncSession = Depends(get_read_db),   # DB 연결 (캐시 미스일 때만 사용, replica 우선)
+    redis_client=Depends(get_redis)
 ) -> User:
 
     # 테스트용 토큰 처리
@@ -24,18 +23,27 @@ async def get_current_user(
         return user  # 테스트 사용자 반환
 
     try:
-        # JWT 디코드 및 유효성 검사
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: int = payload.get("sub")
+        # JWT 디코드 및 유효성 검사 (검증된 토큰은 exp 까지 캐시)
+        payload = decode_access_token(token)
+        user_id: int = payload.get("user_id", payload.get("sub"))
         if user_id is None:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
+        # 캐시된 사용자 정보가 있으면 DB 조회 생략
+        user = await get_cached_principal(user_id, redis_client)
+        if user is not None:
+            return user
+
         # 사용자 조회
         query = await db.execute(select(User).filter(User.id == user_id))
         user = query.scalar_one_or_none()
+        if user is None and db.bind is not get_engine():
+            # 방금 가입해 replica 에 아직 없는 사용자는 primary 에서 다시 조회
+            async with AsyncSessionLocal() as primary:
+                user = (await primary.execute(select(User).filter(User.id == user_id))).scalar_one_or_none()
         if user is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-        return user
+        return await cache_principal(user, redis_client)
 
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired")
@@ -43,3 +51,13 @@ async def get_current_user(
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
+
+async def get_optional_current_user(
+    token: Optional[str] = Depends(oauth2_scheme_optional),
+    db: AsyncSession = Depends(get_read_db),
+    redis_client=Depends(get_redis)
+) -> Optional[User]:
+    """로그인한 경우에만 사용자 반환 (비로그인 요청은 None)"""
+    if not token:
+        return None
+    return await get_current_user(token=token, db=db, redis_client=redis_client)
@@ -1,22 +1,32 @@
-from fastapi import FastAPI
-from app.routers.auth import router as auth_router
-from app.routers.word_search import router as word_search_router
-from app.routers.search_bar import router as search_router
-from app.routers.bookmark import router as bookmark_router
-from fastapi.middleware.cors import CORSMiddleware
-
-app = FastAPI()
-
-# CORS 설정
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://127.0.0.1:5500"],  # 허용할 프론트엔드 URL
-    allow_credentials=True,
-    allow_methods=["*"],                     # 허용할 HTTP 메서드
-    allow_headers=["*"],                     # 허용할 HTTP 헤더
-)
-
-app.include_router(auth_router)
-app.include_router(word_search_router)
-app.include_router(search_router)
-app.include_router(bookmark_router)
\ No newline at end of file
+"""
+ASGI 엔트리포인트 (uvicorn main:app)
+
+import 만으로는 라우터 / 미들웨어 / 설정을 불러오지 않고, main.app 에 처음 접근할 때 create_app() 으로 만듭니다.
+"""
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+_app = None
+
+
+def create_app() -> "FastAPI":
+    """새 앱 생성 (테스트 등에서 별도 인스턴스가 필요할 때)"""
+    from app.application import create_app as build_app
+    return build_app()
+
+
+def get_app() -> "FastAPI":
+    """프로세스에서 공유하는 앱 (처음 호출할 때 생성)"""
+    global _app
+    if _app is None:
+        _app = create_app()
+    return _app
+
+
+def __getattr__(name):
+    # PEP 562: `from main import app`, uvicorn "main:app" 모두 첫 접근 시 생성
+    if name == "app":
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,12 @@
 import asyncio
 from logging.config import fileConfig
-from config.settings import Settings
-from sqlalchemy import pool, create_engine
+from sqlalchemy import pool
 from sqlalchemy.engine import Connection
-from sqlalchemy.ext.asyncio import async_engine_from_config, create_async_engine
-from database.db import Base # db.py에서 Base 가져오기
+from app.models.models import Base  # 모델 Base 가져오기
 import warnings
 
 from alembic import context
-from app.database.db import SQLALCHEMY_DATABASE_URL
+from app.database.db import SQLALCHEMY_DATABASE_URL, create_engine
 
 
 config = context.config
@@ -21,9 +19,7 @@ config = context.config # Alembic Config 객체
 fileConfig(config.config_file_name)
 
 # 데이터베이스 URL 설정
-# .env 파일에서 가져온 PostgreSQL 연결 URL을 사용합니다.
-settings = Settings()
-SQLALCHEMY_DATABASE_URL = settings.database_url  # settings에서 불러오는 PostgreSQL 연결 URL
+# .env 파일에서 가져온 PostgreSQL 연결 URL을 사용합니다. (app/database/db.py 와 동일한 Settings)
 target_metadata = Base.metadata
 
 config.set_main_option("sqlalchemy.url", SQLALCHEMY_DATABASE_URL)
@@ -69,31 +65,18 @@ def do_run_migrations(connection: Connection) -> None:
         context.run_migrations()
 
 
-connectable = create_async_engine(SQLALCHEMY_DATABASE_URL, future=True)
-
-
-# engine 생성
+# engine 생성 (앱과 같은 엔진 팩토리, 마이그레이션은 한 번만 연결하므로 풀 없이)
 async def run_migrations_online():
 
-    connectable = create_async_engine(SQLALCHEMY_DATABASE_URL, future=True)
+    connectable = create_engine(poolclass=pool.NullPool)
 
     async with connectable.connect() as connection:
-        await connection.run_sync(
-            lambda sync_connection: context.configure(
-                connection=sync_connection,
-                target_metadata=target_metadata,
-                render_as_batch=True, # 필요 시 활성화
-            )
-        )
-
-        async with connection.begin():
-            context.run_migrations()
+        await connection.run_sync(do_run_migrations)
+    await connectable.dispose()
 
 
 # Alembic 실행 모드에 맞는 함수 호출
 if context.is_offline_mode():
     run_migrations_offline()
 else:
-    run_migrations_online()
-
-    print("ok")
\ No newline at end of file
+    asyncio.run(run_migrations_online())
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""Add access pattern indexes
+
+주의: bookmark_words 에 같은 사용자의 같은 단어가 여러 행 있으면 유니크 제약을 만들기 전에
+물리적으로 가장 앞선 행(ctid 최소) 하나만 남기고 나머지를 삭제합니다. 삭제된 행의 뜻 / 예문 /
+복습 기록은 복구되지 않으며 downgrade 로도 되돌릴 수 없으므로, 필요하면 업그레이드 전에 백업하세요.
+
+Revision ID: 03c9f95f25a7
+Revises: 19f7ba802b08
+Create Date: 2026-10-19 13:41:05.662417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '03c9f95f25a7'
+down_revision: Union[str, None] = '19f7ba802b08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 사용자별 최신순 검색 기록 조회
+    op.create_index('search_history_user_id_created_at_idx', 'search_history', ['user_id', 'created_at'])
+
+    # 사용자별 단어 중복 제거 후 (user_id, word) 유니크 인덱스 생성 (중복 행은 하나만 남기고 삭제 - 되돌릴 수 없음)
+    op.execute(
+        """
+        DELETE FROM bookmark_words a
+        USING bookmark_words b
+        WHERE a.user_id = b.user_id AND a.word = b.word AND a.ctid > b.ctid
+        """
+    )
+    op.create_unique_constraint('bookmark_words_user_id_word_key', 'bookmark_words', ['user_id', 'word'])
+
+    # word_bookmarks.word 전역 유니크 -> 사용자 단위 유니크
+    op.drop_constraint('word_bookmarks_word_key', 'word_bookmarks', type_='unique')
+    op.create_unique_constraint('word_bookmarks_user_id_word_key', 'word_bookmarks', ['user_id', 'word'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('word_bookmarks_user_id_word_key', 'word_bookmarks', type_='unique')
+    op.create_unique_constraint('word_bookmarks_word_key', 'word_bookmarks', ['word'])
+    op.drop_constraint('bookmark_words_user_id_word_key', 'bookmark_words', type_='unique')
+    op.drop_index('search_history_user_id_created_at_idx', table_name='search_history')
@@ -0,0 +1,54 @@
+"""Add full-text and trigram search indexes to bookmark_words
+
+Revision ID: 19f7ba802b08
+Revises: f42d03f9ec29
+Create Date: 2026-10-19 11:03:27.118940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '19f7ba802b08'
+down_revision: Union[str, None] = 'f42d03f9ec29'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # word/definition/example 로 만든 tsvector 생성 컬럼
+    op.add_column(
+        'bookmark_words',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('english', coalesce(word, '') || ' ' || coalesce(definition, '') || ' ' || coalesce(example, ''))",
+                persisted=True,
+            ),
+        ),
+    )
+    op.create_index('bookmark_words_search_vector_idx', 'bookmark_words', ['search_vector'], postgresql_using='gin')
+
+    # 부분 문자열 / 오타 검색용 trigram 인덱스
+    op.create_index(
+        'bookmark_words_word_trgm_idx', 'bookmark_words', ['word'],
+        postgresql_using='gin', postgresql_ops={'word': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'bookmark_words_definition_trgm_idx', 'bookmark_words', ['definition'],
+        postgresql_using='gin', postgresql_ops={'definition': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('bookmark_words_definition_trgm_idx', table_name='bookmark_words')
+    op.drop_index('bookmark_words_word_trgm_idx', table_name='bookmark_words')
+    op.drop_index('bookmark_words_search_vector_idx', table_name='bookmark_words')
+    op.drop_column('bookmark_words', 'search_vector')
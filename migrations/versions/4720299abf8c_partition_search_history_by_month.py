@@ -0,0 +1,101 @@
+"""Partition search_history by month
+
+Revision ID: 4720299abf8c
+Revises: c5172d0d586c
+Create Date: 2026-10-19 16:48:13.904371
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4720299abf8c'
+down_revision: Union[str, None] = 'c5172d0d586c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 테이블을 옆으로 옮기고 (id 시퀀스는 새 테이블에서 재사용)
+    op.execute("ALTER TABLE search_history RENAME TO search_history_legacy")
+    op.execute("ALTER TABLE search_history_legacy RENAME CONSTRAINT search_history_pkey TO search_history_legacy_pkey")
+    op.execute("ALTER INDEX IF EXISTS ix_search_history_id RENAME TO ix_search_history_legacy_id")
+    op.execute(
+        "ALTER INDEX IF EXISTS search_history_user_id_created_at_idx "
+        "RENAME TO search_history_legacy_user_id_created_at_idx"
+    )
+    op.execute("ALTER SEQUENCE search_history_id_seq OWNED BY NONE")
+
+    # created_at 기준 RANGE 파티션 테이블 (파티션 키가 PK 에 포함되어야 함)
+    op.execute(
+        """
+        CREATE TABLE search_history (
+            id INTEGER NOT NULL DEFAULT nextval('search_history_id_seq'),
+            user_id INTEGER NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+            word VARCHAR NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            CONSTRAINT search_history_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.execute("ALTER SEQUENCE search_history_id_seq OWNED BY search_history.id")
+    op.create_index('search_history_user_id_created_at_idx', 'search_history', ['user_id', 'created_at'])
+
+    # 기존 데이터의 가장 오래된 달부터 2개월 뒤까지 월 파티션 생성 (이후는 partitions.py 가 관리)
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            m DATE;
+        BEGIN
+            FOR m IN
+                SELECT generate_series(
+                    date_trunc('month', COALESCE((SELECT min(created_at) FROM search_history_legacy), now())),
+                    date_trunc('month', now() + interval '2 months'),
+                    interval '1 month'
+                )::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF search_history FOR VALUES FROM (%L) TO (%L)',
+                    'search_history_y' || to_char(m, 'YYYY') || 'm' || to_char(m, 'MM'),
+                    m,
+                    (m + interval '1 month')::date
+                );
+            END LOOP;
+        END $$;
+        """
+    )
+
+    op.execute(
+        "INSERT INTO search_history (id, user_id, word, created_at) "
+        "SELECT id, user_id, word, created_at FROM search_history_legacy"
+    )
+    op.execute("DROP TABLE search_history_legacy")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE search_history RENAME TO search_history_partitioned")
+    op.execute("ALTER TABLE search_history_partitioned RENAME CONSTRAINT search_history_pkey TO search_history_partitioned_pkey")
+    op.execute("ALTER INDEX search_history_user_id_created_at_idx RENAME TO search_history_partitioned_user_id_created_at_idx")
+    op.execute("ALTER SEQUENCE search_history_id_seq OWNED BY NONE")
+    op.execute(
+        """
+        CREATE TABLE search_history (
+            id INTEGER NOT NULL DEFAULT nextval('search_history_id_seq'),
+            user_id INTEGER NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+            word VARCHAR NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            CONSTRAINT search_history_pkey PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute("ALTER SEQUENCE search_history_id_seq OWNED BY search_history.id")
+    op.create_index('search_history_user_id_created_at_idx', 'search_history', ['user_id', 'created_at'])
+    op.execute(
+        "INSERT INTO search_history (id, user_id, word, created_at) "
+        "SELECT id, user_id, word, created_at FROM search_history_partitioned"
+    )
+    op.execute("DROP TABLE search_history_partitioned CASCADE")
@@ -0,0 +1,52 @@
+"""Add DEFAULT partition to search_history
+
+Revision ID: b8e4d1a93c27
+Revises: ef20e0a3ab3e
+Create Date: 2026-10-19 21:12:40.518306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e4d1a93c27'
+down_revision: Union[str, None] = 'ef20e0a3ab3e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 월 파티션이 아직 없는 시각의 행도 INSERT 되도록 (partitions.py 가 다음 관리 때 월 파티션으로 옮김)
+    op.execute("CREATE TABLE IF NOT EXISTS search_history_default PARTITION OF search_history DEFAULT")
+
+
+def downgrade() -> None:
+    # DEFAULT 파티션에 남은 행은 해당 월 파티션을 만들어 옮긴 뒤 삭제
+    op.execute("ALTER TABLE search_history DETACH PARTITION search_history_default")
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            m DATE;
+        BEGIN
+            FOR m IN
+                SELECT DISTINCT date_trunc('month', created_at)::date FROM search_history_default
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF search_history FOR VALUES FROM (%L) TO (%L)',
+                    'search_history_y' || to_char(m, 'YYYY') || 'm' || to_char(m, 'MM'),
+                    m,
+                    (m + interval '1 month')::date
+                );
+            END LOOP;
+        END $$;
+        """
+    )
+    op.execute(
+        "INSERT INTO search_history (id, user_id, word, created_at) "
+        "SELECT id, user_id, word, created_at FROM search_history_default"
+    )
+    op.execute("DROP TABLE search_history_default")
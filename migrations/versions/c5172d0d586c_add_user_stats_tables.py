@@ -0,0 +1,64 @@
+"""Add user_stats and user_daily_search_stats tables
+
+Revision ID: c5172d0d586c
+Revises: 03c9f95f25a7
+Create Date: 2026-10-19 15:20:52.307188
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5172d0d586c'
+down_revision: Union[str, None] = '03c9f95f25a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_stats',
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('total_bookmarks', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('vocabulary_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('grammar_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('reading_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('writing_count', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.create_table(
+        'user_daily_search_stats',
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('day', sa.Date(), primary_key=True),
+        sa.Column('search_count', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+    # 기존 데이터로 통계 초기값 채우기 (이후에는 쓰기 시점에 증감)
+    op.execute(
+        """
+        INSERT INTO user_stats (user_id, total_bookmarks, vocabulary_count, grammar_count, reading_count, writing_count)
+        SELECT user_id,
+               COUNT(*),
+               COUNT(*) FILTER (WHERE study_category = 'VOCABULARY'),
+               COUNT(*) FILTER (WHERE study_category = 'GRAMMAR'),
+               COUNT(*) FILTER (WHERE study_category = 'READING'),
+               COUNT(*) FILTER (WHERE study_category = 'WRITING')
+        FROM bookmark_words
+        GROUP BY user_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO user_daily_search_stats (user_id, day, search_count)
+        SELECT user_id, created_at::date, COUNT(*)
+        FROM search_history
+        GROUP BY user_id, created_at::date
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('user_daily_search_stats')
+    op.drop_table('user_stats')
@@ -0,0 +1,50 @@
+"""Add search_history_summary for deduplicated history
+
+Revision ID: ef20e0a3ab3e
+Revises: 4720299abf8c
+Create Date: 2026-10-19 18:05:36.771029
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ef20e0a3ab3e'
+down_revision: Union[str, None] = '4720299abf8c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'search_history_summary',
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('word', sa.String(), primary_key=True),
+        sa.Column('search_count', sa.Integer(), nullable=False, server_default='1'),
+        sa.Column('last_searched_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index(
+        'search_history_summary_user_id_last_searched_at_idx', 'search_history_summary', ['user_id', 'last_searched_at']
+    )
+    op.create_index(
+        'search_history_summary_user_id_search_count_idx', 'search_history_summary', ['user_id', 'search_count']
+    )
+
+    # 기존 검색 기록을 (user_id, word) 단위로 압축
+    op.execute(
+        """
+        INSERT INTO search_history_summary (user_id, word, search_count, last_searched_at)
+        SELECT user_id, word, COUNT(*), MAX(created_at)
+        FROM search_history
+        GROUP BY user_id, word
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('search_history_summary_user_id_search_count_idx', table_name='search_history_summary')
+    op.drop_index('search_history_summary_user_id_last_searched_at_idx', table_name='search_history_summary')
+    op.drop_table('search_history_summary')
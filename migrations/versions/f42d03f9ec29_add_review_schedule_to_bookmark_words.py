@@ -0,0 +1,35 @@
+"""Add review schedule to bookmark_words
+
+Revision ID: f42d03f9ec29
+Revises: 67ad0acb322d
+Create Date: 2026-10-19 10:12:41.503112
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f42d03f9ec29'
+down_revision: Union[str, None] = '67ad0acb322d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SM-2 복습 스케줄 컬럼 (기존 단어는 즉시 복습 대상)
+    op.add_column('bookmark_words', sa.Column('ease_factor', sa.Float(), nullable=False, server_default='2.5'))
+    op.add_column('bookmark_words', sa.Column('interval_days', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('bookmark_words', sa.Column('repetitions', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('bookmark_words', sa.Column('next_review_at', sa.DateTime(), nullable=False, server_default=sa.func.now()))
+    op.add_column('bookmark_words', sa.Column('last_reviewed_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('bookmark_words', 'last_reviewed_at')
+    op.drop_column('bookmark_words', 'next_review_at')
+    op.drop_column('bookmark_words', 'repetitions')
+    op.drop_column('bookmark_words', 'interval_days')
+    op.drop_column('bookmark_words', 'ease_factor')
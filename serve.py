@@ -0,0 +1,243 @@
+"""
+운영 서버 실행 (pre-fork 멀티 워커)
+
+    python serve.py                      # 워커 수 = 사용 가능한 CPU 수 (cgroup 제한 반영)
+    WEB_CONCURRENCY=4 python serve.py
+
+- 마스터에서 앱과 읽기 전용 데이터(자동완성 인덱스 등)를 먼저 불러온 뒤 gc.freeze() 후 fork 하므로
+  워커들은 해당 메모리 페이지를 copy-on-write 로 공유합니다. (uvicorn --workers 는 spawn 방식이라 워커마다 다시 import)
+- DB / Redis 커넥션 풀은 lifespan 에서 워커마다 따로 만듭니다. (fork 전에는 연결을 만들지 않음)
+- 이벤트 루프는 uvloop, HTTP 파서는 httptools 를 사용합니다. (설치되어 있지 않으면 기본 구현)
+- SIGTERM / SIGINT: 새 연결을 받지 않고 처리 중인 요청을 GRACEFUL_TIMEOUT 초까지 기다린 뒤 종료합니다.
+- 프로세스별 상태는 워커끼리 공유되도록 설정합니다.
+  /metrics: 워커마다 지표 스냅샷을 공유 디렉토리에 쓰고 응답하는 워커가 합산 (종료된 워커의 누적값은 마스터가 보관)
+  /admin/profiles: 프로파일 결과를 공유 디렉토리에 저장
+  search_history 파티션 관리: 0번 워커에서만 실행 (죽으면 같은 번호로 다시 띄움)
+"""
+import gc
+import importlib.util
+import logging
+import math
+import os
+import shutil
+import signal
+import tempfile
+import time
+from typing import Dict, Optional, Tuple
+
+import uvicorn
+
+from app.services.suggestion_service import load_suggestion_index
+from app.utils.metrics import archive_snapshot
+from config.settings import settings
+
+logger = logging.getLogger("serve")
+
+CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+CGROUP_V1_CPU_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+CGROUP_V1_CPU_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+# 시작 직후 죽는 워커를 계속 다시 띄우지 않도록 재시작 간격(초)
+RESPAWN_BACKOFF = 1.0
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def cgroup_cpu_limit(
+    cpu_max: str = CGROUP_V2_CPU_MAX, quota_path: str = CGROUP_V1_CPU_QUOTA, period_path: str = CGROUP_V1_CPU_PERIOD
+) -> Optional[float]:
+    """컨테이너 CPU 제한 (코어 수, 제한이 없으면 None)"""
+    content = _read(cpu_max)  # cgroup v2: "<quota> <period>" 또는 "max <period>"
+    if content:
+        quota, _, period = content.partition(" ")
+        if quota != "max":
+            try:
+                return int(quota) / int(period or 100000)
+            except ValueError:
+                return None
+        return None
+    quota, period = _read(quota_path), _read(period_path)  # cgroup v1: 제한이 없으면 quota = -1
+    try:
+        if quota and period and int(quota) > 0:
+            return int(quota) / int(period)
+    except ValueError:
+        pass
+    return None
+
+
+def available_cpus() -> float:
+    """이 프로세스가 쓸 수 있는 CPU 수 (affinity 와 cgroup 제한 중 작은 값)"""
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+    limit = cgroup_cpu_limit()
+    return min(cpus, limit) if limit else cpus
+
+
+def worker_count(configured: int = 0) -> int:
+    """비동기 워커는 CPU 하나씩 (WEB_CONCURRENCY 가 있으면 그 값)"""
+    if configured > 0:
+        return configured
+    return max(1, math.ceil(available_cpus()))
+
+
+def preload():
+    """fork 전에 읽기 전용 데이터 생성 (워커 간 공유)"""
+    index = load_suggestion_index()
+    logger.info("suggestion index loaded: %d words", len(index))
+
+
+def prepare_shared_dirs() -> Optional[str]:
+    """
+    워커 공유 디렉토리 설정 (fork 전, 앱 import 전에 호출)
+    METRICS_MULTIPROCESS_DIR / PROFILING_STORE_DIR 이 없으면 임시 디렉토리를 만들어 지정하고 그 경로를 반환 (종료 시 삭제)
+    """
+    created = None
+    if not settings.metrics_multiprocess_dir or not settings.profiling_store_dir:
+        created = tempfile.mkdtemp(prefix="voca-serve-")
+    if not settings.metrics_multiprocess_dir:
+        settings.metrics_multiprocess_dir = os.path.join(created, "metrics")
+    if not settings.profiling_store_dir:
+        settings.profiling_store_dir = os.path.join(created, "profiles")
+    os.makedirs(settings.metrics_multiprocess_dir, exist_ok=True)
+    # 이전 실행에서 남은 워커 스냅샷 삭제 (지정한 디렉토리를 다시 쓰는 경우)
+    for filename in os.listdir(settings.metrics_multiprocess_dir):
+        os.remove(os.path.join(settings.metrics_multiprocess_dir, filename))
+    return created
+
+
+def build_config() -> uvicorn.Config:
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    if loop != "uvloop" or http != "httptools":
+        logger.warning("uvloop/httptools not installed, falling back to %s/%s", loop, http)
+    return uvicorn.Config(
+        "main:app",
+        host=settings.server_host,
+        port=settings.server_port,
+        loop=loop,
+        http=http,
+        lifespan="on",
+        access_log=settings.server_access_log,
+        timeout_keep_alive=settings.server_keep_alive,
+        timeout_graceful_shutdown=settings.graceful_timeout,
+    )
+
+
+class Supervisor:
+    """
+    소켓을 한 번 열고 워커를 fork 한 뒤, 죽은 워커는 다시 띄우고 종료 신호가 오면 워커를 정리하는 마스터
+    """
+
+    def __init__(self, config: uvicorn.Config, workers: int, graceful_timeout: float):
+        self.config = config
+        self.workers = workers
+        self.graceful_timeout = graceful_timeout
+        self.children: Dict[int, Tuple[int, float]] = {}  # pid -> (워커 번호, 시작 시각)
+        self.stopping = False
+        self.socket = None
+        self.temp_dir = None
+
+    def run(self):
+        # 공유 디렉토리는 앱 import 전에 (프로파일 저장소가 import 시점 설정으로 만들어짐)
+        self.temp_dir = prepare_shared_dirs()
+        # 앱 import / 미들웨어 구성까지 마스터에서 (워커는 fork 후 그대로 사용)
+        self.config.load()
+        self.socket = self.config.bind_socket()
+        preload()
+        # 지금까지 만든 객체는 GC 대상에서 빼서, 워커의 GC 가 공유 페이지를 건드려 복사되지 않도록 함
+        gc.collect()
+        gc.freeze()
+
+        signal.signal(signal.SIGTERM, self.handle_stop)
+        signal.signal(signal.SIGINT, self.handle_stop)
+        logger.info("starting %d workers on %s:%s", self.workers, self.config.host, self.config.port)
+        for slot in range(self.workers):
+            self.spawn(slot)
+
+        while not self.stopping:
+            self.reap(respawn=True)
+            time.sleep(0.2)
+        self.shutdown()
+
+    def handle_stop(self, signum, frame):
+        self.stopping = True
+
+    def spawn(self, slot: int):
+        pid = os.fork()
+        if pid == 0:
+            # 워커: 마스터의 신호 처리기를 되돌리고 uvicorn 이 직접 SIGTERM/SIGINT 를 처리 (graceful shutdown)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            # 주기 작업은 0번 워커에서만 (lifespan 에서 이 설정을 확인)
+            settings.partition_maintenance_enabled = settings.partition_maintenance_enabled and slot == 0
+            code = 0
+            try:
+                uvicorn.Server(self.config).run(sockets=[self.socket])
+            except BaseException:
+                logger.exception("worker %d crashed", os.getpid())
+                code = 1
+            finally:
+                os._exit(code)
+        self.children[pid] = (slot, time.monotonic())
+
+    def reap(self, respawn: bool):
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self.children.clear()
+                return
+            if pid == 0:
+                return
+            child = self.children.pop(pid, None)
+            if child is None:
+                continue
+            slot, started = child
+            logger.warning("worker %d exited with status %d", pid, os.waitstatus_to_exitcode(status))
+            # 종료된 워커의 counter / histogram 누적값 보관 (합계가 줄어들지 않도록)
+            archive_snapshot(settings.metrics_multiprocess_dir, pid)
+            if respawn and not self.stopping:
+                if time.monotonic() - started < RESPAWN_BACKOFF:
+                    time.sleep(RESPAWN_BACKOFF)
+                self.spawn(slot)
+
+    def shutdown(self):
+        """워커에 SIGTERM → graceful_timeout(+여유) 동안 종료 대기 → 남은 워커 SIGKILL"""
+        logger.info("stopping %d workers", len(self.children))
+        for pid in list(self.children):
+            self._signal(pid, signal.SIGTERM)
+        deadline = time.monotonic() + self.graceful_timeout + 5
+        while self.children and time.monotonic() < deadline:
+            self.reap(respawn=False)
+            time.sleep(0.1)
+        for pid in list(self.children):
+            logger.warning("worker %d did not stop in time, killing", pid)
+            self._signal(pid, signal.SIGKILL)
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        self.children.clear()
+        self.socket.close()
+        if self.temp_dir:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _signal(self, pid: int, signum: int):
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            self.children.pop(pid, None)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    Supervisor(build_config(), worker_count(settings.web_concurrency), settings.graceful_timeout).run()
+
+
+if __name__ == "__main__":
+    main()